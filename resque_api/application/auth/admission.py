@@ -0,0 +1,173 @@
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+
+from resque_api.application.auth.authenticate import authenticate_user
+from resque_api.application.auth.exceptions import (
+    AuthenticationOverloadedError,
+    AuthenticationRateLimitedError,
+)
+from resque_api.application.ports.rate_limit import TokenBucketPolicy, TokenBucketStore
+from resque_api.application.ports.security import PasswordHasher
+from resque_api.domain.user.entities import User
+
+
+@dataclass(frozen=True)
+class AdmissionStats:
+    """인증 승인 제어 통계"""
+
+    in_flight: int
+    waiting: int
+    admitted: int
+    rate_limited: int
+    overloaded: int
+
+
+class AuthAdmissionController:
+    """인증 요청 승인 제어
+
+    해시 검증 전에 계정/이메일별 토큰 버킷으로 시도 횟수를 제한하고,
+    전역 동시 실행 한도로 진행 중인 해시 검증 수를 제한한다.
+    한도와 대기열이 모두 찼다면 기다리지 않고 즉시 AuthenticationOverloadedError 를 발생시킨다.
+    """
+
+    def __init__(
+        self,
+        store: TokenBucketStore,
+        max_concurrent: int,
+        max_waiting: int = 0,
+        wait_timeout: float | None = 1.0,
+        per_account: TokenBucketPolicy | None = None,
+        per_email: TokenBucketPolicy | None = None,
+    ):
+        """
+        Args:
+            store: 토큰 버킷 상태 저장소
+            max_concurrent: 동시에 진행할 수 있는 해시 검증 수
+            max_waiting: 실행 슬롯을 기다릴 수 있는 요청 수
+            wait_timeout: 슬롯 대기 최대 시간 (초, None 이면 무제한)
+            per_account: 계정별 토큰 버킷 정책 (None 이면 제한 없음)
+            per_email: 이메일별 토큰 버킷 정책 (None 이면 제한 없음)
+        """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        if max_waiting < 0:
+            raise ValueError("max_waiting cannot be negative")
+
+        self.store = store
+        self.max_concurrent = max_concurrent
+        self.max_waiting = max_waiting
+        self.wait_timeout = wait_timeout
+        self.per_account = per_account
+        self.per_email = per_email
+
+        self._slot_freed = threading.Condition()
+        self._in_flight = 0
+        self._waiting = 0
+        self._admitted = 0
+        self._rate_limited = 0
+        self._overloaded = 0
+
+    def authenticate(
+        self,
+        email: str,
+        user: User | None,
+        plain_password: str,
+        password_hasher: PasswordHasher,
+    ) -> bool:
+        """승인 제어를 거쳐 사용자 인증
+
+        존재하지 않는 사용자에 대한 시도도 이메일 버킷을 소비하도록 이메일을 별도로 받는다.
+
+        Args:
+            email: 로그인 시도에 사용된 이메일
+            user: 이메일로 조회한 사용자 (없으면 None)
+            plain_password: 평문 비밀번호
+            password_hasher: 비밀번호 해시 처리기
+
+        Raises:
+            AuthenticationRateLimitedError: 계정/이메일별 시도 한도 초과
+            AuthenticationOverloadedError: 동시 실행 한도와 대기열 초과
+        """
+        self.check_rate_limits(email=email, account_id=str(user.id) if user else None)
+        return authenticate_user(user, plain_password, _AdmittedPasswordHasher(password_hasher, self))
+
+    def check_rate_limits(self, email: str | None = None, account_id: str | None = None) -> None:
+        """계정/이메일별 토큰 버킷 확인"""
+        limits = (
+            (self.per_email, f"email:{email.lower()}" if email else None),
+            (self.per_account, f"account:{account_id}" if account_id else None),
+        )
+        for policy, key in limits:
+            if policy is None or key is None:
+                continue
+            decision = self.store.consume(key, policy)
+            if not decision.allowed:
+                with self._slot_freed:
+                    self._rate_limited += 1
+                raise AuthenticationRateLimitedError(key, decision.retry_after)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """해시 검증 실행 슬롯 확보"""
+        self._acquire()
+        try:
+            yield
+        finally:
+            with self._slot_freed:
+                self._in_flight -= 1
+                self._slot_freed.notify()
+
+    def stats(self) -> AdmissionStats:
+        """현재 승인 제어 통계"""
+        with self._slot_freed:
+            return AdmissionStats(
+                in_flight=self._in_flight,
+                waiting=self._waiting,
+                admitted=self._admitted,
+                rate_limited=self._rate_limited,
+                overloaded=self._overloaded,
+            )
+
+    def _acquire(self) -> None:
+        with self._slot_freed:
+            if self._in_flight >= self.max_concurrent:
+                if self._waiting >= self.max_waiting:
+                    self._reject()
+
+                self._waiting += 1
+                try:
+                    acquired = self._slot_freed.wait_for(
+                        lambda: self._in_flight < self.max_concurrent, timeout=self.wait_timeout
+                    )
+                finally:
+                    self._waiting -= 1
+                if not acquired:
+                    self._reject()
+
+            self._in_flight += 1
+            self._admitted += 1
+
+    def _reject(self) -> None:
+        self._overloaded += 1
+        raise AuthenticationOverloadedError(self._in_flight, self._waiting)
+
+
+class _AdmittedPasswordHasher(PasswordHasher):
+    """검증 시 실행 슬롯을 확보하는 해시 처리기 래퍼"""
+
+    def __init__(self, hasher: PasswordHasher, controller: AuthAdmissionController):
+        self.hasher = hasher
+        self.controller = controller
+
+    def hash(self, plain_password: str) -> str:
+        with self.controller.slot():
+            return self.hasher.hash(plain_password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        with self.controller.slot():
+            return self.hasher.verify(plain_password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return self.hasher.needs_rehash(hashed_password)
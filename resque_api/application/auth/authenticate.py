@@ -1,7 +1,22 @@
-from resque_api.application.ports.security import PasswordHasher
+from dataclasses import dataclass
+
+from resque_api.application.ports.security import AsyncPasswordHasher, PasswordHasher
 from resque_api.domain.user.entities import User
 
 
+@dataclass(frozen=True)
+class AuthenticationResult:
+    """재해시 정보를 포함한 인증 결과
+
+    Attributes:
+        authenticated: 인증 성공 여부
+        rehashed_password: 현재 해시 설정으로 다시 계산한 해시 (재해시가 필요 없으면 None)
+    """
+
+    authenticated: bool
+    rehashed_password: str | None = None
+
+
 def authenticate_user(
     user: User, plain_password: str, password_hasher: PasswordHasher
 ) -> bool:
@@ -12,10 +27,58 @@ def authenticate_user(
         plain_password: 평문 비밀번호
         password_hasher: 비밀번호 해시 처리기
     """
-    if not user or not plain_password:
+    if not _can_verify(user, plain_password):
         return False
 
-    if not user.can_authenticate():
+    return password_hasher.verify(plain_password, user.password.value)
+
+
+def authenticate_user_with_rehash(
+    user: User, plain_password: str, password_hasher: PasswordHasher
+) -> AuthenticationResult:
+    """사용자 인증 후 필요하면 비밀번호를 현재 설정으로 재해시
+
+    평문 비밀번호를 알 수 있는 로그인 시점에 재해시하므로, 일괄 마이그레이션 없이
+    저장된 해시가 점차 현재 비용 설정으로 수렴한다. 호출자는 rehashed_password 가
+    있으면 사용자 비밀번호를 갱신해 저장해야 한다.
+
+    Args:
+        user: 인증할 사용자
+        plain_password: 평문 비밀번호
+        password_hasher: 비밀번호 해시 처리기
+    """
+    if not authenticate_user(user, plain_password, password_hasher):
+        return AuthenticationResult(authenticated=False)
+
+    if not password_hasher.needs_rehash(user.password.value):
+        return AuthenticationResult(authenticated=True)
+
+    return AuthenticationResult(
+        authenticated=True, rehashed_password=password_hasher.hash(plain_password)
+    )
+
+
+async def authenticate_user_async(
+    user: User, plain_password: str, password_hasher: AsyncPasswordHasher
+) -> bool:
+    """사용자 비동기 인증
+
+    해시 검증을 기다리는 동안 이벤트 루프가 다른 요청을 처리할 수 있다.
+
+    Args:
+        user: 인증할 사용자
+        plain_password: 평문 비밀번호
+        password_hasher: 비동기 비밀번호 해시 처리기
+    """
+    if not _can_verify(user, plain_password):
         return False
 
-    return password_hasher.verify(plain_password, user.password.value)
+    return await password_hasher.verify_async(plain_password, user.password.value)
+
+
+def _can_verify(user: User, plain_password: str) -> bool:
+    """해시 검증 전 사전 조건 확인"""
+    if not user or not plain_password:
+        return False
+
+    return user.can_authenticate()
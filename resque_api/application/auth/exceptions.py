@@ -0,0 +1,16 @@
+class AuthenticationRateLimitedError(Exception):
+    """계정 또는 이메일별 인증 시도 한도를 초과했을 때 발생하는 예외"""
+
+    def __init__(self, key: str, retry_after: float):
+        self.key = key
+        self.retry_after = retry_after
+        super().__init__(f"인증 시도 한도를 초과했습니다. 키: {key}, {retry_after:.1f}초 후 재시도")
+
+
+class AuthenticationOverloadedError(Exception):
+    """진행 중인 인증 작업이 한도를 넘어 새 요청을 받을 수 없을 때 발생하는 예외"""
+
+    def __init__(self, in_flight: int, waiting: int):
+        self.in_flight = in_flight
+        self.waiting = waiting
+        super().__init__(f"인증 처리 대기열이 가득 찼습니다. 진행 중: {in_flight}, 대기 중: {waiting}")
@@ -0,0 +1,153 @@
+import asyncio
+import inspect
+from typing import Any, Callable, Iterable
+
+from resque_api.application.message.bus.batch import BatchFailurePolicy, BatchResult
+from resque_api.application.message.bus.event_queue import BoundedEventQueue
+from resque_api.application.message.bus.exceptions import HandlerTimeoutError, MiddlewareNotSupportedError
+from resque_api.application.message.bus.middleware import Middleware
+from resque_api.application.message.bus.message_bus import MessageBus
+from resque_api.application.message.command.base.command import Command
+from resque_api.application.message.common.message import Message
+from resque_api.application.message.event.base.event import Event
+from resque_api.application.ports.uow import UnitOfWork
+
+
+class AsyncMessageBus(MessageBus):
+    """asyncio 기반 메시지 버스
+
+    핸들러 등록 규칙은 MessageBus 와 같으며, ``async def handle`` 핸들러와 일반 핸들러를 모두 지원한다.
+    핸들러 호출마다 버스가 UnitOfWork 트랜잭션을 열고 닫으며(핸들러의 with 블록은 여기에 합류),
+    핸들러별 실행 시간은 handler_timeout 으로 제한된다.
+
+    미들웨어는 동기 호출 체인이라 코루틴 핸들러를 감쌀 수 없으므로, 메트릭/멱등성 미들웨어가 조용히 무시되지 않도록
+    add_middleware 는 MiddlewareNotSupportedError 를 발생시킨다.
+
+    UnitOfWork 는 with 블록 깊이를 공유하므로 동시에 실행되는 핸들러가 같은 인스턴스를 쓰면
+    실패한 핸들러의 변경이 다른 핸들러의 커밋에 섞인다. 따라서 uow_factory 를 지정한 경우에만
+    한 처리 사이클의 이벤트 핸들러들을 핸들러마다 새 UnitOfWork 로 동시에 실행하고,
+    지정하지 않으면 uow 하나로 차례대로 실행한다.
+    max_concurrency 는 버스 전체의 제한이므로 겹쳐 실행되는 publish 들의 핸들러를 합쳐 적용된다.
+    """
+
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        max_concurrency: int = 10,
+        handler_timeout: float | None = None,
+        event_queue: BoundedEventQueue | None = None,
+        uow_factory: Callable[[], UnitOfWork] | None = None,
+    ):
+        super().__init__(uow, event_queue=event_queue)
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.max_concurrency = max_concurrency
+        self.handler_timeout = handler_timeout
+        self.uow_factory = uow_factory
+        self._semaphore: asyncio.Semaphore | None = None
+        self._semaphore_loop: asyncio.AbstractEventLoop | None = None
+
+    def add_middleware(self, middleware: Middleware) -> None:
+        raise MiddlewareNotSupportedError(type(self).__name__)
+
+    async def publish(self, message: Message):
+        if isinstance(message, Event):
+            self.event_queue.append(message)
+            await self._dispatch_events()
+            return None
+
+        handler = self._require_handler(message)
+        result = await self._call_in_transaction(self.uow, handler.handle, message)
+        await self._dispatch_events()
+        return result
+
+    async def publish_many(
+        self,
+        commands: Iterable[Command],
+        policy: BatchFailurePolicy = BatchFailurePolicy.ALL_OR_NOTHING,
+    ) -> BatchResult:
+        """여러 커맨드를 하나의 UnitOfWork 트랜잭션에서 차례대로 실행 (MessageBus.publish_many 와 같은 규칙)"""
+        commands = list(commands)
+        handlers = [self._require_handler(command) for command in commands]
+        results: list[Any] = [None] * len(commands)
+        errors: dict[int, Exception] = {}
+
+        with self.uow:
+            for index, (command, handler) in enumerate(zip(commands, handlers)):
+                if policy is BatchFailurePolicy.ALL_OR_NOTHING:
+                    results[index] = await self._call(handler.handle, command, self.uow)
+                    continue
+
+                try:
+                    with self.uow.savepoint():
+                        results[index] = await self._call(handler.handle, command, self.uow)
+                except Exception as e:
+                    errors[index] = e
+
+        self._collect_events()
+        await self._dispatch_events()
+        return BatchResult(results=tuple(results), errors=errors)
+
+    async def _dispatch_events(self) -> None:
+        """이벤트 큐가 빌 때까지 처리 사이클 반복
+
+        한 사이클의 핸들러가 모두 끝난 뒤 실패가 있었다면 첫 번째 예외를 다시 발생시킨다.
+        실패한 핸들러의 트랜잭션만 롤백되고 나머지 핸들러의 트랜잭션은 커밋된다.
+        """
+        while self.event_queue:
+            calls = self._handler_calls(self._pop_cycle())
+
+            if self.uow_factory is None:
+                results = []
+                for _, fn, payload in calls:
+                    try:
+                        results.append(await self._call_in_transaction(self.uow, fn, payload))
+                    except Exception as e:
+                        results.append(e)
+            else:
+                results = await asyncio.gather(
+                    *(self._call_limited(fn, payload) for _, fn, payload in calls),
+                    return_exceptions=True,
+                )
+
+            errors = [r for r in results if isinstance(r, BaseException)]
+            if errors:
+                raise errors[0]
+
+    async def _call_limited(self, fn: Callable, payload: Any) -> Any:
+        async with self._concurrency_limit():
+            return await self._call_in_transaction(self.uow_factory(), fn, payload)
+
+    def _concurrency_limit(self) -> asyncio.Semaphore:
+        """실행 중인 이벤트 루프에 묶인 버스 전체의 동시 실행 제한 (루프가 바뀌면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _call_in_transaction(self, uow: UnitOfWork, fn: Callable, payload: Any) -> Any:
+        """uow 트랜잭션 안에서 핸들러를 호출하고, 커밋되면 발행된 이벤트를 큐에 추가"""
+        with uow:
+            result = await self._call(fn, payload, uow)
+        events = uow.pop_events()
+        if events:
+            self.event_queue.extend(events)
+        return result
+
+    async def _call(self, fn: Callable, payload: Any, uow: UnitOfWork) -> Any:
+        """핸들러 호출 (코루틴이면 제한 시간 안에서 대기)"""
+        result = fn(payload, uow)
+        if not inspect.isawaitable(result):
+            return result
+
+        try:
+            return await asyncio.wait_for(result, timeout=self.handler_timeout)
+        except asyncio.TimeoutError:
+            raise HandlerTimeoutError(_handler_name(fn), self.handler_timeout) from None
+
+
+def _handler_name(fn: Callable) -> str:
+    owner = getattr(fn, "__self__", None)
+    return type(owner).__name__ if owner is not None else getattr(fn, "__qualname__", repr(fn))
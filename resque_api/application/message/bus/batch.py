@@ -0,0 +1,28 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+
+class BatchFailurePolicy(Enum):
+    """일괄 커맨드 실행 실패 정책"""
+
+    ALL_OR_NOTHING = "ALL_OR_NOTHING"  # 하나라도 실패하면 전체 롤백 후 예외 전파
+    SAVEPOINT = "SAVEPOINT"  # 커맨드별 세이브포인트, 실패한 커맨드만 롤백
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """일괄 커맨드 실행 결과
+
+    Attributes:
+        results: 커맨드 순서대로의 처리 결과 (실패한 커맨드는 None)
+        errors: 실패한 커맨드 인덱스별 예외
+    """
+
+    results: tuple[Any, ...]
+    errors: dict[int, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """모든 커맨드 처리 성공 여부"""
+        return not self.errors
@@ -0,0 +1,197 @@
+import pickle
+import struct
+import tempfile
+import threading
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import IO, Iterable, Iterator
+
+from resque_api.application.message.bus.exceptions import EventQueueFullError
+from resque_api.application.message.event.base.event import Event
+
+_LENGTH = struct.Struct("<I")
+
+
+class OverflowPolicy(Enum):
+    """이벤트 큐가 가득 찼을 때의 처리 정책"""
+
+    BLOCK = "BLOCK"  # 자리가 날 때까지 대기 (block_timeout 초과 시 EventQueueFullError)
+    DROP_OLDEST = "DROP_OLDEST"  # 가장 오래된 이벤트를 버리고 추가
+    REJECT = "REJECT"  # 즉시 EventQueueFullError
+    SPILL = "SPILL"  # 초과분을 임시 파일에 기록하고 메모리가 비면 순서대로 읽어옴
+
+
+@dataclass(frozen=True)
+class EventQueueStats:
+    """이벤트 큐 게이지/카운터"""
+
+    depth: int
+    in_memory: int
+    spilled: int
+    high_water_mark: int
+    dropped: int
+    rejected: int
+    spilled_total: int
+
+
+class BoundedEventQueue:
+    """용량 제한이 있는 FIFO 이벤트 큐
+
+    메모리에는 최대 capacity 개의 이벤트만 보관하며, 초과 시 OverflowPolicy 에 따라 처리한다.
+    capacity 가 None 이면 용량 제한이 없다.
+    SPILL 정책에서는 순서를 지키기 위해 파일에 이벤트가 남아 있는 동안 새 이벤트도 파일 뒤에 기록한다.
+    """
+
+    def __init__(
+        self,
+        capacity: int | None = 10_000,
+        policy: OverflowPolicy = OverflowPolicy.REJECT,
+        block_timeout: float | None = None,
+        spill_dir: str | None = None,
+    ):
+        """
+        Args:
+            capacity: 메모리에 보관할 최대 이벤트 수 (None 이면 무제한)
+            policy: 가득 찼을 때의 처리 정책
+            block_timeout: BLOCK 정책의 최대 대기 시간 (초, None 이면 무제한)
+            spill_dir: SPILL 정책의 임시 파일 디렉터리 (None 이면 시스템 기본값)
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.capacity = capacity
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.spill_dir = spill_dir
+
+        self._events: deque[Event] = deque()
+        self._not_full = threading.Condition()
+        self._spill_file: IO[bytes] | None = None
+        self._spill_read_offset = 0
+        self._spilled = 0
+        self._high_water_mark = 0
+        self._dropped = 0
+        self._rejected = 0
+        self._spilled_total = 0
+
+    def __len__(self) -> int:
+        return len(self._events) + self._spilled
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __iter__(self) -> Iterator[Event]:
+        """메모리에 있는 이벤트 순회 (파일에 기록된 이벤트는 포함하지 않음)"""
+        return iter(tuple(self._events))
+
+    def __contains__(self, event: object) -> bool:
+        return event in self._events
+
+    @property
+    def high_water_mark(self) -> int:
+        """지금까지 관측된 최대 큐 길이"""
+        return self._high_water_mark
+
+    def append(self, event: Event) -> None:
+        """이벤트 추가"""
+        with self._not_full:
+            if self._spilled:
+                self._spill(event)
+            elif self._has_room():
+                self._events.append(event)
+            else:
+                self._overflow(event)
+            self._high_water_mark = max(self._high_water_mark, len(self))
+
+    def extend(self, events: Iterable[Event]) -> None:
+        """여러 이벤트 추가"""
+        for event in events:
+            self.append(event)
+
+    def popleft(self) -> Event:
+        """가장 오래된 이벤트 꺼내기"""
+        with self._not_full:
+            if not self._events and self._spilled:
+                self._load_spilled()
+            if not self._events:
+                raise IndexError("pop from an empty event queue")
+
+            event = self._events.popleft()
+            self._not_full.notify()
+            return event
+
+    def clear(self) -> None:
+        """모든 이벤트 제거"""
+        with self._not_full:
+            self._events.clear()
+            self._reset_spill()
+            self._not_full.notify_all()
+
+    def stats(self) -> EventQueueStats:
+        """현재 게이지/카운터"""
+        with self._not_full:
+            return EventQueueStats(
+                depth=len(self),
+                in_memory=len(self._events),
+                spilled=self._spilled,
+                high_water_mark=self._high_water_mark,
+                dropped=self._dropped,
+                rejected=self._rejected,
+                spilled_total=self._spilled_total,
+            )
+
+    def close(self) -> None:
+        """임시 파일 정리"""
+        with self._not_full:
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
+            self._spilled = 0
+
+    def _has_room(self) -> bool:
+        return self.capacity is None or len(self._events) < self.capacity
+
+    def _overflow(self, event: Event) -> None:
+        if self.policy is OverflowPolicy.DROP_OLDEST:
+            self._events.popleft()
+            self._events.append(event)
+            self._dropped += 1
+        elif self.policy is OverflowPolicy.SPILL:
+            self._spill(event)
+        elif self.policy is OverflowPolicy.BLOCK and self._not_full.wait_for(
+            self._has_room, timeout=self.block_timeout
+        ):
+            self._events.append(event)
+        else:
+            self._rejected += 1
+            raise EventQueueFullError(self.capacity)
+
+    def _spill(self, event: Event) -> None:
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(prefix="event-queue-", dir=self.spill_dir)
+
+        payload = pickle.dumps(event, protocol=pickle.HIGHEST_PROTOCOL)
+        self._spill_file.seek(0, 2)
+        self._spill_file.write(_LENGTH.pack(len(payload)) + payload)
+        self._spilled += 1
+        self._spilled_total += 1
+
+    def _load_spilled(self) -> None:
+        """파일에 기록된 이벤트를 메모리 용량만큼 읽어옴"""
+        self._spill_file.seek(self._spill_read_offset)
+        while self._spilled and self._has_room():
+            (length,) = _LENGTH.unpack(self._spill_file.read(_LENGTH.size))
+            self._events.append(pickle.loads(self._spill_file.read(length)))
+            self._spilled -= 1
+        self._spill_read_offset = self._spill_file.tell()
+
+        if not self._spilled:
+            self._reset_spill()
+
+    def _reset_spill(self) -> None:
+        self._spilled = 0
+        self._spill_read_offset = 0
+        if self._spill_file is not None:
+            self._spill_file.seek(0)
+            self._spill_file.truncate()
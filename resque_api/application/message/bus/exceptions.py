@@ -6,4 +6,38 @@ class HandlerNotFoundError(Exception):
 class DuplicateHandlerError(Exception):
     """핸들러가 중복 등록될 때 발생하는 예외"""
     def __init__(self, message_type):
-        super().__init__(f"핸들러가 이미 등록되었습니다. 메시지 타입: {message_type}") 
\ No newline at end of file
+        super().__init__(f"핸들러가 이미 등록되었습니다. 메시지 타입: {message_type}") 
+
+class HandlerTimeoutError(Exception):
+    """핸들러가 제한 시간 안에 완료되지 않을 때 발생하는 예외"""
+    def __init__(self, handler_name, timeout):
+        super().__init__(f"핸들러 실행 시간이 초과되었습니다. 핸들러: {handler_name}, 제한 시간: {timeout}초")
+
+
+class DispatcherNotRunningError(Exception):
+    """실행 중이 아닌 디스패처에 이벤트를 보낼 때 발생하는 예외"""
+    pass
+
+
+class EventQueueFullError(Exception):
+    """이벤트 큐가 가득 차 이벤트를 추가할 수 없을 때 발생하는 예외"""
+    def __init__(self, capacity):
+        super().__init__(f"이벤트 큐가 가득 찼습니다. 용량: {capacity}")
+
+
+class RemoteHandlerError(Exception):
+    """워커 프로세스에서 실행한 핸들러의 예외 (원격 traceback 포함)"""
+    def __init__(self, remote_traceback):
+        super().__init__(f"워커 프로세스에서 핸들러 실행에 실패했습니다.\n{remote_traceback}")
+        self.remote_traceback = remote_traceback
+
+
+class SchedulerNotConfiguredError(Exception):
+    """스케줄러가 설정되지 않았거나 발행 함수가 연결되지 않았을 때 발생하는 예외"""
+    pass
+
+
+class MiddlewareNotSupportedError(Exception):
+    """미들웨어 체인을 실행하지 않는 버스에 미들웨어를 추가할 때 발생하는 예외"""
+    def __init__(self, bus_name):
+        super().__init__(f"{bus_name} 는 미들웨어를 지원하지 않습니다")
@@ -0,0 +1,120 @@
+import threading
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable
+
+from resque_api.application.message.bus.middleware import MessageContext, MessageStage
+from resque_api.application.message.command.base.command import Command
+from resque_api.application.ports.idempotency import IdempotencyStore
+from resque_api.application.ports.uow import UnitOfWork
+
+
+@dataclass(frozen=True)
+class IdempotencyStats:
+    """멱등성 미들웨어 통계"""
+
+    hits: int
+    misses: int
+    stored: int
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def idempotency_key(command: Command) -> str:
+    """커맨드의 멱등성 키 (클라이언트 키가 없으면 메시지 id, 커맨드 타입별로 구분)"""
+    key = command.idempotency_key if command.idempotency_key is not None else str(command.id)
+    return f"{type(command).__name__}:{key}"
+
+
+class IdempotencyMiddleware:
+    """같은 커맨드의 재실행을 막고 저장된 결과를 반환하는 미들웨어
+
+    이미 처리된 키의 커맨드는 핸들러를 실행하지 않고 저장된 결과를 반환한다.
+    결과는 가장 바깥 트랜잭션이 커밋된 뒤에만 저장되므로, 롤백된 커맨드는 재시도 시 다시 실행된다.
+    바깥 트랜잭션에 합류한 커맨드도 바깥 트랜잭션이 롤백되면 결과를 저장하지 않는다.
+    같은 키의 요청이 동시에 들어오는 경우는 막지 않는다.
+    """
+
+    def __init__(self, store: IdempotencyStore, key: Callable[[Command], str] = idempotency_key):
+        """
+        Args:
+            store: 결과 저장소
+            key: 커맨드의 멱등성 키 계산 함수
+        """
+        self.store = store
+        self.key = key
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stored = 0
+
+    def __call__(self, context: MessageContext, call_next: Callable[[], Any]) -> Any:
+        if context.stage is MessageStage.COMMAND and isinstance(context.payload, Command):
+            return self._handle_command(context.payload, call_next)
+        if context.stage is MessageStage.COMMIT:
+            commands = _commands_of(context.payload)
+            if commands and context.uow is not None:
+                return self._commit(commands, context.uow, call_next)
+        return call_next()
+
+    def stats(self) -> IdempotencyStats:
+        """적중/미적중/저장 횟수"""
+        with self._lock:
+            return IdempotencyStats(hits=self._hits, misses=self._misses, stored=self._stored)
+
+    def _handle_command(self, command: Command, call_next: Callable[[], Any]) -> Any:
+        key = self.key(command)
+        record = self.store.get(key)
+        if record is not None:
+            with self._lock:
+                self._hits += 1
+            return record.result
+
+        with self._lock:
+            self._misses += 1
+        result = call_next()
+        self._pending().append((command, key, result))
+        return result
+
+    def _commit(self, commands: tuple[Command, ...], uow: UnitOfWork, call_next: Callable[[], Any]) -> Any:
+        # 커밋 대상 커맨드의 결과만 가장 바깥 트랜잭션의 커밋 콜백으로 저장한다.
+        # 중첩 커밋이면 바깥 트랜잭션 커맨드의 결과는 남겨 두고, 가장 바깥 커밋이 끝나면
+        # 롤백되어 커밋 단계에 이르지 못한 트랜잭션의 결과까지 모두 버린다.
+        committed_ids = {id(command) for command in commands}
+        pending = self._pending()
+        results = [(key, result) for command, key, result in pending if id(command) in committed_ids]
+        self._local.pending = [entry for entry in pending if id(entry[0]) not in committed_ids]
+
+        uow.on_commit(partial(self._store, results))
+        try:
+            return call_next()
+        finally:
+            if not uow.in_transaction:
+                self._local.pending = []
+
+    def _store(self, results: list[tuple[str, Any]]) -> None:
+        for key, result in results:
+            self.store.put(key, result)
+        with self._lock:
+            self._stored += len(results)
+
+    def _pending(self) -> list[tuple[Command, str, Any]]:
+        """현재 스레드에서 커밋을 기다리는 (커맨드, 키, 결과)"""
+        try:
+            return self._local.pending
+        except AttributeError:
+            pending = self._local.pending = []
+            return pending
+
+
+def _commands_of(payload: Any) -> tuple[Command, ...]:
+    """COMMIT 단계 payload 에서 커맨드 추출 (publish 는 커맨드 하나, publish_many 는 커맨드 튜플)"""
+    if isinstance(payload, Command):
+        return (payload,)
+    if isinstance(payload, tuple):
+        return tuple(item for item in payload if isinstance(item, Command))
+    return ()
@@ -1,33 +1,379 @@
-from typing import Type
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, Type
+from uuid import UUID
 
-from resque_api.application.message.bus.exceptions import DuplicateHandlerError, HandlerNotFoundError
+from resque_api.application.message.bus.batch import BatchFailurePolicy, BatchResult
+from resque_api.application.message.bus.event_queue import BoundedEventQueue, OverflowPolicy
+from resque_api.application.message.bus.exceptions import (
+    DuplicateHandlerError,
+    HandlerNotFoundError,
+    SchedulerNotConfiguredError,
+)
+from resque_api.application.message.bus.middleware import MessageContext, MessageStage, Middleware, payload_type
+from resque_api.application.message.bus.partitioned_dispatcher import PartitionedEventDispatcher
+from resque_api.application.message.bus.process_executor import ProcessHandlerExecutor, ProcessOutcome
+from resque_api.application.message.bus.retry import RetryPolicy
+from resque_api.application.message.bus.scheduler import MessageScheduler
+from resque_api.application.message.command.base.command import Command
 from resque_api.application.message.command.base.command_handler import CommandHandler
 from resque_api.application.message.common.message import Message
-from resque_api.application.message.event.base.event_handler import EventHandler
+from resque_api.application.message.event.base.event import Event
+from resque_api.application.message.event.base.event_handler import (
+    BatchEventHandler,
+    EventHandler,
+    ProcessEventHandler,
+)
 from resque_api.application.ports.uow import UnitOfWork
 
 
 class MessageBus:
-    def __init__(self, uow: UnitOfWork):
-        self.handlers: dict[Type[Message], CommandHandler | EventHandler] = dict()
-        self.event_queue = []
+    """커맨드/이벤트 메시지 버스
+
+    커맨드는 타입별로 하나의 핸들러만 등록할 수 있고, 이벤트는 여러 핸들러에 팬아웃된다.
+    커맨드 처리 후 UnitOfWork 에서 수집된 이벤트는 같은 publish 호출 안에서 모두 처리되며,
+    이벤트 핸들러가 다시 발생시킨 이벤트도 큐가 빌 때까지 이어서 처리된다.
+
+    핸들러는 메시지 타입의 MRO 를 따라 조회되므로 상위 타입에 등록한 핸들러도 하위 타입 메시지를 받는다.
+    커맨드는 가장 구체적인 타입의 핸들러 하나가, 이벤트는 MRO 상의 모든 핸들러가 처리한다.
+    구체 타입별 조회 결과는 캐시되고 subscribe 시 무효화된다.
+
+    event_dispatcher 를 지정하면 이벤트별 핸들러는 디스패처의 작업 스레드에서 실행되고,
+    배치 핸들러만 publish 호출 스레드에서 실행된다.
+
+    핸들러 호출마다 버스가 UnitOfWork 트랜잭션을 열고 닫으며(핸들러의 with 블록은 여기에 합류),
+    핸들러 실행과 커밋은 각각 등록된 미들웨어 체인을 거친다.
+
+    이벤트 큐는 BoundedEventQueue 이며, 기본값은 용량 제한이 없다. 이벤트는 커밋 뒤에 큐에 들어가므로
+    용량을 제한할 때 REJECT/DROP_OLDEST 정책은 이미 커밋된 이벤트를 잃을 수 있어 SPILL 정책을 권장한다.
+    큐를 비우는 쪽이 publish 를 호출한 스레드 자신이므로 BLOCK 정책은 풀리지 않는 대기가 되어 허용하지 않는다.
+
+    process_executor 를 지정하면 ProcessEventHandler 의 compute 는 사이클 끝에 워커 프로세스에서 병렬로 실행되고,
+    결과는 이벤트마다 버스 트랜잭션 안에서 on_result 로 전달된다. compute 의 예외도 이 시점에 전파된다.
+
+    scheduler 를 지정하면 publish_at/publish_after 로 지연 발행을 예약할 수 있다.
+
+    retry_policy 를 지정하면 커맨드 트랜잭션이 ConcurrencyConflictError 등으로 롤백됐을 때 백오프 후 다시 실행한다.
+    바깥 트랜잭션에 합류한 커맨드는 롤백이 바깥 트랜잭션 전체에 걸리므로 재시도하지 않는다.
+    """
+
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        event_dispatcher: PartitionedEventDispatcher | None = None,
+        event_queue: BoundedEventQueue | None = None,
+        process_executor: ProcessHandlerExecutor | None = None,
+        scheduler: MessageScheduler | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        self.handlers: dict[Type[Message], CommandHandler] = dict()
+        self.event_handlers: dict[Type[Event], list[EventHandler]] = dict()
+        self.batch_event_handlers: dict[Type[Event], list[BatchEventHandler]] = dict()
+        if event_queue is not None and event_queue.policy is OverflowPolicy.BLOCK:
+            raise ValueError("OverflowPolicy.BLOCK would deadlock: the bus drains its queue on the publishing thread")
+        self.event_queue = event_queue if event_queue is not None else BoundedEventQueue(capacity=None)
         self.uow = uow
+        self._resolved_handlers: dict[Type[Message], CommandHandler | None] = dict()
+        self._resolved_event_handlers: dict[Type[Event], tuple[EventHandler, ...]] = dict()
+        self._resolved_batch_event_handlers: dict[Type[Event], tuple[BatchEventHandler, ...]] = dict()
+        self.middlewares: list[Middleware] = []
+        self.event_dispatcher = event_dispatcher
+        self.process_executor = process_executor
+        self.scheduler = scheduler
+        self.retry_policy = retry_policy
+        self.retries = 0
+        if event_dispatcher is not None:
+            event_dispatcher.bind(self.resolve_event_handlers, self._run_dispatched_handler)
+        if scheduler is not None:
+            scheduler.bind(self.publish)
+
+    def add_middleware(self, middleware: Middleware) -> None:
+        """미들웨어 추가 (먼저 추가한 미들웨어가 바깥쪽에서 실행)"""
+        self.middlewares.append(middleware)
 
     def subscribe(self, handler: CommandHandler | EventHandler, message_type: Type[Message]):
+        if issubclass(message_type, Event):
+            self._append_handler(self.event_handlers, handler, message_type)
+            return
+
         if message_type in self.handlers:
-            raise DuplicateHandlerError(f"핸들러가 이미 등록되었습니다. 메시지 타입: {message_type.__name__}")
+            raise DuplicateHandlerError(message_type.__name__)
 
         self.handlers[message_type] = handler
+        self._invalidate_resolution_cache()
+
+    def subscribe_batch(self, handler: BatchEventHandler, event_type: Type[Event]):
+        """한 처리 사이클에서 발생한 이벤트 중 event_type 의 이벤트를 한 번에 받을 핸들러 등록"""
+        self._append_handler(self.batch_event_handlers, handler, event_type)
+
+    def resolve_handler(self, message_type: Type[Message]) -> CommandHandler | None:
+        """커맨드 타입을 처리할 가장 구체적인 핸들러 조회"""
+        try:
+            return self._resolved_handlers[message_type]
+        except KeyError:
+            handler = next((self.handlers[t] for t in message_type.__mro__ if t in self.handlers), None)
+            self._resolved_handlers[message_type] = handler
+            return handler
+
+    def resolve_event_handlers(self, event_type: Type[Event]) -> tuple[EventHandler, ...]:
+        """이벤트 타입과 상위 타입에 등록된 모든 핸들러 조회"""
+        try:
+            return self._resolved_event_handlers[event_type]
+        except KeyError:
+            handlers = _collect_along_mro(self.event_handlers, event_type)
+            self._resolved_event_handlers[event_type] = handlers
+            return handlers
+
+    def resolve_batch_event_handlers(self, event_type: Type[Event]) -> tuple[BatchEventHandler, ...]:
+        """이벤트 타입과 상위 타입에 등록된 모든 배치 핸들러 조회"""
+        try:
+            return self._resolved_batch_event_handlers[event_type]
+        except KeyError:
+            handlers = _collect_along_mro(self.batch_event_handlers, event_type)
+            self._resolved_batch_event_handlers[event_type] = handlers
+            return handlers
 
     def publish(self, message: Message):
-        handler = self.handlers.get(type(message))
-        
+        if isinstance(message, Event):
+            self.event_queue.append(message)
+            self._dispatch_events()
+            return None
+
+        handler = self._require_handler(message)
+        result = self._execute_command(message, handler)
+        self._collect_events()
+        self._dispatch_events()
+        return result
+
+    def publish_many(
+        self,
+        commands: Iterable[Command],
+        policy: BatchFailurePolicy = BatchFailurePolicy.ALL_OR_NOTHING,
+    ) -> BatchResult:
+        """여러 커맨드를 하나의 UnitOfWork 트랜잭션에서 실행
+
+        커밋과 이벤트 수집은 일괄 처리 전체에 대해 한 번만 수행된다.
+        핸들러가 없는 커맨드가 있으면 트랜잭션을 시작하기 전에 HandlerNotFoundError 를 발생시킨다.
+
+        Args:
+            commands: 실행할 커맨드 목록
+            policy: ALL_OR_NOTHING 이면 첫 실패에서 전체 롤백 후 예외를 전파하고,
+                SAVEPOINT 면 실패한 커맨드만 롤백하고 나머지를 커밋한다
+
+        Returns:
+            BatchResult: 커맨드별 결과와 실패 목록
+        """
+        commands = list(commands)
+        handlers = [self._require_handler(command) for command in commands]
+        results: list[Any] = [None] * len(commands)
+        errors: dict[int, Exception] = {}
+
+        with self._transaction(Command, tuple(commands)):
+            for index, (command, handler) in enumerate(zip(commands, handlers)):
+                call = partial(self._invoke, MessageStage.COMMAND, type(command), command, handler,
+                               partial(handler.handle, command, self.uow))
+                if policy is BatchFailurePolicy.ALL_OR_NOTHING:
+                    results[index] = call()
+                    continue
+
+                try:
+                    with self.uow.savepoint():
+                        results[index] = call()
+                except Exception as e:
+                    errors[index] = e
+
+        self._collect_events()
+        self._dispatch_events()
+        return BatchResult(results=tuple(results), errors=errors)
+
+    def publish_at(self, message: Message, when: datetime | float) -> UUID:
+        """when 시각에 메시지 발행 예약
+
+        Returns:
+            UUID: 예약 ID (scheduler.cancel 로 취소)
+        """
+        return self._require_scheduler().schedule_at(message, when)
+
+    def publish_after(self, message: Message, delay: timedelta | float) -> UUID:
+        """delay 후 메시지 발행 예약
+
+        Returns:
+            UUID: 예약 ID (scheduler.cancel 로 취소)
+        """
+        return self._require_scheduler().schedule_after(message, delay)
+
+    def _require_scheduler(self) -> MessageScheduler:
+        if self.scheduler is None:
+            raise SchedulerNotConfiguredError("스케줄러가 설정되지 않았습니다")
+        return self.scheduler
+
+    def _execute_command(self, command: Message, handler: CommandHandler) -> Any:
+        """커맨드를 자체 트랜잭션에서 실행하고, 재시도 정책에 해당하는 실패면 백오프 후 다시 실행"""
+        message_type = type(command)
+        retryable = self.retry_policy is not None and not self.uow.in_transaction
+        attempt = 1
+        while True:
+            try:
+                with self._transaction(message_type, command):
+                    return self._invoke(
+                        MessageStage.COMMAND, message_type, command, handler, partial(handler.handle, command, self.uow)
+                    )
+            except Exception as e:
+                if not retryable or not self.retry_policy.should_retry(e, attempt):
+                    raise
+            self.retry_policy.backoff(attempt)
+            self.retries += 1
+            attempt += 1
+
+    def _require_handler(self, message: Message) -> CommandHandler:
+        handler = self.resolve_handler(type(message))
+
         if handler is None:
-            raise HandlerNotFoundError(f"등록된 핸들러가 없습니다. 메시지 타입: {type(message).__name__}")
-        
-        result = handler.handle(message, self.uow)
+            raise HandlerNotFoundError(type(message).__name__)
+
+        return handler
+
+    def _dispatch_events(self) -> None:
+        """이벤트 큐가 빌 때까지 처리 사이클 반복
+
+        한 사이클은 사이클 시작 시점에 큐에 있던 이벤트 전체이며, 사이클 도중 발생한 이벤트는 다음 사이클에서 처리된다.
+        이벤트는 큐에서 하나씩 꺼내 처리하므로 사이클 전체를 메모리에 올리지 않는다
+        (배치 핸들러와 프로세스 핸들러가 구독한 이벤트만 사이클 끝까지 보관된다).
+        """
+        while self.event_queue:
+            offloaded: dict[int, tuple[ProcessEventHandler, list[Event]]] = {}
+            batches: dict[int, tuple[BatchEventHandler, list[Event]]] = {}
+
+            for _ in range(len(self.event_queue)):
+                event = self.event_queue.popleft()
+
+                if self.event_dispatcher is not None:
+                    self.event_dispatcher.dispatch(event)
+                else:
+                    for handler in self.resolve_event_handlers(type(event)):
+                        if self.process_executor is not None and _runs_in_process(handler):
+                            offloaded.setdefault(id(handler), (handler, []))[1].append(event)
+                        else:
+                            self._run_event_handler(handler, handler.handle, event)
+
+                for handler in self.resolve_batch_event_handlers(type(event)):
+                    batches.setdefault(id(handler), (handler, []))[1].append(event)
+
+            for handler, events in offloaded.values():
+                for event, outcome in zip(events, self.process_executor.map(handler, events)):
+                    self._run_event_handler(handler, partial(_apply_outcome, handler, outcome), event)
+
+            for handler, events in batches.values():
+                self._run_event_handler(handler, handler.handle_batch, tuple(events))
+
+    def _run_event_handler(self, handler: Any, fn: Callable, payload: Event | tuple[Event, ...]) -> None:
+        message_type = payload_type(payload)
+        with self._transaction(message_type, payload):
+            self._invoke(MessageStage.EVENT, message_type, payload, handler, partial(fn, payload, self.uow))
+        self._collect_events()
+
+    def _run_dispatched_handler(self, handler: EventHandler, event: Event, uow: UnitOfWork) -> None:
+        """디스패처 작업 스레드에서 그 스레드의 UnitOfWork 로 핸들러를 실행 (트랜잭션/미들웨어 체인 적용)"""
+        message_type = type(event)
+        with self._transaction(message_type, event, uow):
+            self._invoke(MessageStage.EVENT, message_type, event, handler, partial(handler.handle, event, uow))
+
+    def _pop_cycle(self) -> tuple[Event, ...]:
+        """사이클 시작 시점에 큐에 있던 이벤트를 모두 꺼냄"""
+        return tuple(self.event_queue.popleft() for _ in range(len(self.event_queue)))
+
+    def _handler_calls(self, cycle: tuple[Event, ...]) -> list[tuple[Any, Callable, Any]]:
+        """한 사이클의 이벤트를 처리할 (핸들러, 핸들러 메서드, 인자) 목록
+
+        이벤트별 핸들러 호출이 발생 순서대로 먼저 오고, 배치 핸들러는 구독한 이벤트들을
+        모아 핸들러마다 한 번씩 호출된다.
+        """
+        calls: list[tuple[Any, Callable, Any]] = []
+        if self.event_dispatcher is None:
+            calls += [
+                (handler, handler.handle, event)
+                for event in cycle
+                for handler in self.resolve_event_handlers(type(event))
+            ]
+
+        batches: dict[int, tuple[BatchEventHandler, list[Event]]] = {}
+        for event in cycle:
+            for handler in self.resolve_batch_event_handlers(type(event)):
+                batches.setdefault(id(handler), (handler, []))[1].append(event)
+
+        calls += [(handler, handler.handle_batch, tuple(events)) for handler, events in batches.values()]
+        return calls
+
+    @contextmanager
+    def _transaction(
+        self, message_type: Type[Message], payload: Any, uow: UnitOfWork | None = None
+    ) -> Iterator[None]:
+        """UnitOfWork 트랜잭션을 열고, 블록이 성공하면 COMMIT 단계를 미들웨어 체인으로 실행
+
+        uow 를 지정하지 않으면 버스의 UnitOfWork 를 사용한다.
+        """
+        uow = self.uow if uow is None else uow
+        uow.__enter__()
+        try:
+            yield
+        except BaseException as e:
+            uow.__exit__(type(e), e, e.__traceback__)
+            raise
+
+        self._invoke(MessageStage.COMMIT, message_type, payload, None, partial(uow.__exit__, None, None, None), uow)
+
+    def _invoke(
+        self,
+        stage: MessageStage,
+        message_type: Type[Message],
+        payload: Any,
+        handler: Any,
+        call: Callable[[], Any],
+        uow: UnitOfWork | None = None,
+    ) -> Any:
+        """미들웨어 체인을 거쳐 call 실행"""
+        if not self.middlewares:
+            return call()
+
+        context = MessageContext(stage=stage, message_type=message_type, payload=payload, handler=handler, uow=uow)
+        for middleware in reversed(self.middlewares):
+            call = partial(middleware, context, call)
+        return call()
+
+    def _collect_events(self) -> None:
         events = self.uow.pop_events()
 
         if events:
             self.event_queue.extend(events)
-        return result
\ No newline at end of file
+
+    def _append_handler(self, registry: dict[Type[Event], list], handler, event_type: Type[Event]) -> None:
+        handlers = registry.setdefault(event_type, [])
+        if handler in handlers:
+            raise DuplicateHandlerError(event_type.__name__)
+        handlers.append(handler)
+        self._invalidate_resolution_cache()
+
+    def _invalidate_resolution_cache(self) -> None:
+        self._resolved_handlers.clear()
+        self._resolved_event_handlers.clear()
+        self._resolved_batch_event_handlers.clear()
+
+
+def _runs_in_process(handler: EventHandler) -> bool:
+    """ProcessEventHandler 를 명시적으로 상속한 핸들러인지 여부 (Mock 등 구조적 일치는 제외)"""
+    return ProcessEventHandler in type(handler).__mro__
+
+
+def _apply_outcome(handler: ProcessEventHandler, outcome: ProcessOutcome, event: Event, uow: UnitOfWork) -> None:
+    handler.on_result(event, outcome.unwrap(), uow)
+
+
+def _collect_along_mro(registry: dict[Type[Event], list], event_type: Type[Event]) -> tuple:
+    """MRO 순서(구체 타입 우선)로 핸들러를 모으되 같은 핸들러는 한 번만 포함"""
+    collected = []
+    for t in event_type.__mro__:
+        for handler in registry.get(t, ()):
+            if not any(handler is h for h in collected):
+                collected.append(handler)
+    return tuple(collected)
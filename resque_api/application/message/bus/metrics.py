@@ -0,0 +1,126 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable
+
+from resque_api.application.message.bus.middleware import MessageContext, MessageStage
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Series:
+    """메시지 타입/단계 하나의 호출 수, 오류 수, 지연 시간 히스토그램"""
+
+    __slots__ = ("calls", "errors", "total_seconds", "bucket_counts")
+
+    def __init__(self, bucket_count: int):
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.bucket_counts = [0] * (bucket_count + 1)  # 마지막 칸은 +Inf
+
+
+class MetricsMiddleware:
+    """메시지 타입별 처리 지표를 수집하는 미들웨어
+
+    (메시지 타입, 처리 단계) 별로 호출 수, 오류 수, 지연 시간 히스토그램을 기록한다.
+    핸들러 실행(command/event)과 커밋(commit)은 서로 다른 단계로 기록되므로
+    핸들러 시간과 커밋 시간을 나눠 볼 수 있다.
+    호출당 비용은 시계 두 번 읽기와 잠금 한 번 정도라 운영 환경에서 항상 켜둘 수 있다.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS, namespace: str = "resque"):
+        """
+        Args:
+            buckets: 히스토그램 버킷 상한 (초, 오름차순)
+            namespace: Prometheus 지표 이름 접두사
+        """
+        if list(buckets) != sorted(buckets) or not buckets:
+            raise ValueError("buckets must be a non-empty ascending sequence")
+
+        self.buckets = tuple(buckets)
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._series: dict[tuple[str, MessageStage], _Series] = {}
+
+    def __call__(self, context: MessageContext, call_next: Callable[[], Any]) -> Any:
+        started = time.perf_counter()
+        failed = False
+        try:
+            return call_next()
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self.record(context.message_type.__name__, context.stage, time.perf_counter() - started, failed)
+
+    def record(self, message_type: str, stage: MessageStage, seconds: float, failed: bool = False) -> None:
+        """측정값 하나 기록"""
+        bucket = bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get((message_type, stage))
+            if series is None:
+                series = self._series[(message_type, stage)] = _Series(len(self.buckets))
+            series.calls += 1
+            series.errors += failed
+            series.total_seconds += seconds
+            series.bucket_counts[bucket] += 1
+
+    def reset(self) -> None:
+        """수집한 지표 초기화"""
+        with self._lock:
+            self._series.clear()
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """메시지 타입 -> 단계 -> 지표 딕셔너리
+
+        buckets 는 Prometheus 와 같이 누적 개수이며 키는 버킷 상한이다.
+        """
+        with self._lock:
+            copied = {
+                key: (s.calls, s.errors, s.total_seconds, list(s.bucket_counts)) for key, s in self._series.items()
+            }
+
+        snapshot: dict[str, dict[str, dict[str, Any]]] = {}
+        for (message_type, stage), (calls, errors, total, counts) in sorted(
+            copied.items(), key=lambda item: (item[0][0], item[0][1].value)
+        ):
+            cumulative, buckets = 0, {}
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                buckets[bound] = cumulative
+
+            snapshot.setdefault(message_type, {})[stage.value] = {
+                "calls": calls,
+                "errors": errors,
+                "total_seconds": total,
+                "mean_seconds": total / calls if calls else 0.0,
+                "buckets": buckets,
+            }
+        return snapshot
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식으로 변환"""
+        calls_name = f"{self.namespace}_message_calls_total"
+        errors_name = f"{self.namespace}_message_errors_total"
+        latency_name = f"{self.namespace}_message_duration_seconds"
+
+        calls_lines = [f"# HELP {calls_name} Handled messages per type and stage.", f"# TYPE {calls_name} counter"]
+        errors_lines = [f"# HELP {errors_name} Failed messages per type and stage.", f"# TYPE {errors_name} counter"]
+        latency_lines = [
+            f"# HELP {latency_name} Handler and commit latency per message type.",
+            f"# TYPE {latency_name} histogram",
+        ]
+
+        for message_type, stages in self.snapshot().items():
+            for stage, data in stages.items():
+                labels = f'message_type="{message_type}",stage="{stage}"'
+                calls_lines.append(f"{calls_name}{{{labels}}} {data['calls']}")
+                errors_lines.append(f"{errors_name}{{{labels}}} {data['errors']}")
+                for bound, count in data["buckets"].items():
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    latency_lines.append(f'{latency_name}_bucket{{{labels},le="{le}"}} {count}')
+                latency_lines.append(f"{latency_name}_sum{{{labels}}} {data['total_seconds']}")
+                latency_lines.append(f"{latency_name}_count{{{labels}}} {data['calls']}")
+
+        return "\n".join([*calls_lines, *errors_lines, *latency_lines]) + "\n"
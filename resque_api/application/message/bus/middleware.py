@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Protocol, Type
+
+from resque_api.application.message.common.message import Message
+from resque_api.application.message.event.base.event import Event
+from resque_api.application.ports.uow import UnitOfWork
+
+
+class MessageStage(Enum):
+    """미들웨어가 감싸는 메시지 처리 단계"""
+
+    COMMAND = "command"  # 커맨드 핸들러 실행
+    EVENT = "event"  # 이벤트 핸들러 실행
+    COMMIT = "commit"  # 핸들러 실행 후 UnitOfWork 커밋
+
+
+@dataclass(frozen=True)
+class MessageContext:
+    """미들웨어에 전달되는 처리 단계 정보
+
+    Attributes:
+        stage: 처리 단계
+        message_type: 처리 중인 메시지 타입
+        payload: 메시지 (배치 이벤트 핸들러와 일괄 커맨드 커밋은 메시지 튜플)
+        handler: 실행할 핸들러 (COMMIT 단계는 None)
+        uow: 커밋할 UnitOfWork (COMMIT 단계에서만 설정)
+    """
+
+    stage: MessageStage
+    message_type: Type[Message]
+    payload: Message | tuple[Message, ...]
+    handler: Any | None = None
+    uow: UnitOfWork | None = None
+
+
+class Middleware(Protocol):
+    """메시지 버스 미들웨어
+
+    call_next 를 호출하면 다음 미들웨어(마지막이면 실제 핸들러/커밋)가 실행된다.
+    call_next 의 반환값을 그대로 반환해야 핸들러 결과가 호출자에게 전달된다.
+    """
+
+    def __call__(self, context: MessageContext, call_next: Callable[[], Any]) -> Any:
+        ...
+
+
+def payload_type(payload: Event | tuple[Event, ...]) -> Type[Message]:
+    """이벤트 핸들러 인자에서 메시지 타입 추출"""
+    return type(payload[0]) if isinstance(payload, tuple) else type(payload)
@@ -0,0 +1,303 @@
+import logging
+import os
+import queue
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Hashable, Type
+
+from resque_api.application.message.bus.exceptions import DispatcherNotRunningError
+from resque_api.application.message.event.base.event import Event
+from resque_api.application.message.event.base.event_handler import EventHandler
+from resque_api.application.ports.uow import UnitOfWork
+
+HandlerResolver = Callable[[Type[Event]], tuple[EventHandler, ...]]
+HandlerRunner = Callable[[EventHandler, Event, UnitOfWork], None]
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+def aggregate_partition_key(event: Event) -> Hashable:
+    """이벤트의 집계 ID (없으면 이벤트 ID) 를 파티션 키로 사용"""
+    return event.aggregate_id if event.aggregate_id is not None else event.id
+
+
+@dataclass(frozen=True)
+class DispatcherStats:
+    """파티션 디스패처 통계"""
+
+    queue_depths: tuple[int, ...]
+    high_water_marks: tuple[int, ...]
+    processed: int
+    failed: int
+    spilled: int = 0
+
+
+class PartitionedEventDispatcher:
+    """집계 ID 로 파티션을 나눈 스레드 풀 이벤트 디스패처
+
+    같은 파티션 키의 이벤트는 항상 같은 작업 스레드의 큐로 들어가므로
+    같은 집계(Project, Requirement 등)의 이벤트는 발생 순서대로 처리되고,
+    서로 다른 집계의 이벤트는 여러 스레드에서 병렬로 처리된다.
+
+    작업 스레드마다 uow_factory 로 만든 UnitOfWork 를 하나씩 사용하며, 핸들러 호출마다 트랜잭션을 연다.
+    MessageBus 에 연결하면 버스의 트랜잭션/미들웨어 체인(EVENT, COMMIT 단계)을 거쳐 핸들러를 실행한다.
+    핸들러가 발생시킨 이벤트는 다시 파티션을 계산해 디스패치한다.
+
+    작업 스레드가 다른 파티션으로 보내는 이벤트는 대기하지 않는다. 대상 큐가 가득 차면 파티션별 보조 큐(spill)에
+    넣고, 대상 파티션의 작업 스레드가 이벤트를 하나 처리할 때마다 자기 큐로 옮긴다.
+    가득 찬 두 파티션이 서로에게 이벤트를 보내며 교착되지 않도록 하기 위함이다.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], UnitOfWork],
+        workers: int | None = None,
+        max_queue_depth: int = 1000,
+        partition_key: Callable[[Event], Hashable] = aggregate_partition_key,
+        on_error: Callable[[Event, EventHandler, Exception], None] | None = None,
+    ):
+        """
+        Args:
+            uow_factory: 작업 스레드별 UnitOfWork 생성 함수
+            workers: 작업 스레드(파티션) 수 (기본값: CPU 코어 수)
+            max_queue_depth: 파티션별 큐 최대 길이 (가득 차면 dispatch 가 대기)
+            partition_key: 이벤트의 파티션 키 계산 함수
+            on_error: 핸들러 예외 발생 시 호출되는 콜백
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if max_queue_depth < 1:
+            raise ValueError("max_queue_depth must be at least 1")
+
+        self.uow_factory = uow_factory
+        self.workers = workers
+        self.max_queue_depth = max_queue_depth
+        self.partition_key = partition_key
+        self.on_error = on_error
+
+        self._resolver: HandlerResolver | None = None
+        self._runner: HandlerRunner = _run_in_transaction
+        self._spills = [deque() for _ in range(workers)]
+        self._spill_lock = threading.Lock()
+        self._spilled = 0
+        self._queues = [queue.Queue(maxsize=max_queue_depth) for _ in range(workers)]
+        self._high_water_marks = [0] * workers
+        self._threads: list[threading.Thread] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._processed = 0
+        self._failed = 0
+        self._running = False
+        # 큐와 보조 큐에 들어가 아직 처리가 끝나지 않은 이벤트 수. 처리 중인 핸들러가 보낸 후속 이벤트는
+        # 처리 중인 이벤트가 끝나기 전에 더해지므로, 0 이 되면 모든 파티션이 비어 있고 처리 중인 이벤트도 없다.
+        self._outstanding = 0
+        self._idle = threading.Condition()
+
+    def bind(self, resolver: HandlerResolver, runner: HandlerRunner | None = None) -> None:
+        """이벤트 타입별 핸들러 조회 함수와 핸들러 실행 함수 연결 (MessageBus 가 호출)
+
+        Args:
+            resolver: 이벤트 타입별 핸들러 조회 함수
+            runner: (핸들러, 이벤트, UnitOfWork) 를 받아 트랜잭션 안에서 핸들러를 실행하는 함수
+                (None 이면 UnitOfWork with 블록 안에서 handle 만 호출)
+        """
+        self._resolver = resolver
+        self._runner = runner if runner is not None else _run_in_transaction
+
+    def start(self) -> None:
+        """작업 스레드 시작"""
+        if self._running:
+            return
+        if self._resolver is None:
+            raise DispatcherNotRunningError("핸들러 조회 함수가 연결되지 않았습니다")
+
+        self._running = True
+        self._threads = [
+            threading.Thread(target=self._work, args=(index,), name=f"event-partition-{index}", daemon=True)
+            for index in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def partition_of(self, event: Event) -> int:
+        """이벤트가 배정될 파티션 번호"""
+        return hash(self.partition_key(event)) % self.workers
+
+    def dispatch(self, event: Event) -> None:
+        """이벤트를 파티션 큐에 넣음
+
+        작업 스레드 밖에서 호출하면 큐가 가득 찼을 때 자리가 날 때까지 대기하고,
+        작업 스레드에서 호출하면 대기하지 않고 보조 큐에 넣는다.
+        """
+        partition = self.partition_of(event)
+        own_partition = getattr(self._local, "partition", None)
+        if own_partition == partition:
+            # 작업 스레드가 자기 파티션으로 보내는 이벤트는 자신의 큐를 기다리면 교착되므로 로컬에서 이어서 처리한다.
+            self._local.pending.append(event)
+            return
+        if own_partition is None and not self._running:
+            raise DispatcherNotRunningError("디스패처가 실행 중이 아닙니다")
+
+        partition_queue = self._queues[partition]
+        with self._idle:
+            self._outstanding += 1
+        if own_partition is not None:
+            self._put_nowait_or_spill(partition, event)
+        else:
+            partition_queue.put(event)
+        depth = partition_queue.qsize()
+        if depth > self._high_water_marks[partition]:
+            self._high_water_marks[partition] = depth
+
+    def queue_depths(self) -> tuple[int, ...]:
+        """파티션별 현재 큐 길이"""
+        return tuple(q.qsize() for q in self._queues)
+
+    def stats(self) -> DispatcherStats:
+        """디스패처 통계"""
+        with self._lock:
+            processed, failed = self._processed, self._failed
+        return DispatcherStats(
+            queue_depths=self.queue_depths(),
+            high_water_marks=tuple(self._high_water_marks),
+            processed=processed,
+            failed=failed,
+            spilled=self._spilled,
+        )
+
+    def join(self) -> None:
+        """지금까지 디스패치된 이벤트와 그 처리 중에 발생한 후속 이벤트가 모두 처리될 때까지 대기"""
+        with self._idle:
+            self._idle.wait_for(lambda: self._outstanding == 0)
+
+    def shutdown(self, drain: bool = True, timeout: float | None = None) -> None:
+        """작업 스레드 종료
+
+        Args:
+            drain: True 면 큐에 남은 이벤트를 모두 처리한 뒤 종료하고, False 면 버린다
+            timeout: 스레드별 종료 대기 시간 (초)
+        """
+        if not self._running:
+            return
+        self._running = False
+
+        if drain:
+            # 처리 중인 핸들러가 다른 파티션으로 보낸 후속 이벤트까지 처리된 뒤에 종료 신호를 보낸다.
+            self.join()
+        else:
+            for partition, partition_queue in enumerate(self._queues):
+                with self._spill_lock:
+                    discarded = len(self._spills[partition])
+                    self._spills[partition].clear()
+                discarded += _discard_all(partition_queue)
+                self._done(discarded)
+
+        for partition_queue in self._queues:
+            partition_queue.put(_STOP)
+
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def __enter__(self) -> "PartitionedEventDispatcher":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb) -> None:
+        self.shutdown()
+
+    def _work(self, partition: int) -> None:
+        uow = self.uow_factory()
+        partition_queue = self._queues[partition]
+        self._local.partition = partition
+        self._local.pending = deque()
+
+        while True:
+            item = partition_queue.get()
+            try:
+                if item is _STOP:
+                    return
+                self._local.pending.append(item)
+                while self._local.pending:
+                    self._handle(self._local.pending.popleft(), uow)
+            finally:
+                # task_done 전에 옮겨야 큐가 비었을 때 보조 큐의 이벤트가 남아 있지 않다.
+                self._refill(partition)
+                partition_queue.task_done()
+                if item is not _STOP:
+                    self._done(1)
+
+    def _handle(self, event: Event, uow: UnitOfWork) -> None:
+        for handler in self._resolver(type(event)):
+            try:
+                self._runner(handler, event, uow)
+            except Exception as e:
+                with self._lock:
+                    self._failed += 1
+                self._report_error(event, handler, e)
+
+            for raised in uow.pop_events():
+                self.dispatch(raised)
+
+        with self._lock:
+            self._processed += 1
+
+    def _done(self, count: int) -> None:
+        """처리가 끝났거나 버려진 이벤트 수만큼 미처리 이벤트 수를 줄임"""
+        with self._idle:
+            self._outstanding -= count
+            if self._outstanding == 0:
+                self._idle.notify_all()
+
+    def _report_error(self, event: Event, handler: EventHandler, error: Exception) -> None:
+        if self.on_error is None:
+            logger.error("Event handler %s failed for %r", type(handler).__name__, event, exc_info=error)
+            return
+        try:
+            self.on_error(event, handler, error)
+        except Exception:
+            logger.exception("on_error callback failed for %r", event)
+
+    def _put_nowait_or_spill(self, partition: int, event: Event) -> None:
+        with self._spill_lock:
+            spill = self._spills[partition]
+            if not spill:
+                try:
+                    self._queues[partition].put_nowait(event)
+                    return
+                except queue.Full:
+                    pass
+            spill.append(event)
+            self._spilled += 1
+
+    def _refill(self, partition: int) -> None:
+        """보조 큐의 이벤트를 자리가 나는 만큼 순서대로 파티션 큐로 옮김"""
+        with self._spill_lock:
+            spill = self._spills[partition]
+            while spill:
+                try:
+                    self._queues[partition].put_nowait(spill[0])
+                except queue.Full:
+                    return
+                spill.popleft()
+
+
+def _run_in_transaction(handler: EventHandler, event: Event, uow: UnitOfWork) -> None:
+    with uow:
+        handler.handle(event, uow)
+
+
+def _discard_all(partition_queue: queue.Queue) -> int:
+    """큐에 남은 항목을 모두 버리고 버린 수를 반환"""
+    discarded = 0
+    while True:
+        try:
+            partition_queue.get_nowait()
+        except queue.Empty:
+            return discarded
+        partition_queue.task_done()
+        discarded += 1
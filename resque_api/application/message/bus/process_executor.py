@@ -0,0 +1,163 @@
+import multiprocessing
+import pickle
+import threading
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+from resque_api.application.message.bus.exceptions import RemoteHandlerError
+from resque_api.application.message.event.base.event import Event
+from resque_api.application.message.event.base.event_handler import ProcessEventHandler
+
+
+@dataclass(frozen=True)
+class ProcessOutcome:
+    """워커 프로세스에서 실행한 compute 결과
+
+    Attributes:
+        value: compute 반환값 (실패 시 None)
+        error: compute 에서 발생한 예외 (피클할 수 없는 예외는 RemoteHandlerError 로 대체)
+        remote_traceback: 워커 프로세스에서 포맷한 traceback
+    """
+
+    value: Any = None
+    error: BaseException | None = None
+    remote_traceback: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> Any:
+        """성공이면 결과를 반환하고, 실패면 예외를 다시 발생시킴"""
+        if self.error is None:
+            return self.value
+
+        if self.remote_traceback is not None and self.error.__cause__ is None and not isinstance(
+            self.error, RemoteHandlerError
+        ):
+            self.error.__cause__ = RemoteHandlerError(self.remote_traceback)
+        raise self.error
+
+
+@dataclass(frozen=True)
+class ProcessExecutorStats:
+    """프로세스 실행기 통계"""
+
+    submitted: int
+    completed: int
+    failed: int
+
+
+class ProcessHandlerExecutor:
+    """ProcessEventHandler 의 compute 를 ProcessPoolExecutor 에서 실행하는 실행기
+
+    이벤트들은 chunksize 개씩 묶어 한 작업으로 제출되므로 작은 이벤트가 많을 때 프로세스 간 통신 비용이 줄어든다.
+    워커는 max_tasks_per_child 개 작업(청크)을 처리하면 새 프로세스로 교체되어 누수된 메모리를 회수한다.
+    풀은 첫 실행 시점에 만들어진다.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        chunksize: int = 1,
+        max_tasks_per_child: int | None = None,
+        mp_context: str | None = None,
+    ):
+        """
+        Args:
+            max_workers: 워커 프로세스 수 (기본값: CPU 코어 수)
+            chunksize: 한 작업으로 묶어 보낼 이벤트 수
+            max_tasks_per_child: 워커 프로세스 교체 주기 (작업 수, None 이면 교체하지 않음)
+            mp_context: multiprocessing 시작 방식 ("spawn", "forkserver", "fork").
+                max_tasks_per_child 를 쓰면 None 일 때 "spawn" 이 사용된다
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if chunksize < 1:
+            raise ValueError("chunksize must be at least 1")
+        if max_tasks_per_child is not None and max_tasks_per_child < 1:
+            raise ValueError("max_tasks_per_child must be at least 1")
+
+        self.max_workers = max_workers
+        self.chunksize = chunksize
+        self.max_tasks_per_child = max_tasks_per_child
+        self.mp_context = mp_context
+
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+
+    def map(self, handler: ProcessEventHandler, events: Sequence[Event]) -> list[ProcessOutcome]:
+        """이벤트별로 handler.compute 를 워커 프로세스에서 실행
+
+        Returns:
+            list[ProcessOutcome]: events 순서대로의 실행 결과
+        """
+        pool = self._ensure_pool()
+        chunks = [events[i:i + self.chunksize] for i in range(0, len(events), self.chunksize)]
+        futures = [pool.submit(_compute_chunk, handler, tuple(chunk)) for chunk in chunks]
+
+        outcomes: list[ProcessOutcome] = []
+        for chunk, future in zip(chunks, futures):
+            try:
+                outcomes += future.result()
+            except Exception as e:
+                # 피클 실패나 워커 비정상 종료처럼 청크 단위로 실패한 경우
+                outcomes += [ProcessOutcome(error=e)] * len(chunk)
+
+        failed = sum(not outcome.ok for outcome in outcomes)
+        with self._lock:
+            self._submitted += len(events)
+            self._completed += len(outcomes) - failed
+            self._failed += failed
+        return outcomes
+
+    def stats(self) -> ProcessExecutorStats:
+        """실행기 통계"""
+        with self._lock:
+            return ProcessExecutorStats(submitted=self._submitted, completed=self._completed, failed=self._failed)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """워커 프로세스 종료"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=not wait)
+
+    def __enter__(self) -> "ProcessHandlerExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb) -> None:
+        self.shutdown()
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                context = multiprocessing.get_context(self.mp_context) if self.mp_context else None
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=context,
+                    max_tasks_per_child=self.max_tasks_per_child,
+                )
+            return self._pool
+
+
+def _compute_chunk(handler: ProcessEventHandler, events: tuple[Event, ...]) -> list[ProcessOutcome]:
+    """워커 프로세스에서 실행: 이벤트별 예외를 결과로 담아 청크 전체를 처리"""
+    return [_compute(handler, event) for event in events]
+
+
+def _compute(handler: ProcessEventHandler, event: Event) -> ProcessOutcome:
+    try:
+        return ProcessOutcome(value=handler.compute(event))
+    except Exception as e:
+        remote_traceback = traceback.format_exc()
+        try:
+            pickle.loads(pickle.dumps(e))
+        except Exception:
+            e = RemoteHandlerError(remote_traceback)
+        return ProcessOutcome(error=e, remote_traceback=remote_traceback)
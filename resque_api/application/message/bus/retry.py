@@ -0,0 +1,56 @@
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Type
+
+from resque_api.application.ports.repository.exceptions import ConcurrencyConflictError
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """커맨드 재시도 정책 (지수 백오프 + 지터)
+
+    retry_on 에 해당하는 예외로 커맨드 트랜잭션이 롤백되면, 대기 후 핸들러를 처음부터 다시 실행한다.
+    n 번째 재시도 전 대기 시간은 min(max_delay, base_delay * multiplier ** (n - 1)) 이며,
+    jitter 가 켜져 있으면 0 과 그 값 사이에서 무작위로 고른다(동시에 충돌한 요청들이 다시 겹치지 않도록).
+
+    Attributes:
+        max_attempts: 첫 실행을 포함한 최대 실행 횟수
+        base_delay: 첫 재시도 전 대기 시간 (초)
+        max_delay: 대기 시간 상한 (초)
+        multiplier: 재시도마다 대기 시간에 곱하는 값
+        jitter: 대기 시간 무작위화 여부
+        retry_on: 재시도할 예외 타입
+        sleep: 대기 함수 (테스트에서 교체 가능)
+        random: [0, 1) 난수 함수 (테스트에서 교체 가능)
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.01
+    max_delay: float = 1.0
+    multiplier: float = 2.0
+    jitter: bool = True
+    retry_on: tuple[Type[BaseException], ...] = (ConcurrencyConflictError,)
+    sleep: Callable[[float], None] = field(default=time.sleep, repr=False)
+    random: Callable[[], float] = field(default=random.random, repr=False)
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if self.base_delay < 0 or self.max_delay < 0:
+            raise ValueError("delays must not be negative")
+
+    def should_retry(self, error: BaseException, attempt: int) -> bool:
+        """attempt 번째 실행이 error 로 실패했을 때 다시 실행할지 여부"""
+        return attempt < self.max_attempts and isinstance(error, self.retry_on)
+
+    def delay(self, attempt: int) -> float:
+        """attempt 번째 실행이 실패한 뒤 대기할 시간 (초)"""
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        return delay * self.random() if self.jitter else delay
+
+    def backoff(self, attempt: int) -> None:
+        """attempt 번째 실행 실패 후 대기"""
+        delay = self.delay(attempt)
+        if delay > 0:
+            self.sleep(delay)
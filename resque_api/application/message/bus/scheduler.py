@@ -0,0 +1,323 @@
+import heapq
+import logging
+import threading
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from typing import Any, Callable
+from uuid import UUID
+
+from resque_api.application.message.bus.exceptions import SchedulerNotConfiguredError
+from resque_api.application.message.common.message import Message
+from resque_api.application.ports.scheduler import ScheduledMessage, TimerStore
+from resque_api.domain.base.identifiers import uuid7
+
+Publisher = Callable[[Message], Any]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SchedulerStats:
+    """스케줄러 통계"""
+
+    pending: int
+    heap_size: int
+    scheduled: int
+    cancelled: int
+    published: int
+    failed: int
+    abandoned: int
+
+
+class MessageScheduler:
+    """지연/예약 메시지 발행 스케줄러
+
+    예약은 (발행 시각, 순번) 최소 힙에 넣고 예약 ID 별 딕셔너리로 관리한다.
+    취소는 딕셔너리에서만 지우고 힙 항목은 꺼낼 때 건너뛰며(지연 삭제),
+    취소된 항목이 힙의 절반을 넘으면 힙을 다시 만든다. 따라서 예약/취소는 O(log n)·O(1) 이고
+    대기 중인 예약이 많아도 항목당 튜플 하나 정도의 메모리만 사용한다.
+
+    store 를 지정하면 예약을 영속화하고 start/load 시 복원한다.
+    발행 후 store 에서 삭제하므로 그 사이에 중단되면 재시작 후 다시 발행된다(최소 한 번).
+
+    발행에 실패한 예약은 실패 횟수에 따라 retry_backoff 초부터 두 배씩 (최대 max_retry_backoff 초)
+    늦춰 다시 예약하고, max_attempts 번 실패하면 메모리에서 포기한다(store 에는 남아 재시작 시 다시 시도).
+    """
+
+    def __init__(
+        self,
+        store: TimerStore | None = None,
+        clock: Callable[[], float] = time.time,
+        on_error: Callable[[ScheduledMessage, Exception], None] | None = None,
+        max_attempts: int = 5,
+        retry_backoff: float = 1.0,
+        max_retry_backoff: float = 60.0,
+    ):
+        """
+        Args:
+            store: 예약 영속 저장소 (None 이면 메모리에만 보관)
+            clock: 현재 시각 (epoch 초)
+            on_error: 발행 실패 시 호출되는 콜백 (없으면 백그라운드 실행 중 실패는 로그로 남김)
+            max_attempts: 예약 하나를 발행하려고 시도할 최대 횟수
+            retry_backoff: 첫 실패 후 재시도까지 대기 시간 (초)
+            max_retry_backoff: 재시도 대기 시간 상한 (초)
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if retry_backoff < 0 or max_retry_backoff < 0:
+            raise ValueError("retry_backoff must not be negative")
+
+        self.store = store
+        self.clock = clock
+        self.on_error = on_error
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+
+        self._publisher: Publisher | None = None
+        self._background_publisher: Publisher | None = None
+        self._heap: list[tuple[float, int, UUID]] = []
+        self._timers: dict[UUID, ScheduledMessage] = {}
+        self._sequence = 0
+        self._changed = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._running = False
+        self._scheduled = 0
+        self._cancelled = 0
+        self._published = 0
+        self._failed = 0
+        self._abandoned = 0
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def bind(self, publisher: Publisher) -> None:
+        """예약 시각에 메시지를 발행할 함수 연결 (MessageBus 가 호출)"""
+        self._publisher = publisher
+
+    def schedule_at(self, message: Message, when: datetime | float) -> UUID:
+        """when 시각에 메시지 발행 예약
+
+        Args:
+            message: 발행할 메시지
+            when: 시간대가 있는 datetime 또는 epoch 초
+
+        Returns:
+            UUID: 예약 ID
+        """
+        if isinstance(when, datetime):
+            if when.tzinfo is None:
+                raise ValueError("when must be timezone-aware")
+            when = when.timestamp()
+
+        timer = ScheduledMessage(id=uuid7(), due_at=when, message=message)
+        if self.store is not None:
+            self.store.add(timer)
+        with self._changed:
+            self._push(timer)
+            self._scheduled += 1
+            self._changed.notify()
+        return timer.id
+
+    def schedule_after(self, message: Message, delay: timedelta | float) -> UUID:
+        """delay 후 메시지 발행 예약
+
+        Args:
+            message: 발행할 메시지
+            delay: timedelta 또는 초
+
+        Returns:
+            UUID: 예약 ID
+        """
+        seconds = delay.total_seconds() if isinstance(delay, timedelta) else delay
+        return self.schedule_at(message, self.clock() + seconds)
+
+    def cancel(self, timer_id: UUID) -> bool:
+        """예약 취소
+
+        Returns:
+            bool: 취소할 예약이 있었는지 여부
+        """
+        with self._changed:
+            if self._timers.pop(timer_id, None) is None:
+                return False
+            self._cancelled += 1
+            if len(self._heap) > 64 and len(self._timers) < len(self._heap) // 2:
+                self._rebuild_heap()
+
+        if self.store is not None:
+            self.store.remove([timer_id])
+        return True
+
+    def next_due(self) -> float | None:
+        """가장 빠른 예약의 발행 시각 (없으면 None)"""
+        with self._changed:
+            self._discard_cancelled()
+            return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float | None = None) -> list[ScheduledMessage]:
+        """now 시점까지 발행 시각이 된 예약을 시각 순서대로 꺼냄 (발행은 하지 않음)"""
+        now = self.clock() if now is None else now
+        due = []
+        with self._changed:
+            while self._heap and self._heap[0][0] <= now:
+                _, _, timer_id = heapq.heappop(self._heap)
+                timer = self._timers.pop(timer_id, None)
+                if timer is not None:
+                    due.append(timer)
+        return due
+
+    def run_due(self, now: float | None = None) -> int:
+        """발행 시각이 된 예약을 연결된 발행 함수로 발행
+
+        발행에 실패한 예약은 다시 예약하며, on_error 가 없으면 첫 번째 예외를 다시 발생시킨다.
+
+        Returns:
+            int: 발행한 메시지 수
+        """
+        if self._publisher is None:
+            raise SchedulerNotConfiguredError("발행 함수가 연결되지 않았습니다")
+
+        published, failures = self._publish_due(self._publisher, now)
+        if failures and self.on_error is None:
+            raise failures[0][1]
+        return published
+
+    def load(self) -> int:
+        """store 에 남아 있는 예약 복원
+
+        Returns:
+            int: 복원한 예약 수
+        """
+        if self.store is None:
+            return 0
+
+        restored = 0
+        with self._changed:
+            for timer in self.store.load_pending():
+                if timer.id not in self._timers:
+                    self._push(timer)
+                    restored += 1
+            self._changed.notify()
+        return restored
+
+    def stats(self) -> SchedulerStats:
+        """스케줄러 통계"""
+        with self._changed:
+            return SchedulerStats(
+                pending=len(self._timers),
+                heap_size=len(self._heap),
+                scheduled=self._scheduled,
+                cancelled=self._cancelled,
+                published=self._published,
+                failed=self._failed,
+                abandoned=self._abandoned,
+            )
+
+    def start(self, publisher: Publisher) -> None:
+        """store 의 예약을 복원하고 백그라운드 스레드에서 publisher 로 발행 시작
+
+        MessageBus 는 스레드 안전하지 않으므로 publisher 는 예약을 받는 버스가 아닌
+        백그라운드 스레드 전용 버스(별도 UnitOfWork)의 publish 여야 한다.
+        """
+        if publisher == self._publisher:
+            raise SchedulerNotConfiguredError("백그라운드 발행에는 연결된 버스와 다른 전용 발행 함수가 필요합니다")
+        if self._running:
+            return
+
+        self.load()
+        self._background_publisher = publisher
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="message-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """백그라운드 발행 중지 (예약은 유지)"""
+        with self._changed:
+            self._running = False
+            self._changed.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            with self._changed:
+                if not self._running:
+                    return
+                self._discard_cancelled()
+                timeout = self._heap[0][0] - self.clock() if self._heap else None
+                if timeout is None or timeout > 0:
+                    self._changed.wait(timeout)
+                    continue
+
+            try:
+                _, failures = self._publish_due(self._background_publisher, None)
+            except Exception:
+                logger.exception("Scheduler failed to publish due messages")
+                continue
+            if self.on_error is None:
+                for timer, error in failures:
+                    logger.error("Scheduled message %s failed", timer.id, exc_info=error)
+
+    def _publish_due(
+        self, publisher: Publisher, now: float | None
+    ) -> tuple[int, list[tuple[ScheduledMessage, Exception]]]:
+        """발행 시각이 된 예약을 발행하고 (발행 수, 실패한 예약과 예외) 반환
+
+        발행 후 store 삭제에 실패한 예약은 이미 발행됐으므로 다시 예약하지 않고 실패로만 보고한다.
+        """
+        published, failures = 0, []
+        for timer in self.pop_due(now):
+            try:
+                publisher(timer.message)
+            except Exception as e:
+                failures.append((timer, e))
+                self._retry(timer)
+                self._notify_error(timer, e)
+                continue
+
+            published += 1
+            if self.store is not None:
+                try:
+                    self.store.remove([timer.id])
+                except Exception as e:
+                    failures.append((timer, e))
+                    self._notify_error(timer, e)
+
+        with self._changed:
+            self._published += published
+        return published, failures
+
+    def _notify_error(self, timer: ScheduledMessage, error: Exception) -> None:
+        if self.on_error is None:
+            return
+        try:
+            self.on_error(timer, error)
+        except Exception:
+            logger.exception("on_error callback failed for scheduled message %s", timer.id)
+
+    def _retry(self, timer: ScheduledMessage) -> None:
+        """실패한 예약을 실패 횟수에 따른 대기 시간 뒤로 다시 예약 (max_attempts 번 실패하면 포기)"""
+        with self._changed:
+            self._failed += 1
+            if timer.attempts + 1 >= self.max_attempts:
+                self._abandoned += 1
+                return
+            delay = min(self.max_retry_backoff, self.retry_backoff * 2**timer.attempts)
+            self._push(replace(timer, due_at=self.clock() + delay, attempts=timer.attempts + 1))
+            self._changed.notify()
+
+    def _push(self, timer: ScheduledMessage) -> None:
+        self._timers[timer.id] = timer
+        self._sequence += 1
+        heapq.heappush(self._heap, (timer.due_at, self._sequence, timer.id))
+
+    def _discard_cancelled(self) -> None:
+        while self._heap and self._heap[0][2] not in self._timers:
+            heapq.heappop(self._heap)
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [entry for entry in self._heap if entry[2] in self._timers]
+        heapq.heapify(self._heap)
@@ -3,4 +3,10 @@ from resque_api.application.message.common.message import Message
 
 @dataclass(frozen=True, kw_only=True)
 class Command(Message):
-    ...
\ No newline at end of file
+    """커맨드 메시지
+
+    Attributes:
+        idempotency_key: 클라이언트가 지정한 멱등성 키 (없으면 메시지 id 로 중복을 판단)
+    """
+
+    idempotency_key: str | None = None
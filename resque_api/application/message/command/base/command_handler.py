@@ -7,4 +7,8 @@ C = TypeVar('C', bound=Command)
 
 class CommandHandler(Protocol, Generic[C]):
     def handle(self, command: C, uow: UnitOfWork) -> Any:
-        ...
\ No newline at end of file
+        ...
+
+class AsyncCommandHandler(Protocol, Generic[C]):
+    async def handle(self, command: C, uow: UnitOfWork) -> Any:
+        ...
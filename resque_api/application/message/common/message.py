@@ -1,10 +1,13 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Protocol
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from resque_api.domain.base.clock import utc_now
+from resque_api.domain.base.identifiers import uuid7
 
 @dataclass(frozen=True, kw_only=True)
 class Message(Protocol):
-    id: UUID = field(default_factory=uuid4)
-    occured_at: datetime = field(default_factory=datetime.utcnow())
+    id: UUID = field(default_factory=uuid7)
+    occured_at: datetime = field(default_factory=utc_now)
     
\ No newline at end of file
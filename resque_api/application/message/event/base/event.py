@@ -1,6 +1,8 @@
 from dataclasses import dataclass
+from uuid import UUID
+
 from resque_api.application.message.common.message import Message
 
 @dataclass(frozen=True, kw_only=True)
 class Event(Message):
-    ...
\ No newline at end of file
+    aggregate_id: UUID | None = None
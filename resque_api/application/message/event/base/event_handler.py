@@ -7,4 +7,37 @@ E = TypeVar('E', bound=Event)
 
 class EventHandler(Protocol, Generic[E]):
     def handle(self, event: E, uow: UnitOfWork) -> None:
-        ...
\ No newline at end of file
+        ...
+
+class BatchEventHandler(Protocol, Generic[E]):
+    def handle_batch(self, events: tuple[E, ...], uow: UnitOfWork) -> None:
+        ...
+
+
+class AsyncEventHandler(Protocol, Generic[E]):
+    async def handle(self, event: E, uow: UnitOfWork) -> None:
+        ...
+
+
+class AsyncBatchEventHandler(Protocol, Generic[E]):
+    async def handle_batch(self, events: tuple[E, ...], uow: UnitOfWork) -> None:
+        ...
+
+
+class ProcessEventHandler(EventHandler[E], Protocol):
+    """프로세스 풀에서 실행되는 CPU 집약 이벤트 핸들러
+
+    이 클래스를 명시적으로 상속한 핸들러는 버스에 ProcessHandlerExecutor 가 설정되어 있으면
+    compute 를 워커 프로세스에서 실행하고, 결과는 부모 프로세스의 트랜잭션 안에서 on_result 로 받는다.
+    compute 는 UnitOfWork 에 접근할 수 없으며 핸들러, 이벤트, 결과는 피클 가능해야 한다.
+    """
+
+    def compute(self, event: E) -> Any:
+        ...
+
+    def on_result(self, event: E, result: Any, uow: UnitOfWork) -> None:
+        pass
+
+    def handle(self, event: E, uow: UnitOfWork) -> None:
+        """실행기가 없을 때는 현재 스레드에서 compute 후 on_result 호출"""
+        self.on_result(event, self.compute(event), uow)
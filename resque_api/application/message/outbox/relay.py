@@ -0,0 +1,194 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from resque_api.application.message.bus.message_bus import MessageBus
+from resque_api.application.ports.outbox import Outbox, OutboxEntry
+
+
+@dataclass(frozen=True)
+class RelayStats:
+    """아웃박스 릴레이 통계"""
+
+    polls: int
+    delivered: int
+    failed: int
+    compacted: int
+    dead_lettered: int = 0
+
+
+class OutboxRelay:
+    """아웃박스의 미전달 이벤트를 메시지 버스로 전달하는 릴레이
+
+    batch_size 개씩 기록 순서대로 읽어 bus.publish 로 전달하고, 성공한 이벤트를 한 번에 전달 완료로 표시한다.
+    전달 후 표시 전에 중단되면 다음 폴링에서 다시 전달하므로 최소 한 번(at-least-once) 전달이며,
+    이벤트 핸들러는 중복 수신에 대비해 멱등해야 한다.
+    전달에 실패하면 순서를 지키기 위해 그 배치의 나머지를 미루고, 실패한 이벤트는 실패 횟수에 따라
+    retry_backoff 초부터 두 배씩 (최대 max_retry_backoff 초) 늦춰 다시 전달한다.
+    max_attempts 번 실패한 이벤트는 데드레터로 옮기고 뒤의 이벤트를 이어서 전달한다.
+
+    전달 완료 후 retention 초가 지난 행은 compact_interval 초마다 삭제한다.
+    """
+
+    def __init__(
+        self,
+        outbox: Outbox,
+        bus: MessageBus,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        retention: float = 3600.0,
+        compact_interval: float = 60.0,
+        clock: Callable[[], float] = time.time,
+        on_error: Callable[[OutboxEntry | None, Exception], None] | None = None,
+        max_attempts: int = 5,
+        retry_backoff: float = 1.0,
+        max_retry_backoff: float = 60.0,
+    ):
+        """
+        Args:
+            outbox: 아웃박스 (백그라운드 실행 시 릴레이 스레드에서 사용할 수 있어야 함)
+            bus: 이벤트를 전달할 메시지 버스
+            batch_size: 한 번에 읽어 전달할 최대 이벤트 수
+            poll_interval: 전달할 이벤트가 없을 때 다음 폴링까지 대기 시간 (초)
+            retention: 전달 완료된 행을 보관하는 시간 (초)
+            compact_interval: 정리 주기 (초)
+            clock: 정리 기준 시각에 사용할 시계 (epoch 초)
+            on_error: 전달 실패 시 호출되는 콜백 (폴링 자체가 실패하면 entry 는 None)
+            max_attempts: 데드레터로 옮기기 전까지 전달을 시도할 최대 횟수
+            retry_backoff: 첫 실패 후 재시도까지 대기 시간 (초)
+            max_retry_backoff: 재시도 대기 시간 상한 (초)
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if poll_interval <= 0:
+            raise ValueError("poll_interval must be positive")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if retry_backoff < 0 or max_retry_backoff < 0:
+            raise ValueError("retry_backoff must not be negative")
+
+        self.outbox = outbox
+        self.bus = bus
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self.compact_interval = compact_interval
+        self.clock = clock
+        self.on_error = on_error
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._last_compacted_at = clock()
+        self._polls = 0
+        self._delivered = 0
+        self._failed = 0
+        self._compacted = 0
+        self._dead_lettered = 0
+
+    def run_once(self) -> int:
+        """미전달 이벤트를 한 배치 전달
+
+        Returns:
+            int: 전달한 이벤트 수
+        """
+        entries = self.outbox.fetch_pending(self.batch_size)
+        delivered: list[int] = []
+        try:
+            for entry in entries:
+                try:
+                    self.bus.publish(entry.event)
+                except Exception as e:
+                    dead = entry.attempts + 1 >= self.max_attempts
+                    if dead:
+                        self.outbox.mark_dead(entry.id, repr(e))
+                    else:
+                        self.outbox.mark_failed(entry.id, repr(e), self._backoff(entry.attempts))
+                    with self._lock:
+                        self._failed += 1
+                        if dead:
+                            self._dead_lettered += 1
+                    if self.on_error is not None:
+                        self.on_error(entry, e)
+                    if dead:
+                        continue
+                    break
+                delivered.append(entry.id)
+        finally:
+            if delivered:
+                self.outbox.mark_delivered(delivered)
+            with self._lock:
+                self._polls += 1
+                self._delivered += len(delivered)
+
+        return len(delivered)
+
+    def _backoff(self, attempts: int) -> float:
+        """attempts 번 실패한 뒤의 재시도 대기 시간 (초)"""
+        return min(self.max_retry_backoff, self.retry_backoff * 2**attempts)
+
+    def compact(self) -> int:
+        """보관 기간이 지난 전달 완료 행 삭제
+
+        Returns:
+            int: 삭제한 행 수
+        """
+        now = self.clock()
+        removed = self.outbox.compact(now - self.retention)
+        with self._lock:
+            self._last_compacted_at = now
+            self._compacted += removed
+        return removed
+
+    def stats(self) -> RelayStats:
+        """릴레이 통계"""
+        with self._lock:
+            return RelayStats(
+                polls=self._polls,
+                delivered=self._delivered,
+                failed=self._failed,
+                compacted=self._compacted,
+                dead_lettered=self._dead_lettered,
+            )
+
+    def start(self) -> None:
+        """백그라운드 스레드에서 폴링 시작"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="outbox-relay", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """폴링 중지 (진행 중인 배치는 끝까지 처리)"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> "OutboxRelay":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            delivered = 0
+            try:
+                delivered = self.run_once()
+                if self.clock() - self._last_compacted_at >= self.compact_interval:
+                    self.compact()
+            except Exception as e:
+                if self.on_error is not None:
+                    self.on_error(None, e)
+
+            # 배치가 가득 찼다면 밀린 이벤트가 더 있을 수 있으므로 기다리지 않고 이어서 폴링한다.
+            if delivered < self.batch_size:
+                self._stop.wait(self.poll_interval)
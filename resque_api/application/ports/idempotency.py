@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+
+@dataclass(frozen=True)
+class IdempotencyRecord:
+    """처리 완료된 커맨드의 저장된 결과
+
+    Attributes:
+        result: 커맨드 핸들러 반환값
+        stored_at: 저장 시각 (저장소 시계 기준 초)
+    """
+
+    result: Any
+    stored_at: float
+
+
+class IdempotencyStore(Protocol):
+    """멱등성 키별 커맨드 결과 저장소 포트
+
+    만료되었거나 제거된 키는 저장된 적 없는 키와 같이 취급한다.
+    """
+
+    def get(self, key: str) -> IdempotencyRecord | None:
+        """키의 저장된 결과 조회 (없으면 None)"""
+        ...
+
+    def put(self, key: str, result: Any) -> None:
+        """키의 결과 저장"""
+        ...
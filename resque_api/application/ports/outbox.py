@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from typing import Iterable, Protocol
+
+from resque_api.application.message.event.base.event import Event
+
+
+@dataclass(frozen=True)
+class OutboxEntry:
+    """아웃박스에 기록된 전달 대기 이벤트
+
+    Attributes:
+        id: 아웃박스 내 순번 (기록 순서)
+        event: 복원된 이벤트
+        attempts: 지금까지 전달에 실패한 횟수
+    """
+
+    id: int
+    event: Event
+    attempts: int = 0
+
+
+class EventSerializer(Protocol):
+    """이벤트 직렬화 포트"""
+
+    def serialize(self, event: Event) -> tuple[str, bytes]:
+        """이벤트를 (이벤트 타입 이름, 페이로드) 로 변환"""
+        ...
+
+    def deserialize(self, event_type: str, payload: bytes) -> Event:
+        """(이벤트 타입 이름, 페이로드) 를 이벤트로 복원"""
+        ...
+
+
+class Outbox(Protocol):
+    """트랜잭셔널 아웃박스 포트
+
+    add 는 호출자의 트랜잭션 안에서 기록만 하고 커밋하지 않는다.
+    따라서 집계 변경과 이벤트 기록은 함께 커밋되거나 함께 롤백된다.
+    나머지 메서드는 릴레이가 사용하며 각자 커밋한다.
+    """
+
+    def add(self, events: Iterable[Event]) -> None:
+        """현재 트랜잭션에 이벤트 기록"""
+        ...
+
+    def fetch_pending(self, limit: int) -> list[OutboxEntry]:
+        """전달되지 않은 이벤트를 기록 순서대로 최대 limit 개 조회
+
+        순서를 지키기 위해 재시도 대기 중인 이벤트와 그 뒤의 이벤트는 조회하지 않는다.
+        데드레터로 옮겨진 이벤트는 제외하며, 복원할 수 없는 행은 데드레터로 옮기고 건너뛴다.
+        """
+        ...
+
+    def mark_delivered(self, entry_ids: Iterable[int]) -> None:
+        """이벤트를 전달 완료로 표시"""
+        ...
+
+    def mark_failed(self, entry_id: int, error: str, retry_after: float = 0.0) -> None:
+        """전달 실패 횟수와 마지막 오류를 기록하고 retry_after 초 뒤로 재시도를 미룸"""
+        ...
+
+    def mark_dead(self, entry_id: int, error: str) -> None:
+        """더 이상 재시도하지 않도록 이벤트를 데드레터로 옮김"""
+        ...
+
+    def compact(self, delivered_before: float) -> int:
+        """delivered_before (epoch 초) 이전에 전달된 이벤트 삭제
+
+        Returns:
+            int: 삭제한 이벤트 수
+        """
+        ...
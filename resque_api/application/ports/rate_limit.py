@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from typing import Protocol
+
+
+@dataclass(frozen=True)
+class TokenBucketPolicy:
+    """토큰 버킷 정책
+
+    Attributes:
+        capacity: 버킷에 담을 수 있는 최대 토큰 수 (허용 버스트 크기)
+        refill_per_second: 초당 채워지는 토큰 수
+    """
+
+    capacity: float
+    refill_per_second: float
+
+    def __post_init__(self):
+        if self.capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if self.refill_per_second <= 0:
+            raise ValueError("refill_per_second must be positive")
+
+
+@dataclass(frozen=True)
+class BucketDecision:
+    """토큰 소비 결과
+
+    Attributes:
+        allowed: 토큰 소비 성공 여부
+        retry_after: 다음 토큰을 얻을 수 있을 때까지 남은 시간 (초)
+    """
+
+    allowed: bool
+    retry_after: float = 0.0
+
+
+class TokenBucketStore(Protocol):
+    """토큰 버킷 상태 저장소 포트
+
+    키별 버킷 상태를 보관하며, 토큰 보충과 소비를 원자적으로 수행해야 한다.
+    """
+
+    def consume(self, key: str, policy: TokenBucketPolicy, tokens: float = 1.0) -> BucketDecision:
+        """키의 버킷에서 토큰 소비
+
+        Args:
+            key: 버킷 식별 키
+            policy: 버킷 정책
+            tokens: 소비할 토큰 수
+
+        Returns:
+            BucketDecision: 소비 결과
+        """
+        ...
@@ -5,3 +5,14 @@ class AggregateNotFoundError(Exception):
 class DeleteNonExistentAggregateError(Exception):
     """존재하지 않는 Aggregate를 삭제하려고 할 때 발생하는 예외"""
     ...
+
+class ConcurrencyConflictError(Exception):
+    """다른 트랜잭션이 먼저 Aggregate를 수정하거나 삭제해 버전이 맞지 않을 때 발생하는 예외"""
+    def __init__(self, aggregate_id, expected_version):
+        super().__init__(f"{aggregate_id} was modified concurrently (expected version {expected_version})")
+        self.aggregate_id = aggregate_id
+        self.expected_version = expected_version
+
+class InvalidPageCursorError(Exception):
+    """페이지 커서를 해석할 수 없거나 정렬 기준이 다를 때 발생하는 예외"""
+    ...
@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+from typing import Any, Hashable
+
+from resque_api.domain.base.aggregate import Aggregate
+
+
+@dataclass(frozen=True)
+class IdentityMapStats:
+    """아이덴티티 맵 통계"""
+
+    size: int
+    hits: int
+    misses: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class IdentityMap:
+    """트랜잭션 동안 불러온 애그리거트를 ID 별로 보관
+
+    UnitOfWork 가 하나씩 소유하고 저장소가 get/save/update/delete 시 참조한다.
+    같은 트랜잭션에서 같은 ID 를 다시 조회하면 저장소를 거치지 않고 보관된 인스턴스를 돌려준다.
+    애그리거트는 불변이므로 인스턴스를 공유해도 안전하다.
+    가장 바깥 트랜잭션이 끝나거나 세이브포인트가 롤백되면 비운다. 히트/미스 카운터는 비워도 유지된다.
+    """
+
+    def __init__(self):
+        self._aggregates: dict[tuple[Hashable, Any], Aggregate] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._aggregates)
+
+    def __contains__(self, key: tuple[Hashable, Any]) -> bool:
+        return key in self._aggregates
+
+    def get(self, key: tuple[Hashable, Any]) -> Aggregate | None:
+        """보관된 애그리거트 조회 (히트/미스 집계)
+
+        Args:
+            key: (저장소 구분값, 애그리거트 ID)
+        """
+        aggregate = self._aggregates.get(key)
+        if aggregate is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return aggregate
+
+    def peek(self, key: tuple[Hashable, Any]) -> Aggregate | None:
+        """보관된 애그리거트 조회 (집계하지 않음)"""
+        return self._aggregates.get(key)
+
+    def add(self, key: tuple[Hashable, Any], aggregate: Aggregate) -> None:
+        """애그리거트 보관 (같은 키가 있으면 교체)"""
+        self._aggregates[key] = aggregate
+
+    def track(self, key: tuple[Hashable, Any], aggregate: Aggregate) -> Aggregate:
+        """보관된 인스턴스가 있으면 그것을, 없으면 aggregate 를 보관하고 반환 (집계하지 않음)"""
+        return self._aggregates.setdefault(key, aggregate)
+
+    def discard(self, key: tuple[Hashable, Any]) -> None:
+        """애그리거트 제거"""
+        self._aggregates.pop(key, None)
+
+    def clear(self) -> None:
+        """보관된 애그리거트 모두 제거"""
+        self._aggregates.clear()
+
+    def stats(self) -> IdentityMapStats:
+        """아이덴티티 맵 통계"""
+        return IdentityMapStats(size=len(self._aggregates), hits=self._hits, misses=self._misses)
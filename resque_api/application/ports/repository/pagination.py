@@ -0,0 +1,85 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Generic, TypeVar
+from uuid import UUID
+
+from resque_api.application.ports.repository.exceptions import InvalidPageCursorError
+
+T = TypeVar("T")
+
+PAGE_ORDERINGS = ("id", "created_at")
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """키셋 페이지네이션 위치 (마지막으로 반환한 항목의 정렬 값과 ID)
+
+    정렬 값이 같은 항목은 ID 로 순서를 정하므로 (value, id) 가 항상 유일한 위치가 된다.
+    """
+
+    order_by: str
+    value: Any
+    id: Any
+
+    def encode(self) -> str:
+        """URL 에 그대로 쓸 수 있는 불투명한 문자열로 인코딩"""
+        payload = json.dumps([self.order_by, _dump(self.value), _dump(self.id)], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str, order_by: str) -> "PageCursor":
+        """encode 결과를 해석 (정렬 기준이 다르면 InvalidPageCursorError)"""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            cursor_order_by, value, id = json.loads(base64.urlsafe_b64decode(padded))
+            decoded = cls(order_by=cursor_order_by, value=_load(value), id=_load(id))
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError) as e:
+            raise InvalidPageCursorError(f"Invalid page cursor: {cursor!r}") from e
+
+        if decoded.order_by != order_by:
+            raise InvalidPageCursorError(f"Cursor ordered by {decoded.order_by}, not {order_by}")
+        return decoded
+
+    @classmethod
+    def after(cls, item: Any, order_by: str) -> "PageCursor":
+        """item 바로 다음 위치"""
+        return cls(order_by=order_by, value=getattr(item, order_by), id=item.id)
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """키셋 페이지
+
+    Attributes:
+        items: 이 페이지의 항목
+        next_cursor: 다음 페이지 커서 (마지막 페이지면 None)
+    """
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+def _dump(value: Any) -> list:
+    if isinstance(value, UUID):
+        return ["uuid", str(value)]
+    if isinstance(value, datetime):
+        return ["datetime", value.isoformat()]
+    return ["raw", value]
+
+
+def _load(value: list) -> Any:
+    kind, raw = value
+    if kind == "uuid":
+        return UUID(raw)
+    if kind == "datetime":
+        return datetime.fromisoformat(raw)
+    if kind == "raw":
+        return raw
+    raise ValueError(f"Unknown cursor value kind: {kind}")
@@ -1,28 +1,197 @@
-from typing import Protocol
-from resque_api.application.ports.repository.exceptions import AggregateNotFoundError, DeleteNonExistentAggregateError
+from dataclasses import dataclass, field, replace
+from typing import Any, Hashable, Iterable, Iterator, Protocol
+from resque_api.application.ports.repository.exceptions import (
+    AggregateNotFoundError,
+    ConcurrencyConflictError,
+    DeleteNonExistentAggregateError,
+)
+from resque_api.application.ports.repository.identity_map import IdentityMap
+from resque_api.application.ports.repository.pagination import PAGE_ORDERINGS, Page, PageCursor
 from resque_api.domain.base.aggregate import Aggregate
 
 
+@dataclass(frozen=True)
+class GetManyResult:
+    """get_many 결과
+
+    Attributes:
+        found: 찾은 애그리거트 (요청한 ID 순서)
+        missing: 찾지 못한 ID (요청한 순서)
+    """
+
+    found: list[Aggregate] = field(default_factory=list)
+    missing: list[Any] = field(default_factory=list)
+
+
 class Repository(Protocol):
+    """애그리거트 저장소 포트
+
+    identity_map 이 연결되어 있으면(UnitOfWork 가 저장소를 만들 때 전달) 같은 트랜잭션에서
+    한 ID 는 한 번만 불러오고 이후 get 은 보관된 인스턴스를 반환한다.
+
+    update/delete 는 애그리거트의 version 을 조건으로 한 문장으로 실행되며(낙관적 동시성 제어),
+    그 사이 다른 트랜잭션이 먼저 수정했다면 ConcurrencyConflictError 를 발생시킨다.
+    """
+
+    identity_map: IdentityMap | None = None
+
     def save(self, aggregate: Aggregate) -> None:
         self._save(aggregate)
+        self._remember(aggregate)
 
     def get(self, aggregate_id: str) -> Aggregate | None:
+        identity_map = self.identity_map
+        if identity_map is not None:
+            tracked = identity_map.get(self._identity_key(aggregate_id))
+            if tracked is not None:
+                return tracked
+
         aggregate = self._get(aggregate_id)
         if not aggregate:
             raise AggregateNotFoundError(f"{aggregate_id} not found")
+        self._remember(aggregate)
         return aggregate
 
     def find_all(self) -> list[Aggregate]:
-        return self._find_all()
+        aggregates = self._find_all()
+        identity_map = self.identity_map
+        if identity_map is None:
+            return aggregates
+        return [identity_map.track(self._identity_key(a.id), a) for a in aggregates]
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[Aggregate]:
+        """모든 애그리거트를 ID 순서로 스트리밍
+
+        저장소에서 batch_size 개씩 가져오므로 전체를 메모리에 올리지 않는다.
+        불러온 애그리거트는 아이덴티티 맵에 보관하지 않는다(이미 보관된 ID 는 보관된 인스턴스를 반환).
+        저장소 연결을 사용하므로 트랜잭션 안에서 끝까지 소비해야 한다.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        identity_map = self.identity_map
+        for aggregate in self._iter_all(batch_size):
+            if identity_map is not None:
+                aggregate = identity_map.peek(self._identity_key(aggregate.id)) or aggregate
+            yield aggregate
+
+    def page(self, after: str | None = None, limit: int = 100, order_by: str = "id") -> Page[Aggregate]:
+        """키셋 페이지네이션
+
+        (order_by, id) 순서로 after 커서 다음부터 limit 개를 반환한다. OFFSET 을 쓰지 않으므로
+        페이지 위치와 관계없이 조회 비용이 같고, 페이지 사이에 추가/삭제가 있어도 항목이 중복되거나 빠지지 않는다.
+
+        Args:
+            after: 이전 페이지의 next_cursor (None 이면 첫 페이지)
+            limit: 페이지 크기
+            order_by: 정렬 기준 ("id" 또는 "created_at")
+        """
+        if order_by not in PAGE_ORDERINGS:
+            raise ValueError(f"order_by must be one of {PAGE_ORDERINGS}")
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+
+        cursor = PageCursor.decode(after, order_by) if after is not None else None
+        aggregates = self._page(cursor, limit + 1, order_by)
+        items = aggregates[:limit]
+        next_cursor = PageCursor.after(items[-1], order_by).encode() if len(aggregates) > limit else None
+        return Page(items=items, next_cursor=next_cursor)
     
-    def update(self, aggregate: Aggregate) -> None:
-        self._update(aggregate)
+    def update(self, aggregate: Aggregate) -> Aggregate:
+        """애그리거트 수정
+
+        Returns:
+            Aggregate: 저장된 애그리거트 (version 이 1 증가). 같은 트랜잭션에서 다시 수정할 때는 이 값을 사용한다
+        """
+        if not self._update(aggregate):
+            # 갱신된 행이 없을 때 애그리거트가 남아 있으면 버전 충돌, 없으면 재시도해도 성공할 수 없는 조회 실패다.
+            if isinstance(aggregate, Aggregate) and self._get(aggregate.id):
+                raise ConcurrencyConflictError(aggregate.id, aggregate.version)
+            raise AggregateNotFoundError(f"{aggregate.id} not found")
+
+        stored = _next_version(aggregate)
+        self._remember(stored)
+        return stored
+
+    def delete(self, aggregate_id: str, expected_version: int | None = None) -> None:
+        """애그리거트 삭제
+
+        expected_version 이 없으면 이 트랜잭션에서 불러온 인스턴스의 version 을 조건으로 사용한다.
+        """
+        identity_map = self.identity_map
+        key = self._identity_key(aggregate_id)
+        if expected_version is None and identity_map is not None:
+            expected_version = getattr(identity_map.peek(key), "version", None)
 
-    def delete(self, aggregate_id: str) -> None:
-        if not self._get(aggregate_id):
-            raise DeleteNonExistentAggregateError(f"{aggregate_id} not found")
-        self._delete(aggregate_id)
+        if expected_version is None:
+            deleted = self._delete(aggregate_id)
+        else:
+            deleted = self._delete(aggregate_id, expected_version)
+
+        if identity_map is not None:
+            identity_map.discard(key)
+        if deleted:
+            return
+        if expected_version is not None and self._get(aggregate_id):
+            raise ConcurrencyConflictError(aggregate_id, expected_version)
+        raise DeleteNonExistentAggregateError(f"{aggregate_id} not found")
+
+    def get_many(self, aggregate_ids: Iterable[str]) -> GetManyResult:
+        """여러 애그리거트를 한 번에 조회
+
+        없는 ID 는 예외 대신 결과의 missing 에 모아 반환한다. 중복 ID 는 한 번만 조회한다.
+        """
+        requested = {self._identity_key(aggregate_id): aggregate_id for aggregate_id in aggregate_ids}
+        identity_map = self.identity_map
+        found = {}
+        if identity_map is not None:
+            for key in requested:
+                tracked = identity_map.get(key)
+                if tracked is not None:
+                    found[key] = tracked
+
+        to_load = [aggregate_id for key, aggregate_id in requested.items() if key not in found]
+        if to_load:
+            for aggregate in self._get_many(to_load):
+                self._remember(aggregate)
+                found[self._identity_key(aggregate.id)] = aggregate
+
+        return GetManyResult(
+            found=[found[key] for key in requested if key in found],
+            missing=[aggregate_id for key, aggregate_id in requested.items() if key not in found],
+        )
+
+    def save_many(self, aggregates: Iterable[Aggregate]) -> None:
+        """여러 애그리거트를 한 번에 저장"""
+        aggregates = list(aggregates)
+        if not aggregates:
+            return
+        self._save_many(aggregates)
+        for aggregate in aggregates:
+            self._remember(aggregate)
+
+    def delete_many(self, aggregate_ids: Iterable[str]) -> list[Any]:
+        """여러 애그리거트를 한 번에 삭제
+
+        Returns:
+            list: 존재하지 않아 삭제하지 못한 ID (요청한 순서)
+        """
+        requested = {self._identity_key(aggregate_id): aggregate_id for aggregate_id in aggregate_ids}
+        if not requested:
+            return []
+
+        deleted = {self._identity_key(aggregate_id) for aggregate_id in self._delete_many(list(requested.values()))}
+        if self.identity_map is not None:
+            for key in deleted:
+                self.identity_map.discard(key)
+        return [aggregate_id for key, aggregate_id in requested.items() if key not in deleted]
+
+    def _identity_key(self, aggregate_id: Any) -> tuple[Hashable, Any]:
+        """아이덴티티 맵 키 (저장소마다 구분되며, ID 표현이 여러 가지면 하위 클래스에서 정규화)"""
+        return type(self), aggregate_id
+
+    def _remember(self, aggregate: Aggregate) -> None:
+        if self.identity_map is not None:
+            self.identity_map.add(self._identity_key(aggregate.id), aggregate)
 
     def _save(self, aggregate: Aggregate) -> None:
         ...
@@ -33,8 +202,41 @@ class Repository(Protocol):
     def _find_all(self) -> list[Aggregate]:
         ...
 
-    def _update(self, aggregate: Aggregate) -> None:
+    def _update(self, aggregate: Aggregate) -> bool:
+        """aggregate.version 이 저장된 값과 같을 때만 수정하고 version 을 1 증가. 수정했는지 여부 반환"""
         ...
 
-    def _delete(self, aggregate_id: str) -> None:
+    def _delete(self, aggregate_id: str, expected_version: int | None = None) -> bool:
+        """expected_version 이 있으면 저장된 version 이 같을 때만 삭제. 삭제했는지 여부 반환"""
         ...
+
+    def _get_many(self, aggregate_ids: list[str]) -> list[Aggregate]:
+        """찾은 애그리거트만 반환 (순서 무관). 기본 구현은 _get 을 반복하므로 저장소에서 일괄 조회로 재정의한다"""
+        return [aggregate for aggregate_id in aggregate_ids if (aggregate := self._get(aggregate_id))]
+
+    def _iter_all(self, batch_size: int) -> Iterator[Aggregate]:
+        """ID 순서로 스트리밍. 기본 구현은 _find_all 결과를 정렬하므로 저장소에서 서버 측 커서로 재정의한다"""
+        return iter(sorted(self._find_all(), key=lambda aggregate: aggregate.id))
+
+    def _page(self, cursor: PageCursor | None, limit: int, order_by: str) -> list[Aggregate]:
+        """cursor 다음부터 (order_by, id) 순서로 최대 limit 개. 기본 구현은 _find_all 결과를 메모리에서 정렬한다"""
+        def key(aggregate):
+            return getattr(aggregate, order_by), aggregate.id
+
+        aggregates = sorted(self._find_all(), key=key)
+        if cursor is not None:
+            aggregates = [a for a in aggregates if key(a) > (cursor.value, cursor.id)]
+        return aggregates[:limit]
+
+    def _save_many(self, aggregates: list[Aggregate]) -> None:
+        """기본 구현은 _save 를 반복한다"""
+        for aggregate in aggregates:
+            self._save(aggregate)
+
+    def _delete_many(self, aggregate_ids: list[str]) -> list[Any]:
+        """실제로 삭제한 ID 반환. 기본 구현은 _delete 를 반복한다"""
+        return [aggregate_id for aggregate_id in aggregate_ids if self._delete(aggregate_id)]
+
+
+def _next_version(aggregate: Aggregate) -> Aggregate:
+    return replace(aggregate, version=aggregate.version + 1) if isinstance(aggregate, Aggregate) else aggregate
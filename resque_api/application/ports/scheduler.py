@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from typing import Iterable, Protocol
+from uuid import UUID
+
+from resque_api.application.message.common.message import Message
+
+
+@dataclass(frozen=True)
+class ScheduledMessage:
+    """예약된 메시지
+
+    Attributes:
+        id: 예약 ID (취소에 사용)
+        due_at: 발행 예정 시각 (epoch 초)
+        message: 발행할 메시지
+        attempts: 지금까지 발행에 실패한 횟수
+    """
+
+    id: UUID
+    due_at: float
+    message: Message
+    attempts: int = 0
+
+
+class TimerStore(Protocol):
+    """예약 메시지 영속 저장소 포트
+
+    스케줄러는 예약 시 add, 발행 또는 취소 후 remove 를 호출하고,
+    시작할 때 load_pending 으로 재시작 전에 남아 있던 예약을 복원한다.
+    """
+
+    def add(self, timer: ScheduledMessage) -> None:
+        """예약 저장"""
+        ...
+
+    def remove(self, timer_ids: Iterable[UUID]) -> None:
+        """예약 삭제"""
+        ...
+
+    def load_pending(self) -> list[ScheduledMessage]:
+        """남아 있는 모든 예약 조회"""
+        ...
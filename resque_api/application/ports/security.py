@@ -1,5 +1,28 @@
 from abc import ABC, abstractmethod
-from typing import Protocol
+from dataclasses import dataclass
+from typing import Callable, Generic, Iterable, Iterator, Protocol, TypeVar
+
+T = TypeVar("T")
+
+ProgressCallback = Callable[[int, int], None]
+"""일괄 처리 진행 상황 콜백 (완료 개수, 전체 개수)"""
+
+
+@dataclass(frozen=True)
+class BatchItemResult(Generic[T]):
+    """일괄 처리 항목별 결과
+
+    한 항목의 실패가 나머지 항목에 영향을 주지 않도록 예외를 결과에 담아 반환한다.
+    """
+
+    index: int
+    value: T | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """항목 처리 성공 여부"""
+        return self.error is None
 
 
 class PasswordHasher(Protocol):
@@ -30,3 +53,100 @@ class PasswordHasher(Protocol):
             bool: 검증 결과
         """
         ...
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """저장된 해시를 현재 설정으로 다시 해시해야 하는지 확인
+
+        기본 구현은 재해시가 필요 없다고 판단한다.
+
+        Args:
+            hashed_password: 저장된 해시 비밀번호
+
+        Returns:
+            bool: 재해시 필요 여부
+        """
+        return False
+
+    def hash_many(
+        self,
+        plain_passwords: Iterable[str],
+        on_progress: ProgressCallback | None = None,
+    ) -> Iterator[BatchItemResult[str]]:
+        """여러 비밀번호를 일괄 해시화
+
+        기본 구현은 순차 처리이며, 병렬 처리가 가능한 구현은 이를 재정의한다.
+        결과의 순서는 구현에 따라 다를 수 있으므로 index 로 입력 항목을 식별한다.
+
+        Args:
+            plain_passwords: 평문 비밀번호 목록
+            on_progress: 항목 하나가 끝날 때마다 호출되는 진행 상황 콜백
+
+        Yields:
+            BatchItemResult[str]: 항목별 해시 결과
+        """
+        items = [(password,) for password in plain_passwords]
+        yield from _run_sequential(self.hash, items, on_progress)
+
+    def verify_many(
+        self,
+        credentials: Iterable[tuple[str, str]],
+        on_progress: ProgressCallback | None = None,
+    ) -> Iterator[BatchItemResult[bool]]:
+        """여러 비밀번호를 일괄 검증
+
+        Args:
+            credentials: (평문 비밀번호, 해시 비밀번호) 목록
+            on_progress: 항목 하나가 끝날 때마다 호출되는 진행 상황 콜백
+
+        Yields:
+            BatchItemResult[bool]: 항목별 검증 결과
+        """
+        yield from _run_sequential(self.verify, list(credentials), on_progress)
+
+
+def _run_sequential(
+    fn: Callable[..., T],
+    items: list[tuple],
+    on_progress: ProgressCallback | None,
+) -> Iterator[BatchItemResult[T]]:
+    """항목별 예외를 격리하며 순차 실행"""
+    total = len(items)
+    for index, args in enumerate(items):
+        try:
+            result = BatchItemResult(index=index, value=fn(*args))
+        except Exception as e:
+            result = BatchItemResult(index=index, error=e)
+
+        if on_progress is not None:
+            on_progress(index + 1, total)
+        yield result
+
+
+class AsyncPasswordHasher(PasswordHasher, Protocol):
+    """비동기 비밀번호 해시 처리 포트
+
+    해시 계산을 요청 스레드 밖에서 수행하는 구현을 위한 확장 포트
+    """
+
+    async def hash_async(self, plain_password: str) -> str:
+        """평문 비밀번호를 비동기로 해시화
+
+        Args:
+            plain_password: 평문 비밀번호
+
+        Returns:
+            str: 해시된 비밀번호
+        """
+        ...
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        """비밀번호를 비동기로 검증
+
+        Args:
+            plain_password: 검증할 평문 비밀번호
+            hashed_password: 저장된 해시 비밀번호
+
+        Returns:
+            bool: 검증 결과
+        """
+        ...
@@ -1,23 +1,102 @@
-from typing import Protocol, Optional, Self, Type, Any
+from contextlib import contextmanager
+from typing import Protocol, Optional, Self, Type, Any, Callable, Iterator
 
 from resque_api.application.message.event.base.event import Event
+from resque_api.application.ports.repository.identity_map import IdentityMap
 
 
 class UnitOfWork(Protocol):
+    """트랜잭션 경계 포트
+
+    with 블록은 중첩될 수 있으며, 가장 바깥 블록이 끝날 때만 commit/rollback 한다.
+    따라서 여러 커맨드를 하나의 트랜잭션으로 묶어 실행하면 각 핸들러의 with 블록은
+    커밋하지 않고 바깥 트랜잭션에 합류한다.
+
+    identity_map 은 트랜잭션 동안 저장소가 불러온 애그리거트를 보관하며,
+    가장 바깥 블록이 끝나거나 세이브포인트가 롤백되면 비워진다.
+
+    on_commit/on_rollback 으로 등록한 콜백은 가장 바깥 트랜잭션이 커밋/롤백된 뒤 한 번 실행된다(캐시 무효화 등).
+    """
+
     def __init__(self):
         self.events = []
+        self.identity_map = IdentityMap()
+        self._commit_hooks: list[Callable[[], None]] = []
+        self._rollback_hooks: list[Callable[[], None]] = []
 
     def __enter__(self) -> Self:
+        self._depth = getattr(self, "_depth", 0) + 1
         return self
 
     def __exit__(self,
                  exc_type: Optional[Type[BaseException]],
                  exc_value: Optional[BaseException],
                  tb: Optional[Any]) -> None:
-        if exc_type is None:
-            self.commit()
-        else:
-            self.rollback()
+        self._depth = getattr(self, "_depth", 1) - 1
+        if self._depth > 0:
+            return
+
+        commit_hooks, self._commit_hooks = self._commit_hooks, []
+        rollback_hooks, self._rollback_hooks = self._rollback_hooks, []
+        try:
+            try:
+                if exc_type is None:
+                    self.commit()
+                else:
+                    self.rollback()
+            except BaseException:
+                # 커밋이 실패해도 롤백과 같이 처리해야 실패한 트랜잭션의 이벤트가 다음 커밋에 섞이지 않는다.
+                self.events.clear()
+                _run_hooks(rollback_hooks)
+                raise
+
+            if exc_type is None:
+                _run_hooks(commit_hooks)
+            else:
+                self.events.clear()
+                _run_hooks(rollback_hooks)
+        finally:
+            self.identity_map.clear()
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """가장 바깥 트랜잭션이 커밋된 뒤 실행할 콜백 등록 (트랜잭션 밖이면 바로 실행)"""
+        if not self.in_transaction:
+            callback()
+            return
+        self._commit_hooks.append(callback)
+
+    def on_rollback(self, callback: Callable[[], None]) -> None:
+        """트랜잭션이 롤백된 뒤 실행할 콜백 등록 (세이브포인트 롤백 시 그 안에서 등록한 콜백도 실행)"""
+        if self.in_transaction:
+            self._rollback_hooks.append(callback)
+
+    @property
+    def in_transaction(self) -> bool:
+        """with 블록 안에 있는지 여부"""
+        return getattr(self, "_depth", 0) > 0
+
+    @contextmanager
+    def savepoint(self) -> Iterator[None]:
+        """세이브포인트
+
+        블록 안에서 예외가 발생하면 블록 이전 상태로 되돌리고 예외를 다시 발생시킨다.
+        블록에서 발행된 이벤트와 등록된 커밋 콜백도 함께 버려지고, 블록에서 등록된 롤백 콜백은 실행된다.
+        """
+        event_mark = len(self.events)
+        commit_mark, rollback_mark = len(self._commit_hooks), len(self._rollback_hooks)
+        token = self._begin_savepoint()
+        try:
+            yield
+        except BaseException:
+            self._rollback_to_savepoint(token)
+            del self.events[event_mark:]
+            del self._commit_hooks[commit_mark:]
+            rollback_hooks = self._rollback_hooks[rollback_mark:]
+            del self._rollback_hooks[rollback_mark:]
+            self.identity_map.clear()
+            _run_hooks(rollback_hooks)
+            raise
+        self._release_savepoint(token)
 
     def commit(self) -> None:
         ...
@@ -32,3 +111,24 @@ class UnitOfWork(Protocol):
         events = tuple(self.events)
         self.events.clear()
         return events
+
+    def _begin_savepoint(self) -> Any:
+        ...
+
+    def _rollback_to_savepoint(self, token: Any) -> None:
+        ...
+
+    def _release_savepoint(self, token: Any) -> None:
+        ...
+
+
+def _run_hooks(hooks: list[Callable[[], None]]) -> None:
+    """콜백을 모두 실행하고, 실패한 콜백이 있으면 첫 번째 예외를 다시 발생시킴"""
+    error = None
+    for hook in hooks:
+        try:
+            hook()
+        except Exception as e:
+            error = error or e
+    if error is not None:
+        raise error
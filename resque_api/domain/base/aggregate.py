@@ -1,8 +1,13 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from resque_api.domain.base.entity import Entity
 
 
 @dataclass(frozen=True)
 class Aggregate(Entity):
-    ...
+    """애그리거트 루트
+
+    version 은 저장소가 낙관적 동시성 제어에 사용하는 값으로, 저장된 상태가 바뀔 때마다 1 씩 증가한다.
+    """
+
+    version: int = field(default=0, kw_only=True)
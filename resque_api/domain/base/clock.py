@@ -0,0 +1,53 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+_UTC_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class MonotonicUTCClock:
+    """되돌아가지 않는 UTC 시계
+
+    시작 시점의 벽시계 시각에 monotonic 경과 시간을 더해 현재 시각을 계산하므로
+    NTP 보정 등으로 벽시계가 뒤로 가도 반환값은 감소하지 않는다.
+    resync_interval 초마다 벽시계와 다시 맞추되, 이때도 이전 반환값보다 작아지지는 않는다.
+    """
+
+    def __init__(self, resync_interval: float = 60.0, wall_ns=time.time_ns, monotonic_ns=time.monotonic_ns):
+        """
+        Args:
+            resync_interval: 벽시계와 다시 맞추는 주기 (초)
+            wall_ns: Unix epoch 기준 나노초를 반환하는 벽시계
+            monotonic_ns: 단조 증가 나노초 시계
+        """
+        self.resync_interval_ns = int(resync_interval * 1_000_000_000)
+        self.wall_ns = wall_ns
+        self.monotonic_ns = monotonic_ns
+        self._lock = threading.Lock()
+        self._last_us = 0
+        self._sync()
+
+    def __call__(self) -> datetime:
+        return _UTC_EPOCH + timedelta(microseconds=self.now_us())
+
+    def now_us(self) -> int:
+        """Unix epoch 기준 현재 마이크로초"""
+        elapsed = self.monotonic_ns() - self._base_monotonic
+        with self._lock:
+            if elapsed >= self.resync_interval_ns:
+                self._sync()
+                elapsed = self.monotonic_ns() - self._base_monotonic
+
+            now = (self._base_wall + elapsed) // 1000
+            if now < self._last_us:
+                now = self._last_us
+            self._last_us = now
+            return now
+
+    def _sync(self) -> None:
+        self._base_wall = self.wall_ns()
+        self._base_monotonic = self.monotonic_ns()
+
+
+utc_now = MonotonicUTCClock()
+"""프로세스 공용 UTC 시계 (dataclass field default_factory 로 사용)"""
@@ -1,11 +1,13 @@
 from abc import ABC
 from dataclasses import dataclass, field
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from resque_api.domain.base.identifiers import uuid7
 
 @dataclass(frozen=True, kw_only=True)
 class Entity(ABC):
-    id: UUID = field(default_factory=uuid4)
+    id: UUID = field(default_factory=uuid7)
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Entity):
@@ -0,0 +1,55 @@
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from uuid import UUID
+
+_COUNTER_MAX = 0xFFF
+_RAND_B_MASK = (1 << 62) - 1
+
+
+class UUIDv7Generator:
+    """단조 증가 UUIDv7 생성기 (RFC 9562)
+
+    상위 48비트는 Unix 밀리초 타임스탬프, rand_a 12비트는 같은 밀리초 안의 카운터, 나머지 62비트는 난수다.
+    같은 생성기에서 만든 ID 는 생성 순서대로 정렬되므로 B-tree 인덱스 키로 쓰면 항상 끝에 추가된다.
+    시계가 뒤로 가거나 한 밀리초 안에 카운터가 넘치면 마지막 타임스탬프를 1ms 씩 앞당겨 순서를 유지한다.
+    """
+
+    def __init__(self, clock_ns=time.time_ns):
+        """
+        Args:
+            clock_ns: Unix epoch 기준 나노초를 반환하는 시계
+        """
+        self.clock_ns = clock_ns
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._counter = 0
+
+    def __call__(self) -> UUID:
+        now_ms = self.clock_ns() // 1_000_000
+        with self._lock:
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                # 카운터 시작값을 절반 범위 안에서 무작위로 잡아 추측하기 어렵게 하면서 증가 여유를 남긴다.
+                self._counter = int.from_bytes(os.urandom(2)) & 0x7FF
+            elif self._counter < _COUNTER_MAX:
+                self._counter += 1
+            else:
+                self._last_ms += 1
+                self._counter = 0
+            ms, counter = self._last_ms, self._counter
+
+        rand_b = int.from_bytes(os.urandom(8)) & _RAND_B_MASK
+        return UUID(int=(ms << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | rand_b)
+
+
+def uuid7_timestamp(value: UUID) -> datetime:
+    """UUIDv7 에 기록된 생성 시각 (밀리초 정밀도, UTC)"""
+    if value.version != 7:
+        raise ValueError(f"Not a UUIDv7: {value}")
+    return datetime.fromtimestamp((value.int >> 80) / 1000, timezone.utc)
+
+
+uuid7 = UUIDv7Generator()
+"""프로세스 공용 UUIDv7 생성기 (dataclass field default_factory 로 사용)"""
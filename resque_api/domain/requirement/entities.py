@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field, replace
 from datetime import datetime
 from typing import Dict, List, Self
-from uuid import UUID, uuid4
+from uuid import UUID
 
+from resque_api.domain.base.clock import utc_now
 from resque_api.domain.base.entity import Entity
 from resque_api.domain.project.entities import ProjectMember
 from resque_api.domain.requirement.exceptions import (
@@ -28,7 +29,7 @@ class RequirementComment(Entity):
     author_id: UUID
     content: str
     
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=utc_now)
 
     def edit_content(self, new_content: str) -> Self:
         """코멘트 내용 수정"""
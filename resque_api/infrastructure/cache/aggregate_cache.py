@@ -0,0 +1,167 @@
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, Iterable
+
+from resque_api.domain.base.entity import Entity
+
+
+@dataclass(frozen=True)
+class AggregateCacheStats:
+    """애그리거트 캐시 통계"""
+
+    size: int
+    bytes: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def pickled_size(aggregate: Entity) -> int:
+    """애그리거트의 대략적인 크기 (pickle 직렬화 길이)"""
+    return len(pickle.dumps(aggregate, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class AggregateCache:
+    """프로세스 메모리 기반 애그리거트 캐시 (LRU + TTL)
+
+    항목 수가 max_entries 를, 또는 항목 크기 합이 max_bytes 를 넘으면 가장 오래 사용되지 않은 항목부터 제거하고,
+    ttl 초가 지난 항목은 조회 시점에 만료 처리한다. 애그리거트는 불변이므로 인스턴스를 그대로 보관한다.
+
+    invalidate 가 호출될 때마다 generation 이 증가한다. 저장소에서 불러오기 전에 읽은 generation 을 put 에 넘기면,
+    그 사이 무효화가 있었을 때 저장하지 않으므로 커밋 전에 읽은 오래된 값이 캐시에 남지 않는다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        max_bytes: int | None = None,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+        sizeof: Callable[[Entity], int] = pickled_size,
+    ):
+        """
+        Args:
+            max_entries: 보관할 최대 항목 수
+            max_bytes: 보관할 항목 크기 합의 상한 (None 이면 제한 없음)
+            ttl: 항목 보관 시간 (초)
+            clock: 단조 증가 시계 (테스트에서 교체 가능)
+            sizeof: 항목 크기 계산 함수 (max_bytes 를 지정했을 때만 사용)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._sizeof = sizeof
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[Entity, float, int]] = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """지금까지의 무효화 횟수"""
+        return self._generation
+
+    def get(self, key: Hashable) -> Entity | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() - entry[1] >= self.ttl:
+                self._remove(key)
+                self._expirations += 1
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, aggregate: Entity, generation: int | None = None) -> bool:
+        """항목 저장
+
+        Args:
+            generation: 불러오기 전에 읽은 generation (그 뒤 무효화가 있었으면 저장하지 않음)
+
+        Returns:
+            bool: 저장했는지 여부
+        """
+        size = self._sizeof(aggregate) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return False
+
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+
+            self._remove(key)
+            self._entries[key] = (aggregate, self._clock(), size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+            return True
+
+    def invalidate(self, keys: Iterable[Hashable]) -> None:
+        """항목 제거 (generation 증가)"""
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                if self._remove(key):
+                    self._invalidations += 1
+
+    def clear(self) -> None:
+        """모든 항목 제거 (generation 증가)"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> AggregateCacheStats:
+        """캐시 통계"""
+        with self._lock:
+            return AggregateCacheStats(
+                size=len(self._entries),
+                bytes=self._bytes,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                invalidations=self._invalidations,
+            )
+
+    def _remove(self, key: Hashable) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[2]
+        return True
@@ -0,0 +1,125 @@
+import threading
+from collections import Counter
+from typing import Any, Hashable, Iterator
+
+from resque_api.application.ports.repository.pagination import PageCursor
+from resque_api.application.ports.repository.repository import Repository
+from resque_api.application.ports.uow import UnitOfWork
+from resque_api.domain.base.entity import Entity
+from resque_api.infrastructure.cache.aggregate_cache import AggregateCache
+
+
+class CachingRepository(Repository):
+    """다른 저장소를 감싸는 읽기 캐시 저장소 (read-through)
+
+    get/get_many 는 캐시에 없는 ID 만 감싼 저장소에서 불러와 캐시에 넣는다.
+    save/update/delete 한 ID 는 트랜잭션이 커밋된 뒤 캐시에서 제거되고, 그 전까지는 캐시를 거치지 않는다
+    (커밋되지 않은 값이 캐시에 들어가거나 오래된 캐시 값을 읽지 않도록).
+    롤백되면 대기 중인 무효화는 버려진다. 다른 프로세스의 변경은 캐시 ttl 이 지나야 반영된다.
+
+    find_all, iter_all, page 는 캐시를 거치지 않는다.
+    """
+
+    def __init__(self, repository: Repository, cache: AggregateCache, uow: UnitOfWork):
+        """
+        Args:
+            repository: 감쌀 저장소
+            cache: 애그리거트 캐시 (여러 저장소가 공유해도 키가 겹치지 않음)
+            uow: 커밋/롤백 시점을 알려줄 UnitOfWork
+        """
+        self.repository = repository
+        self.cache = cache
+        self.uow = uow
+        self.identity_map = repository.identity_map
+        self._dirty: Counter[Hashable] = Counter()
+        self._lock = threading.Lock()
+
+    def _identity_key(self, aggregate_id: Any) -> tuple[Hashable, Any]:
+        return self.repository._identity_key(aggregate_id)
+
+    def _get(self, aggregate_id: Any) -> Entity | None:
+        key = self._identity_key(aggregate_id)
+        if self._is_dirty(key):
+            return self.repository._get(aggregate_id)
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        generation = self.cache.generation
+        aggregate = self.repository._get(aggregate_id)
+        if aggregate is not None:
+            self.cache.put(key, aggregate, generation)
+        return aggregate
+
+    def _get_many(self, aggregate_ids: list[Any]) -> list[Entity]:
+        found, to_load = [], []
+        for aggregate_id in aggregate_ids:
+            key = self._identity_key(aggregate_id)
+            cached = None if self._is_dirty(key) else self.cache.get(key)
+            if cached is None:
+                to_load.append(aggregate_id)
+            else:
+                found.append(cached)
+
+        if to_load:
+            generation = self.cache.generation
+            for aggregate in self.repository._get_many(to_load):
+                key = self._identity_key(aggregate.id)
+                if not self._is_dirty(key):
+                    self.cache.put(key, aggregate, generation)
+                found.append(aggregate)
+        return found
+
+    def _find_all(self) -> list[Entity]:
+        return self.repository._find_all()
+
+    def _iter_all(self, batch_size: int) -> Iterator[Entity]:
+        return self.repository._iter_all(batch_size)
+
+    def _page(self, cursor: PageCursor | None, limit: int, order_by: str) -> list[Entity]:
+        return self.repository._page(cursor, limit, order_by)
+
+    def _save(self, aggregate: Entity) -> None:
+        self._write([aggregate.id], self.repository._save, aggregate)
+
+    def _save_many(self, aggregates: list[Entity]) -> None:
+        self._write([aggregate.id for aggregate in aggregates], self.repository._save_many, aggregates)
+
+    def _update(self, aggregate: Entity) -> bool:
+        return self._write([aggregate.id], self.repository._update, aggregate)
+
+    def _delete(self, aggregate_id: Any, expected_version: int | None = None) -> bool:
+        if expected_version is None:
+            return self._write([aggregate_id], self.repository._delete, aggregate_id)
+        return self._write([aggregate_id], self.repository._delete, aggregate_id, expected_version)
+
+    def _delete_many(self, aggregate_ids: list[Any]) -> list[Any]:
+        return self._write(aggregate_ids, self.repository._delete_many, aggregate_ids)
+
+    def _write(self, aggregate_ids: list[Any], write, *args) -> Any:
+        """쓰기 전에 캐시 항목을 제거하고 ID 를 dirty 로 표시, 커밋/롤백 시 표시 해제 (커밋이면 다시 제거)
+
+        쓰기가 충돌로 실패해도 캐시 값이 오래된 것이므로 미리 제거해 두면 재시도 시 저장소에서 다시 읽는다.
+        """
+        keys = [self._identity_key(aggregate_id) for aggregate_id in aggregate_ids]
+        self.cache.invalidate(keys)
+        if not self.uow.in_transaction:
+            return write(*args)
+
+        with self._lock:
+            self._dirty.update(keys)
+        self.uow.on_commit(lambda: self._settle(keys, invalidate=True))
+        self.uow.on_rollback(lambda: self._settle(keys, invalidate=False))
+        return write(*args)
+
+    def _settle(self, keys: list[Hashable], invalidate: bool) -> None:
+        with self._lock:
+            self._dirty.subtract(keys)
+            self._dirty = +self._dirty
+        if invalidate:
+            self.cache.invalidate(keys)
+
+    def _is_dirty(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._dirty[key] > 0
@@ -0,0 +1,86 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from resque_api.application.ports.idempotency import IdempotencyRecord, IdempotencyStore
+
+
+@dataclass(frozen=True)
+class IdempotencyStoreStats:
+    """멱등성 저장소 통계"""
+
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+    """프로세스 메모리 기반 멱등성 저장소 (LRU + TTL)
+
+    키 수가 max_entries 를 넘으면 가장 오래 사용되지 않은 키부터 제거하고,
+    ttl 초가 지난 키는 조회 시점에 만료 처리한다.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl: float = 86_400.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            max_entries: 보관할 최대 키 수
+            ttl: 결과 보관 시간 (초)
+            clock: 단조 증가 시계 (테스트에서 교체 가능)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._records: OrderedDict[str, IdempotencyRecord] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, key: str) -> IdempotencyRecord | None:
+        with self._lock:
+            record = self._records.get(key)
+            if record is not None and self._clock() - record.stored_at >= self.ttl:
+                del self._records[key]
+                self._expirations += 1
+                record = None
+
+            if record is None:
+                self._misses += 1
+                return None
+
+            self._records.move_to_end(key)
+            self._hits += 1
+            return record
+
+    def put(self, key: str, result: Any) -> None:
+        with self._lock:
+            self._records[key] = IdempotencyRecord(result=result, stored_at=self._clock())
+            self._records.move_to_end(key)
+            while len(self._records) > self.max_entries:
+                self._records.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> IdempotencyStoreStats:
+        """저장소 통계"""
+        with self._lock:
+            return IdempotencyStoreStats(
+                size=len(self._records),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+            )
@@ -0,0 +1,117 @@
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Callable
+
+from resque_api.application.ports.idempotency import IdempotencyRecord, IdempotencyStore
+from resque_api.infrastructure.idempotency.memory_store import IdempotencyStoreStats
+
+
+class SqliteIdempotencyStore(IdempotencyStore):
+    """SQLite 멱등성 저장소
+
+    프로세스 재시작 후에도 결과가 유지된다. 결과는 pickle 로 저장하므로 피클 가능해야 한다.
+    put 은 커맨드 트랜잭션 커밋 후에 호출되므로 자체 트랜잭션으로 커밋한다.
+    키 수가 max_entries 를 넘으면 가장 먼저 저장된 키부터 제거한다.
+    """
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        ttl: float = 86_400.0,
+        max_entries: int | None = None,
+        table: str = "idempotency_keys",
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            connection: SQLite 연결
+            ttl: 결과 보관 시간 (초)
+            max_entries: 보관할 최대 키 수 (None 이면 제한 없음)
+            table: 테이블 이름
+            clock: 저장 시각에 사용할 시계 (epoch 초)
+        """
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table}")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.connection = connection
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.table = table
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def create_table(self) -> None:
+        """테이블과 저장 시각 인덱스 생성"""
+        with self.connection:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} "
+                f"(key TEXT PRIMARY KEY, result BLOB NOT NULL, stored_at REAL NOT NULL)"
+            )
+            self.connection.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_{self.table}_stored_at ON {self.table} (stored_at)"
+            )
+
+    def get(self, key: str) -> IdempotencyRecord | None:
+        row = self.connection.execute(
+            f"SELECT result, stored_at FROM {self.table} WHERE key = ? AND stored_at > ?",
+            (key, self.clock() - self.ttl),
+        ).fetchone()
+
+        with self._lock:
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        return IdempotencyRecord(result=pickle.loads(row[0]), stored_at=row[1])
+
+    def put(self, key: str, result: Any) -> None:
+        payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        with self.connection:
+            self.connection.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, result, stored_at) VALUES (?, ?, ?)",
+                (key, payload, self.clock()),
+            )
+            if self.max_entries is not None:
+                evicted = self.connection.execute(
+                    f"DELETE FROM {self.table} WHERE key IN ("
+                    f"SELECT key FROM {self.table} ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                ).rowcount
+                with self._lock:
+                    self._evictions += evicted
+
+    def purge_expired(self) -> int:
+        """만료된 키 삭제
+
+        Returns:
+            int: 삭제한 키 수
+        """
+        with self.connection:
+            removed = self.connection.execute(
+                f"DELETE FROM {self.table} WHERE stored_at <= ?", (self.clock() - self.ttl,)
+            ).rowcount
+        with self._lock:
+            self._expirations += removed
+        return removed
+
+    def stats(self) -> IdempotencyStoreStats:
+        """저장소 통계"""
+        (size,) = self.connection.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()
+        with self._lock:
+            return IdempotencyStoreStats(
+                size=size,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+            )
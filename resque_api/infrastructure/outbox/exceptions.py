@@ -0,0 +1,6 @@
+class UnknownEventTypeError(Exception):
+    """직렬화기에 등록되지 않은 이벤트 타입을 처리하려 할 때 발생하는 예외"""
+
+    def __init__(self, event_type: str):
+        super().__init__(f"Unknown event type: {event_type}")
+        self.event_type = event_type
@@ -0,0 +1,95 @@
+import dataclasses
+import json
+import types
+from datetime import datetime
+from enum import Enum
+from typing import Any, Iterable, Type, Union, get_args, get_origin, get_type_hints
+from uuid import UUID
+
+from resque_api.application.message.event.base.event import Event
+from resque_api.infrastructure.outbox.exceptions import UnknownEventTypeError
+
+
+class JsonEventSerializer:
+    """이벤트 타입 레지스트리 기반 JSON 직렬화기
+
+    이벤트 dataclass 필드를 JSON 으로 변환하고, 복원 시에는 필드 타입 힌트를 따라
+    UUID, datetime, Enum, 중첩 dataclass(값 객체), tuple 을 원래 타입으로 되돌린다.
+    이벤트 타입 이름은 클래스 이름이며, 복원하려면 미리 register 해야 한다.
+    """
+
+    def __init__(self, event_types: Iterable[Type[Event]] = ()):
+        self._types: dict[str, Type[Event]] = {}
+        self._hints: dict[type, dict[str, Any]] = {}
+        for event_type in event_types:
+            self.register(event_type)
+
+    def register(self, event_type: Type[Event]) -> Type[Event]:
+        """이벤트 타입 등록 (데코레이터로도 사용 가능)"""
+        registered = self._types.get(event_type.__name__)
+        if registered is not None and registered is not event_type:
+            raise ValueError(f"Event type name already registered: {event_type.__name__}")
+
+        self._types[event_type.__name__] = event_type
+        return event_type
+
+    def serialize(self, event: Event) -> tuple[str, bytes]:
+        event_type = type(event).__name__
+        if event_type not in self._types:
+            raise UnknownEventTypeError(event_type)
+
+        payload = json.dumps(_encode(event), separators=(",", ":"), ensure_ascii=False)
+        return event_type, payload.encode()
+
+    def deserialize(self, event_type: str, payload: bytes) -> Event:
+        try:
+            cls = self._types[event_type]
+        except KeyError:
+            raise UnknownEventTypeError(event_type) from None
+
+        return self._decode(cls, json.loads(payload))
+
+    def _decode(self, hint: Any, value: Any) -> Any:
+        if value is None:
+            return None
+
+        origin = get_origin(hint)
+        if origin in (Union, types.UnionType):
+            candidates = [arg for arg in get_args(hint) if arg is not type(None)]
+            return self._decode(candidates[0], value) if len(candidates) == 1 else value
+        if origin in (tuple, list, set, frozenset):
+            args = get_args(hint)
+            item_hint = args[0] if args else Any
+            return origin(self._decode(item_hint, item) for item in value)
+
+        if hint is UUID:
+            return UUID(value)
+        if hint is datetime:
+            return datetime.fromisoformat(value)
+        if isinstance(hint, type) and issubclass(hint, Enum):
+            return hint(value)
+        if dataclasses.is_dataclass(hint):
+            hints = self._type_hints(hint)
+            return hint(**{name: self._decode(hints.get(name, Any), item) for name, item in value.items()})
+        return value
+
+    def _type_hints(self, cls: type) -> dict[str, Any]:
+        try:
+            return self._hints[cls]
+        except KeyError:
+            hints = self._hints[cls] = get_type_hints(cls)
+            return hints
+
+
+def _encode(value: Any) -> Any:
+    if dataclasses.is_dataclass(value):
+        return {f.name: _encode(getattr(value, f.name)) for f in dataclasses.fields(value)}
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (tuple, list, set, frozenset)):
+        return [_encode(item) for item in value]
+    return value
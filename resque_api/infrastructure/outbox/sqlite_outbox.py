@@ -0,0 +1,135 @@
+import sqlite3
+import time
+from typing import Callable, Iterable
+
+from resque_api.application.message.event.base.event import Event
+from resque_api.application.ports.outbox import EventSerializer, OutboxEntry
+
+
+class SqliteOutbox:
+    """SQLite 아웃박스
+
+    집계 저장과 같은 connection 을 사용해야 이벤트 기록이 같은 트랜잭션에 묶인다.
+    sqlite3 connection 은 스레드 간에 공유할 수 없으므로, 릴레이는 같은 DB 파일에 대한
+    별도 connection 으로 만든 SqliteOutbox 를 사용한다.
+    """
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        serializer: EventSerializer,
+        table: str = "outbox",
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            connection: SQLite 연결
+            serializer: 이벤트 직렬화기
+            table: 아웃박스 테이블 이름
+            clock: 기록/전달 시각에 사용할 시계 (epoch 초)
+        """
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table}")
+
+        self.connection = connection
+        self.serializer = serializer
+        self.table = table
+        self.clock = clock
+
+    def create_table(self) -> None:
+        """아웃박스 테이블과 미전달 조회용 인덱스 생성"""
+        with self.connection:
+            self.connection.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.table} (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    event_id TEXT NOT NULL UNIQUE,
+                    event_type TEXT NOT NULL,
+                    payload BLOB NOT NULL,
+                    created_at REAL NOT NULL,
+                    delivered_at REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    retry_at REAL,
+                    dead_at REAL
+                )
+                """
+            )
+            self.connection.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_{self.table}_pending ON {self.table} (delivered_at, id)"
+            )
+
+    def add(self, events: Iterable[Event]) -> None:
+        now = self.clock()
+        rows = [(str(event.id), *self.serializer.serialize(event), now) for event in events]
+        if rows:
+            self.connection.executemany(
+                f"INSERT INTO {self.table} (event_id, event_type, payload, created_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    def fetch_pending(self, limit: int) -> list[OutboxEntry]:
+        rows = self.connection.execute(
+            f"SELECT id, event_type, payload, attempts FROM {self.table} "
+            f"WHERE delivered_at IS NULL AND dead_at IS NULL AND NOT EXISTS ("
+            f"SELECT 1 FROM {self.table} AS waiting "
+            f"WHERE waiting.delivered_at IS NULL AND waiting.dead_at IS NULL "
+            f"AND waiting.retry_at > ? AND waiting.id <= {self.table}.id) "
+            f"ORDER BY id LIMIT ?",
+            (self.clock(), limit),
+        ).fetchall()
+
+        entries = []
+        for entry_id, event_type, payload, attempts in rows:
+            try:
+                event = self.serializer.deserialize(event_type, payload)
+            except Exception as e:
+                # 복원할 수 없는 행은 재시도해도 복원되지 않으므로 데드레터로 옮겨 뒤의 이벤트를 막지 않는다.
+                self.mark_dead(entry_id, repr(e))
+                continue
+            entries.append(OutboxEntry(id=entry_id, event=event, attempts=attempts))
+        return entries
+
+    def mark_delivered(self, entry_ids: Iterable[int]) -> None:
+        now = self.clock()
+        with self.connection:
+            self.connection.executemany(
+                f"UPDATE {self.table} SET delivered_at = ? WHERE id = ?",
+                [(now, entry_id) for entry_id in entry_ids],
+            )
+
+    def mark_failed(self, entry_id: int, error: str, retry_after: float = 0.0) -> None:
+        with self.connection:
+            self.connection.execute(
+                f"UPDATE {self.table} SET attempts = attempts + 1, last_error = ?, retry_at = ? WHERE id = ?",
+                (error, self.clock() + retry_after, entry_id),
+            )
+
+    def mark_dead(self, entry_id: int, error: str) -> None:
+        with self.connection:
+            self.connection.execute(
+                f"UPDATE {self.table} SET attempts = attempts + 1, last_error = ?, dead_at = ? WHERE id = ?",
+                (error, self.clock(), entry_id),
+            )
+
+    def compact(self, delivered_before: float) -> int:
+        with self.connection:
+            cursor = self.connection.execute(
+                f"DELETE FROM {self.table} WHERE delivered_at IS NOT NULL AND delivered_at < ?",
+                (delivered_before,),
+            )
+        return cursor.rowcount
+
+    def pending_count(self) -> int:
+        """전달되지 않은 이벤트 수 (데드레터 제외)"""
+        (count,) = self.connection.execute(
+            f"SELECT COUNT(*) FROM {self.table} WHERE delivered_at IS NULL AND dead_at IS NULL"
+        ).fetchone()
+        return count
+
+    def dead_letter_count(self) -> int:
+        """데드레터로 옮겨진 이벤트 수"""
+        (count,) = self.connection.execute(
+            f"SELECT COUNT(*) FROM {self.table} WHERE dead_at IS NOT NULL"
+        ).fetchone()
+        return count
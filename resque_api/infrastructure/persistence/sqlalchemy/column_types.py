@@ -0,0 +1,29 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime
+from sqlalchemy.types import TypeDecorator
+
+
+class UTCDateTime(TypeDecorator):
+    """UTC 로 정규화해 저장하고 시간대가 있는 datetime 으로 읽는 컬럼 타입
+
+    SQLite 처럼 시간대를 보존하지 않는 DB 에서도 같은 값을 돌려받도록 UTC 기준 naive 값으로 저장한다.
+    시간대가 없는 값은 UTC 로 간주한다.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def process_bind_param(self, value: datetime | None, dialect) -> datetime | None:
+        if value is None:
+            return None
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    def process_result_value(self, value: datetime | None, dialect) -> datetime | None:
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
@@ -0,0 +1,124 @@
+import threading
+from dataclasses import dataclass
+
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """커넥션 풀 설정
+
+    Attributes:
+        pool_size: 풀에 유지할 커넥션 수
+        max_overflow: pool_size 를 넘어 추가로 열 수 있는 커넥션 수
+        pool_timeout: 커넥션을 빌릴 때 기다리는 최대 시간 (초)
+        pool_recycle: 이 시간(초)이 지난 커넥션은 다시 연결 (-1 이면 사용 안 함)
+        pool_pre_ping: 빌려줄 때마다 커넥션이 살아 있는지 확인
+    """
+
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+
+
+def create_engine_from_settings(url: str, settings: PoolSettings = PoolSettings(), **kwargs) -> Engine:
+    """풀 설정을 적용한 엔진 생성
+
+    메모리 SQLite 는 연결마다 별도 DB 가 되므로 커넥션 하나를 공유하는 StaticPool 을 쓰고 풀 설정은 무시한다.
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        kwargs.setdefault("connect_args", {}).setdefault("check_same_thread", False)
+        if parsed.database in (None, "", ":memory:"):
+            return create_engine(url, poolclass=StaticPool, **kwargs)
+
+    return create_engine(
+        url,
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow,
+        pool_timeout=settings.pool_timeout,
+        pool_recycle=settings.pool_recycle,
+        pool_pre_ping=settings.pool_pre_ping,
+        **kwargs,
+    )
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """커넥션 풀 통계
+
+    size, checked_out, overflow 는 풀이 제공할 때만 채워진다.
+    """
+
+    connects: int
+    checkouts: int
+    checkins: int
+    invalidations: int
+    in_use: int
+    max_in_use: int
+    size: int | None = None
+    checked_out: int | None = None
+    overflow: int | None = None
+
+
+class PoolMetrics:
+    """엔진의 풀 이벤트를 구독해 커넥션 사용량을 집계"""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self._lock = threading.Lock()
+        self._connects = 0
+        self._checkouts = 0
+        self._checkins = 0
+        self._invalidations = 0
+        self._in_use = 0
+        self._max_in_use = 0
+
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def snapshot(self) -> PoolStats:
+        """현재 통계"""
+        pool = self.engine.pool
+        with self._lock:
+            return PoolStats(
+                connects=self._connects,
+                checkouts=self._checkouts,
+                checkins=self._checkins,
+                invalidations=self._invalidations,
+                in_use=self._in_use,
+                max_in_use=self._max_in_use,
+                size=_call(pool, "size"),
+                checked_out=_call(pool, "checkedout"),
+                overflow=_call(pool, "overflow"),
+            )
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self._connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        with self._lock:
+            self._checkouts += 1
+            self._in_use += 1
+            self._max_in_use = max(self._max_in_use, self._in_use)
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self._checkins += 1
+            self._in_use = max(self._in_use - 1, 0)
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self._invalidations += 1
+
+
+def _call(pool, name: str) -> int | None:
+    method = getattr(pool, name, None)
+    return method() if callable(method) else None
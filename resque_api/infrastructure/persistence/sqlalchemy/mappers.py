@@ -0,0 +1,172 @@
+from datetime import datetime, timezone
+from typing import Any, Mapping
+from uuid import UUID
+
+from resque_api.domain.base.value_object import ValueObject
+from resque_api.domain.common.value_objects import Email
+from resque_api.domain.project.entities import Project, ProjectInvitation, ProjectMember
+from resque_api.domain.project.value_objects import (
+    InvitationCode,
+    InvitationExpiration,
+    InvitationStatus,
+    ProjectRole,
+    ProjectStatus,
+    ProjectTitle,
+)
+from resque_api.domain.requirement.entities import Requirement, RequirementComment
+from resque_api.domain.requirement.value_objects import (
+    RequirementDescription,
+    RequirementPriority,
+    RequirementStatus,
+    RequirementStatusEnum,
+    RequirementTag,
+    RequirementTags,
+    RequirementTitle,
+)
+from resque_api.domain.user.entities import User
+from resque_api.domain.user.value_objects import AuthProvider, Password, UserStatus
+
+
+def user_to_row(user: User) -> dict[str, Any]:
+    return {
+        "id": user.id,
+        "email": _unwrap(user.email),
+        "status": UserStatus(user.status).value,
+        "auth_provider": AuthProvider(user.auth_provider).value,
+        "password": _unwrap(user.password),
+        "created_at": user.created_at,
+        "version": user.version,
+    }
+
+
+def user_from_row(row: Mapping[str, Any]) -> User:
+    return User(
+        id=row["id"],
+        email=Email(row["email"]),
+        status=UserStatus(row["status"]),
+        auth_provider=AuthProvider(row["auth_provider"]),
+        password=Password(row["password"]) if row["password"] is not None else None,
+        created_at=row["created_at"],
+        version=row["version"],
+    )
+
+
+def project_to_row(project: Project) -> dict[str, Any]:
+    return {
+        "id": project.id,
+        "title": _unwrap(project.title),
+        "description": project.description,
+        "status": ProjectStatus(project.status).value,
+        "owner_id": project.owner_id,
+        "created_at": project.created_at,
+        "members": [
+            {"id": str(m.id), "user_id": str(m.user_id), "role": m.role.value} for m in project.members
+        ],
+        "invitations": [
+            {
+                "id": str(inv.id),
+                "email": _unwrap(inv.email),
+                "role": inv.role.value,
+                "expires_at": _to_iso(inv.expires_at.value),
+                "code": _unwrap(inv.code),
+                "status": inv.status.value,
+            }
+            for inv in project.invitations.values()
+        ],
+        "version": project.version,
+    }
+
+
+def project_from_row(row: Mapping[str, Any]) -> Project:
+    invitations = [
+        ProjectInvitation(
+            id=UUID(inv["id"]),
+            email=Email(inv["email"]),
+            role=ProjectRole(inv["role"]),
+            expires_at=InvitationExpiration(_from_iso(inv["expires_at"])),
+            code=InvitationCode(inv["code"]),
+            status=InvitationStatus(inv["status"]),
+        )
+        for inv in row["invitations"]
+    ]
+    return Project(
+        id=row["id"],
+        title=ProjectTitle(row["title"]),
+        description=row["description"],
+        status=ProjectStatus(row["status"]),
+        owner_id=row["owner_id"],
+        created_at=row["created_at"],
+        members=[
+            ProjectMember(id=UUID(m["id"]), user_id=UUID(m["user_id"]), role=ProjectRole(m["role"]))
+            for m in row["members"]
+        ],
+        invitations={inv.code: inv for inv in invitations},
+        version=row["version"],
+    )
+
+
+def requirement_to_row(requirement: Requirement) -> dict[str, Any]:
+    return {
+        "id": requirement.id,
+        "project_id": requirement.project_id,
+        "title": _unwrap(requirement.title),
+        "description": _unwrap(requirement.description),
+        "assignee_id": requirement.assignee_id,
+        "created_at": requirement.created_at,
+        "updated_at": requirement.updated_at,
+        "priority": _unwrap(requirement.priority),
+        "status": requirement.status.value.value,
+        "tags": [tag.value for tag in requirement.tags],
+        "comments": [
+            {
+                "id": str(c.id),
+                "author_id": str(c.author_id),
+                "content": c.content,
+                "created_at": _to_iso(c.created_at),
+            }
+            for c in requirement.comments.values()
+        ],
+        "dependencies": [str(dependency) for dependency in requirement.dependencies],
+    }
+
+
+def requirement_from_row(row: Mapping[str, Any]) -> Requirement:
+    comments = [
+        RequirementComment(
+            id=UUID(c["id"]),
+            requirement_id=row["id"],
+            author_id=UUID(c["author_id"]),
+            content=c["content"],
+            created_at=_from_iso(c["created_at"]),
+        )
+        for c in row["comments"]
+    ]
+    return Requirement(
+        id=row["id"],
+        project_id=row["project_id"],
+        title=RequirementTitle(row["title"]),
+        description=RequirementDescription(row["description"]),
+        assignee_id=row["assignee_id"],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+        priority=RequirementPriority(row["priority"]),
+        status=RequirementStatus(RequirementStatusEnum(row["status"])),
+        tags=RequirementTags(tuple(RequirementTag(tag) for tag in row["tags"])),
+        comments={c.id: c for c in comments},
+        dependencies=[UUID(dependency) for dependency in row["dependencies"]],
+    )
+
+
+def _unwrap(value: Any) -> Any:
+    """값 객체면 내부 값을, 아니면 그대로 반환"""
+    return value.value if isinstance(value, ValueObject) else value
+
+
+def _to_iso(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat()
+
+
+def _from_iso(value: str) -> datetime:
+    return datetime.fromisoformat(value)
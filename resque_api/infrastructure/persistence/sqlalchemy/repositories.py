@@ -0,0 +1,147 @@
+from typing import Any, Callable, Hashable, Iterator, Mapping
+from uuid import UUID
+
+from sqlalchemy import Table, and_, delete, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from resque_api.application.ports.repository.identity_map import IdentityMap
+from resque_api.application.ports.repository.pagination import PageCursor
+from resque_api.application.ports.repository.repository import Repository
+from resque_api.domain.base.entity import Entity
+from resque_api.infrastructure.persistence.sqlalchemy import mappers, tables
+
+IN_CLAUSE_CHUNK_SIZE = 500
+
+
+class SqlAlchemyRepository(Repository):
+    """SQLAlchemy Core 테이블 기반 저장소
+
+    ORM 매핑 대신 도메인 객체와 행(dict)을 변환하는 매퍼를 사용하므로 도메인 모델은 SQLAlchemy 에 의존하지 않는다.
+    세션은 UnitOfWork 가 소유하며 저장소는 커밋하지 않는다.
+
+    테이블에 version 컬럼이 있으면 UPDATE/DELETE 의 WHERE 절에 version 을 포함하고,
+    영향받은 행 수로 충돌 여부를 판단하므로 별도 조회 없이 한 문장으로 처리된다.
+    """
+
+    table: Table
+    to_row: Callable[[Any], dict[str, Any]]
+    from_row: Callable[[Mapping[str, Any]], Any]
+
+    def __init__(self, session: Session, identity_map: IdentityMap | None = None):
+        self.session = session
+        self.identity_map = identity_map
+
+    def _identity_key(self, aggregate_id: str | UUID) -> tuple[Hashable, UUID]:
+        return self.table.name, _as_uuid(aggregate_id)
+
+    def _save(self, aggregate: Entity) -> None:
+        self.session.execute(insert(self.table).values(type(self).to_row(aggregate)))
+
+    def _get(self, aggregate_id: str | UUID) -> Entity | None:
+        row = self.session.execute(
+            select(self.table).where(self.table.c.id == _as_uuid(aggregate_id))
+        ).mappings().first()
+        return type(self).from_row(row) if row is not None else None
+
+    def _find_all(self) -> list[Entity]:
+        rows = self.session.execute(select(self.table).order_by(self.table.c.id)).mappings()
+        return [type(self).from_row(row) for row in rows]
+
+    def _update(self, aggregate: Entity) -> bool:
+        row = type(self).to_row(aggregate)
+        statement = update(self.table).where(self.table.c.id == row.pop("id"))
+        if self._versioned:
+            statement = statement.where(self.table.c.version == row["version"])
+            row["version"] += 1
+        return self.session.execute(statement.values(row)).rowcount > 0
+
+    def _delete(self, aggregate_id: str | UUID, expected_version: int | None = None) -> bool:
+        statement = delete(self.table).where(self.table.c.id == _as_uuid(aggregate_id))
+        if expected_version is not None and self._versioned:
+            statement = statement.where(self.table.c.version == expected_version)
+        return self.session.execute(statement).rowcount > 0
+
+    @property
+    def _versioned(self) -> bool:
+        return "version" in self.table.c
+
+    def _iter_all(self, batch_size: int) -> Iterator[Entity]:
+        result = self.session.execute(
+            select(self.table).order_by(self.table.c.id),
+            execution_options={"yield_per": batch_size},
+        )
+        try:
+            for row in result.mappings():
+                yield type(self).from_row(row)
+        finally:
+            result.close()
+
+    def _page(self, cursor: PageCursor | None, limit: int, order_by: str) -> list[Entity]:
+        id_column = self.table.c.id
+        sort_column = self.table.c[order_by]
+        statement = select(self.table).order_by(sort_column, id_column).limit(limit)
+        if cursor is not None:
+            if sort_column is id_column:
+                statement = statement.where(id_column > cursor.id)
+            else:
+                statement = statement.where(
+                    or_(
+                        sort_column > cursor.value,
+                        and_(sort_column == cursor.value, id_column > cursor.id),
+                    )
+                )
+        return [type(self).from_row(row) for row in self.session.execute(statement).mappings()]
+
+    def _get_many(self, aggregate_ids: list[str | UUID]) -> list[Entity]:
+        aggregates = []
+        for chunk in _chunks([_as_uuid(aggregate_id) for aggregate_id in aggregate_ids]):
+            rows = self.session.execute(select(self.table).where(self.table.c.id.in_(chunk))).mappings()
+            aggregates.extend(type(self).from_row(row) for row in rows)
+        return aggregates
+
+    def _save_many(self, aggregates: list[Entity]) -> None:
+        self.session.execute(insert(self.table), [type(self).to_row(aggregate) for aggregate in aggregates])
+
+    def _delete_many(self, aggregate_ids: list[str | UUID]) -> list[UUID]:
+        deleted = []
+        returning = self.session.get_bind().dialect.delete_returning
+        for chunk in _chunks([_as_uuid(aggregate_id) for aggregate_id in aggregate_ids]):
+            if returning:
+                # 청크당 한 번의 DELETE ... RETURNING 으로 삭제와 실제 삭제된 ID 조회를 함께 처리한다.
+                statement = delete(self.table).where(self.table.c.id.in_(chunk)).returning(self.table.c.id)
+                deleted.extend(self.session.scalars(statement))
+                continue
+
+            existing = list(self.session.scalars(select(self.table.c.id).where(self.table.c.id.in_(chunk))))
+            if existing:
+                self.session.execute(delete(self.table).where(self.table.c.id.in_(existing)))
+                deleted.extend(existing)
+        return deleted
+
+
+class SqlAlchemyUserRepository(SqlAlchemyRepository):
+    table = tables.users
+    to_row = staticmethod(mappers.user_to_row)
+    from_row = staticmethod(mappers.user_from_row)
+
+
+class SqlAlchemyProjectRepository(SqlAlchemyRepository):
+    table = tables.projects
+    to_row = staticmethod(mappers.project_to_row)
+    from_row = staticmethod(mappers.project_from_row)
+
+
+class SqlAlchemyRequirementRepository(SqlAlchemyRepository):
+    table = tables.requirements
+    to_row = staticmethod(mappers.requirement_to_row)
+    from_row = staticmethod(mappers.requirement_from_row)
+
+
+def _chunks(values: list[UUID]) -> Iterator[list[UUID]]:
+    """바인드 파라미터 수 제한(SQLite 등)을 넘지 않도록 IN 목록을 나눔"""
+    for start in range(0, len(values), IN_CLAUSE_CHUNK_SIZE):
+        yield values[start : start + IN_CLAUSE_CHUNK_SIZE]
+
+
+def _as_uuid(aggregate_id: str | UUID) -> UUID:
+    return aggregate_id if isinstance(aggregate_id, UUID) else UUID(str(aggregate_id))
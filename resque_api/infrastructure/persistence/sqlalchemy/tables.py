@@ -0,0 +1,55 @@
+from sqlalchemy import JSON, Column, Index, Integer, MetaData, String, Table, Text, Uuid
+
+from resque_api.infrastructure.persistence.sqlalchemy.column_types import UTCDateTime
+
+metadata = MetaData()
+
+# (created_at, id) 인덱스는 created_at 기준 키셋 페이지네이션(Repository.page)에 사용된다.
+
+users = Table(
+    "users",
+    metadata,
+    Column("id", Uuid, primary_key=True),
+    Column("email", String(320), nullable=False, unique=True),
+    Column("status", String(20), nullable=False),
+    Column("auth_provider", String(20), nullable=False),
+    Column("password", String(255), nullable=True),
+    Column("created_at", UTCDateTime, nullable=False),
+    Column("version", Integer, nullable=False, default=0),
+    Index("ix_users_created_at_id", "created_at", "id"),
+)
+
+# 멤버/초대는 프로젝트 집계 안에서만 다뤄지므로 별도 테이블 대신 JSON 컬럼에 저장한다.
+projects = Table(
+    "projects",
+    metadata,
+    Column("id", Uuid, primary_key=True),
+    Column("title", String(100), nullable=False),
+    Column("description", Text, nullable=False),
+    Column("status", String(20), nullable=False),
+    Column("owner_id", Uuid, nullable=False, index=True),
+    Column("created_at", UTCDateTime, nullable=False),
+    Column("members", JSON, nullable=False),
+    Column("invitations", JSON, nullable=False),
+    Column("version", Integer, nullable=False, default=0),
+    Index("ix_projects_created_at_id", "created_at", "id"),
+)
+
+# Requirement 는 애그리거트 루트가 아니므로 version 컬럼 없이 마지막 쓰기가 반영된다.
+requirements = Table(
+    "requirements",
+    metadata,
+    Column("id", Uuid, primary_key=True),
+    Column("project_id", Uuid, nullable=False, index=True),
+    Column("title", String(100), nullable=False),
+    Column("description", Text, nullable=False),
+    Column("assignee_id", Uuid, nullable=True),
+    Column("created_at", UTCDateTime, nullable=False),
+    Column("updated_at", UTCDateTime, nullable=False),
+    Column("priority", Integer, nullable=False),
+    Column("status", String(20), nullable=False),
+    Column("tags", JSON, nullable=False),
+    Column("comments", JSON, nullable=False),
+    Column("dependencies", JSON, nullable=False),
+    Index("ix_requirements_created_at_id", "created_at", "id"),
+)
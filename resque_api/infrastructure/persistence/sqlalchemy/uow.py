@@ -0,0 +1,61 @@
+from typing import Any, Self
+
+from sqlalchemy.orm import Session, SessionTransaction, sessionmaker
+
+from resque_api.application.ports.uow import UnitOfWork
+from resque_api.infrastructure.cache.aggregate_cache import AggregateCache
+from resque_api.infrastructure.cache.caching_repository import CachingRepository
+from resque_api.infrastructure.persistence.sqlalchemy.repositories import (
+    SqlAlchemyProjectRepository,
+    SqlAlchemyRequirementRepository,
+    SqlAlchemyUserRepository,
+)
+
+
+class SqlAlchemyUnitOfWork(UnitOfWork):
+    """SQLAlchemy 세션 기반 UnitOfWork
+
+    가장 바깥 with 블록마다 세션을 하나 열고 끝날 때 닫으므로, 커넥션은 트랜잭션 동안만 풀에서 빌려 쓴다.
+    저장소(users, projects, requirements)는 블록 안에서만 사용할 수 있으며 같은 세션과 아이덴티티 맵을 공유한다.
+    cache 를 지정하면 조회가 가장 많은 users, projects 저장소를 CachingRepository 로 감싼다.
+    """
+
+    def __init__(self, session_factory: sessionmaker[Session], cache: AggregateCache | None = None):
+        super().__init__()
+        self.session_factory = session_factory
+        self.cache = cache
+        self.session: Session | None = None
+
+    def __enter__(self) -> Self:
+        if not self.in_transaction:
+            self.session = self.session_factory()
+            self.users = SqlAlchemyUserRepository(self.session, self.identity_map)
+            self.projects = SqlAlchemyProjectRepository(self.session, self.identity_map)
+            self.requirements = SqlAlchemyRequirementRepository(self.session, self.identity_map)
+            if self.cache is not None:
+                self.users = CachingRepository(self.users, self.cache, self)
+                self.projects = CachingRepository(self.projects, self.cache, self)
+        return super().__enter__()
+
+    def __exit__(self, exc_type, exc_value, tb) -> None:
+        try:
+            super().__exit__(exc_type, exc_value, tb)
+        finally:
+            if not self.in_transaction and self.session is not None:
+                self.session.close()
+                self.session = None
+
+    def commit(self) -> None:
+        self.session.commit()
+
+    def rollback(self) -> None:
+        self.session.rollback()
+
+    def _begin_savepoint(self) -> SessionTransaction:
+        return self.session.begin_nested()
+
+    def _rollback_to_savepoint(self, token: Any) -> None:
+        token.rollback()
+
+    def _release_savepoint(self, token: Any) -> None:
+        token.commit()
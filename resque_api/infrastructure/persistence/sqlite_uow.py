@@ -0,0 +1,47 @@
+import itertools
+import sqlite3
+
+from resque_api.application.ports.outbox import Outbox
+from resque_api.application.ports.uow import UnitOfWork
+
+
+class SqliteUnitOfWork(UnitOfWork):
+    """sqlite3 connection 트랜잭션 기반 UnitOfWork
+
+    outbox 를 지정하면 커밋 시 발행된 이벤트를 같은 트랜잭션에서 아웃박스에 기록하고
+    메모리의 이벤트는 비운다. 이 경우 이벤트 전달은 버스가 아니라 아웃박스 릴레이가 담당한다.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, outbox: Outbox | None = None):
+        super().__init__()
+        self.connection = connection
+        self.outbox = outbox
+        self._savepoint_ids = itertools.count(1)
+
+    def commit(self) -> None:
+        try:
+            if self.outbox is not None and self.events:
+                self.outbox.add(self.events)
+            self.connection.commit()
+        except BaseException:
+            self.connection.rollback()
+            self.events.clear()
+            raise
+
+        if self.outbox is not None:
+            self.events.clear()
+
+    def rollback(self) -> None:
+        self.connection.rollback()
+
+    def _begin_savepoint(self) -> str:
+        name = f"sp_{next(self._savepoint_ids)}"
+        self.connection.execute(f"SAVEPOINT {name}")
+        return name
+
+    def _rollback_to_savepoint(self, token: str) -> None:
+        self.connection.execute(f"ROLLBACK TO SAVEPOINT {token}")
+        self.connection.execute(f"RELEASE SAVEPOINT {token}")
+
+    def _release_savepoint(self, token: str) -> None:
+        self.connection.execute(f"RELEASE SAVEPOINT {token}")
@@ -0,0 +1,53 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from resque_api.application.ports.rate_limit import BucketDecision, TokenBucketPolicy, TokenBucketStore
+
+
+class InMemoryTokenBucketStore(TokenBucketStore):
+    """프로세스 메모리 기반 토큰 버킷 저장소
+
+    키 수가 max_keys 를 넘으면 가장 오래 사용되지 않은 버킷부터 제거해
+    무작위 키를 쏟아내는 공격에도 메모리 사용량이 제한되도록 한다.
+    """
+
+    def __init__(self, max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            max_keys: 보관할 최대 버킷 수
+            clock: 단조 증가 시계 (테스트에서 교체 가능)
+        """
+        if max_keys < 1:
+            raise ValueError("max_keys must be at least 1")
+
+        self.max_keys = max_keys
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def consume(self, key: str, policy: TokenBucketPolicy, tokens: float = 1.0) -> BucketDecision:
+        """버킷 토큰을 보충한 뒤 소비"""
+        with self._lock:
+            now = self._clock()
+            available, updated_at = self._buckets.pop(key, (policy.capacity, now))
+            available = min(
+                policy.capacity,
+                available + (now - updated_at) * policy.refill_per_second,
+            )
+
+            if available >= tokens:
+                decision = BucketDecision(allowed=True)
+                available -= tokens
+            else:
+                retry_after = (tokens - available) / policy.refill_per_second
+                decision = BucketDecision(allowed=False, retry_after=retry_after)
+
+            self._buckets[key] = (available, now)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return decision
@@ -0,0 +1,81 @@
+import sqlite3
+import threading
+from typing import Iterable
+from uuid import UUID
+
+from resque_api.application.ports.outbox import EventSerializer
+from resque_api.application.ports.scheduler import ScheduledMessage, TimerStore
+
+
+class SqliteTimerStore(TimerStore):
+    """SQLite 예약 메시지 저장소
+
+    메시지는 serializer 로 직렬화해 저장하므로 예약할 메시지 타입을 serializer 에 등록해야 한다.
+    예약/삭제는 각자 커밋하며, 예약 시점의 커맨드 트랜잭션과는 묶이지 않는다.
+
+    스케줄러의 백그라운드 스레드도 발행한 예약을 삭제하므로, 그때는 connection 을 check_same_thread=False 로
+    열어야 한다(connect 사용). connection 접근은 저장소 내부 잠금으로 직렬화한다.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, serializer: EventSerializer, table: str = "scheduled_messages"):
+        """
+        Args:
+            connection: SQLite 연결
+            serializer: 메시지 직렬화기
+            table: 테이블 이름
+        """
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table}")
+
+        self.connection = connection
+        self.serializer = serializer
+        self.table = table
+        self._lock = threading.Lock()
+
+    @classmethod
+    def connect(
+        cls, database: str, serializer: EventSerializer, table: str = "scheduled_messages"
+    ) -> "SqliteTimerStore":
+        """스레드 간에 공유할 수 있는 connection 으로 저장소 생성
+
+        Args:
+            database: SQLite 데이터베이스 경로
+            serializer: 메시지 직렬화기
+            table: 테이블 이름
+        """
+        return cls(sqlite3.connect(database, check_same_thread=False), serializer, table)
+
+    def create_table(self) -> None:
+        """테이블과 발행 시각 인덱스 생성"""
+        with self._lock, self.connection:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                f"id TEXT PRIMARY KEY, due_at REAL NOT NULL, message_type TEXT NOT NULL, payload BLOB NOT NULL)"
+            )
+            self.connection.execute(f"CREATE INDEX IF NOT EXISTS ix_{self.table}_due_at ON {self.table} (due_at)")
+
+    def add(self, timer: ScheduledMessage) -> None:
+        message_type, payload = self.serializer.serialize(timer.message)
+        with self._lock, self.connection:
+            self.connection.execute(
+                f"INSERT INTO {self.table} (id, due_at, message_type, payload) VALUES (?, ?, ?, ?)",
+                (str(timer.id), timer.due_at, message_type, payload),
+            )
+
+    def remove(self, timer_ids: Iterable[UUID]) -> None:
+        with self._lock, self.connection:
+            self.connection.executemany(
+                f"DELETE FROM {self.table} WHERE id = ?", [(str(timer_id),) for timer_id in timer_ids]
+            )
+
+    def load_pending(self) -> list[ScheduledMessage]:
+        with self._lock:
+            rows = self.connection.execute(
+                f"SELECT id, due_at, message_type, payload FROM {self.table} ORDER BY due_at"
+            ).fetchall()
+        return [
+            ScheduledMessage(
+                id=UUID(timer_id), due_at=due_at, message=self.serializer.deserialize(message_type, payload)
+            )
+            for timer_id, due_at, message_type, payload in rows
+        ]
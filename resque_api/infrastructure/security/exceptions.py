@@ -0,0 +1,10 @@
+class HasherQueueFullError(Exception):
+    """해시 작업 대기열이 가득 찼을 때 발생하는 예외"""
+
+    pass
+
+
+class UnknownHashSchemeError(Exception):
+    """등록되지 않은 해시 알고리즘을 사용하려 할 때 발생하는 예외"""
+
+    pass
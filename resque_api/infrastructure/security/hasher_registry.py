@@ -0,0 +1,66 @@
+from typing import Iterable, Protocol
+
+from resque_api.application.ports.security import PasswordHasher
+from resque_api.infrastructure.security.exceptions import UnknownHashSchemeError
+
+
+class IdentifiablePasswordHasher(PasswordHasher, Protocol):
+    """해시 문자열로 자신이 만든 해시인지 판별할 수 있는 해시 처리기"""
+
+    scheme: str
+
+    def identify(self, hashed_password: str) -> bool:
+        """해시가 이 알고리즘의 형식인지 확인"""
+        ...
+
+
+class PasswordHasherRegistry(PasswordHasher):
+    """여러 해시 알고리즘을 묶은 비밀번호 해시 처리 구현
+
+    저장된 해시는 접두사로 알고리즘을 판별해 해당 알고리즘으로 검증하고,
+    새 비밀번호는 기본 알고리즘으로 해시한다. 기본 알고리즘이 아닌 해시는
+    needs_rehash 가 True 를 반환하므로 로그인 시 재해시로 점진적으로 전환된다.
+    """
+
+    def __init__(self, hashers: Iterable[IdentifiablePasswordHasher], default_scheme: str):
+        """
+        Args:
+            hashers: 등록할 해시 처리기 목록
+            default_scheme: 새 비밀번호 해시에 사용할 알고리즘 이름
+        """
+        self.hashers: dict[str, IdentifiablePasswordHasher] = {}
+        for hasher in hashers:
+            self.hashers[hasher.scheme] = hasher
+
+        if default_scheme not in self.hashers:
+            raise UnknownHashSchemeError(f"Unknown hash scheme: {default_scheme}")
+        self.default_scheme = default_scheme
+
+    @property
+    def default(self) -> IdentifiablePasswordHasher:
+        """기본 해시 처리기"""
+        return self.hashers[self.default_scheme]
+
+    def identify(self, hashed_password: str) -> IdentifiablePasswordHasher | None:
+        """저장된 해시를 만든 해시 처리기 조회"""
+        if not hashed_password:
+            return None
+        return next((h for h in self.hashers.values() if h.identify(hashed_password)), None)
+
+    def hash(self, plain_password: str) -> str:
+        """기본 알고리즘으로 비밀번호 해시화"""
+        return self.default.hash(plain_password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """저장된 해시의 알고리즘으로 비밀번호 검증"""
+        hasher = self.identify(hashed_password)
+        if hasher is None:
+            return False
+        return hasher.verify(plain_password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """기본 알고리즘이 아니거나 비용 설정이 다르면 재해시 필요"""
+        hasher = self.identify(hashed_password)
+        if hasher is None or hasher is not self.default:
+            return True
+        return hasher.needs_rehash(hashed_password)
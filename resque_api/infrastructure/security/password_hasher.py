@@ -1,11 +1,44 @@
+import base64
+import hashlib
+import hmac
+import re
+import secrets
+import time
+from typing import Self
+
 import bcrypt
 
 from resque_api.application.ports.security import PasswordHasher
 
+_BCRYPT_HASH_PATTERN = re.compile(r"^\$2[abxy]?\$(\d{2})\$[./A-Za-z0-9]{53}$")
+_SCRYPT_HASH_PATTERN = re.compile(
+    r"^\$scrypt\$ln=(\d+),r=(\d+),p=(\d+)\$([A-Za-z0-9+/]+)\$([A-Za-z0-9+/]+)$"
+)
+# 저장된 해시의 비용 설정을 그대로 믿으면 조작된 해시 하나로 로그인마다 거대한 메모리/CPU 를 쓰게 되므로 상한을 둔다.
+_SCRYPT_MAX_LOG_N = 20
+_SCRYPT_MAX_R = 32
+_SCRYPT_MAX_P = 16
+_SCRYPT_MAX_KEY_SIZE = 1024
+_PBKDF2_HASH_PATTERN = re.compile(
+    r"^\$pbkdf2-(\w+)\$(\d+)\$([A-Za-z0-9+/]+)\$([A-Za-z0-9+/]+)$"
+)
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _b64decode(encoded: str) -> bytes:
+    return base64.b64decode(encoded + "=" * (-len(encoded) % 4))
+
 
 class BcryptPasswordHasher(PasswordHasher):
     """Bcrypt 기반 비밀번호 해시 처리 구현"""
 
+    scheme = "bcrypt"
+    MIN_ROUNDS = 4
+    MAX_ROUNDS = 31
+
     def __init__(self, rounds: int = 12):
         """
         Args:
@@ -14,6 +47,55 @@ class BcryptPasswordHasher(PasswordHasher):
         """
         self.rounds = rounds
 
+    @classmethod
+    def calibrate(
+        cls,
+        target_seconds: float = 0.25,
+        min_rounds: int = 10,
+        max_rounds: int = 16,
+        samples: int = 3,
+    ) -> Self:
+        """호스트 성능을 측정해 목표 검증 시간에 맞는 라운드 수로 해셔 생성
+
+        min_rounds 에서 검증 시간을 측정한 뒤, 라운드가 1 증가할 때마다 비용이
+        두 배가 되는 bcrypt 특성을 이용해 목표 시간을 넘지 않는 가장 큰 라운드 수를 고른다.
+
+        Args:
+            target_seconds: 목표 검증 시간 (초)
+            min_rounds: 허용하는 최소 라운드 수 (보안 하한)
+            max_rounds: 허용하는 최대 라운드 수
+            samples: 측정 반복 횟수 (가장 빠른 값을 사용)
+
+        Returns:
+            BcryptPasswordHasher: 선택된 라운드 수의 해셔
+        """
+        if not cls.MIN_ROUNDS <= min_rounds <= max_rounds <= cls.MAX_ROUNDS:
+            raise ValueError(
+                f"Rounds must satisfy {cls.MIN_ROUNDS} <= min_rounds <= max_rounds <= {cls.MAX_ROUNDS}"
+            )
+        if target_seconds <= 0:
+            raise ValueError("target_seconds must be positive")
+
+        base_seconds = cls._measure_verify_seconds(min_rounds, max(samples, 1))
+
+        rounds = min_rounds
+        while rounds < max_rounds and base_seconds * 2 ** (rounds + 1 - min_rounds) <= target_seconds:
+            rounds += 1
+        return cls(rounds=rounds)
+
+    @staticmethod
+    def _measure_verify_seconds(rounds: int, samples: int) -> float:
+        """주어진 라운드 수의 검증 시간 측정"""
+        password = b"calibration-password"
+        hashed = bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds))
+
+        timings = []
+        for _ in range(samples):
+            started = time.perf_counter()
+            bcrypt.checkpw(password, hashed)
+            timings.append(time.perf_counter() - started)
+        return min(timings)
+
     def hash(self, plain_password: str) -> str:
         """비밀번호 해시화"""
         if not plain_password:
@@ -37,3 +119,165 @@ class BcryptPasswordHasher(PasswordHasher):
             return bcrypt.checkpw(password=password_bytes, hashed_password=hashed_bytes)
         except (ValueError, TypeError):
             return False
+
+    def identify(self, hashed_password: str) -> bool:
+        """bcrypt 해시 형식인지 확인"""
+        return bool(_BCRYPT_HASH_PATTERN.match(hashed_password or ""))
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """저장된 해시의 라운드 수가 현재 설정과 다르면 재해시 필요"""
+        match = _BCRYPT_HASH_PATTERN.match(hashed_password or "")
+        if not match:
+            return True
+        return int(match.group(1)) != self.rounds
+
+
+class ScryptPasswordHasher(PasswordHasher):
+    """hashlib.scrypt 기반 비밀번호 해시 처리 구현
+
+    해시 형식: ``$scrypt$ln=<log2 N>,r=<r>,p=<p>$<salt>$<hash>``
+    """
+
+    scheme = "scrypt"
+
+    def __init__(self, log_n: int = 14, r: int = 8, p: int = 1, salt_size: int = 16, key_size: int = 32):
+        """
+        Args:
+            log_n: CPU/메모리 비용 N 의 log2 값 (기본값 14, N=16384)
+            r: 블록 크기 (메모리 사용량은 약 128 * N * r 바이트)
+            p: 병렬화 계수
+            salt_size: 솔트 바이트 수
+            key_size: 파생 키 바이트 수
+        """
+        if not _scrypt_params_allowed(log_n, r, p, key_size):
+            raise ValueError("scrypt parameters are out of the supported range")
+
+        self.log_n = log_n
+        self.r = r
+        self.p = p
+        self.salt_size = salt_size
+        self.key_size = key_size
+
+    @property
+    def memory_cost(self) -> int:
+        """해시 1회에 필요한 작업 메모리 (바이트)"""
+        return 128 * (2**self.log_n) * self.r
+
+    def hash(self, plain_password: str) -> str:
+        """비밀번호 해시화"""
+        if not plain_password:
+            raise ValueError("Password cannot be empty")
+
+        salt = secrets.token_bytes(self.salt_size)
+        derived = self._derive(plain_password, salt, self.log_n, self.r, self.p, self.key_size)
+        return f"$scrypt$ln={self.log_n},r={self.r},p={self.p}${_b64encode(salt)}${_b64encode(derived)}"
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """비밀번호 검증"""
+        if not plain_password or not hashed_password:
+            return False
+
+        match = _SCRYPT_HASH_PATTERN.match(hashed_password)
+        if not match:
+            return False
+
+        log_n, r, p = (int(v) for v in match.group(1, 2, 3))
+        try:
+            salt, expected = _b64decode(match.group(4)), _b64decode(match.group(5))
+            if not _scrypt_params_allowed(log_n, r, p, len(expected)):
+                return False
+            derived = self._derive(plain_password, salt, log_n, r, p, len(expected))
+        except (ValueError, OverflowError):
+            return False
+        return hmac.compare_digest(derived, expected)
+
+    def identify(self, hashed_password: str) -> bool:
+        """scrypt 해시 형식인지 확인"""
+        return bool(_SCRYPT_HASH_PATTERN.match(hashed_password or ""))
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """저장된 해시의 비용 설정이 현재 설정과 다르면 재해시 필요"""
+        match = _SCRYPT_HASH_PATTERN.match(hashed_password or "")
+        if not match:
+            return True
+        return tuple(int(v) for v in match.group(1, 2, 3)) != (self.log_n, self.r, self.p)
+
+    @staticmethod
+    def _derive(plain_password: str, salt: bytes, log_n: int, r: int, p: int, key_size: int) -> bytes:
+        n = 2**log_n
+        return hashlib.scrypt(
+            plain_password.encode("utf-8"),
+            salt=salt,
+            n=n,
+            r=r,
+            p=p,
+            maxmem=256 * n * r + 1024 * 1024,
+            dklen=key_size,
+        )
+
+
+def _scrypt_params_allowed(log_n: int, r: int, p: int, key_size: int) -> bool:
+    """scrypt 비용 설정이 허용 범위 안인지 확인"""
+    return (
+        1 <= log_n <= _SCRYPT_MAX_LOG_N
+        and 1 <= r <= _SCRYPT_MAX_R
+        and 1 <= p <= _SCRYPT_MAX_P
+        and 1 <= key_size <= _SCRYPT_MAX_KEY_SIZE
+    )
+
+
+class Pbkdf2PasswordHasher(PasswordHasher):
+    """hashlib.pbkdf2_hmac 기반 비밀번호 해시 처리 구현
+
+    해시 형식: ``$pbkdf2-<digest>$<iterations>$<salt>$<hash>``
+    """
+
+    scheme = "pbkdf2"
+
+    def __init__(self, iterations: int = 600_000, digest: str = "sha256", salt_size: int = 16):
+        """
+        Args:
+            iterations: 반복 횟수 (기본값 600,000, OWASP 권장값 기준)
+            digest: HMAC 해시 알고리즘
+            salt_size: 솔트 바이트 수
+        """
+        self.iterations = iterations
+        self.digest = digest
+        self.salt_size = salt_size
+
+    def hash(self, plain_password: str) -> str:
+        """비밀번호 해시화"""
+        if not plain_password:
+            raise ValueError("Password cannot be empty")
+
+        salt = secrets.token_bytes(self.salt_size)
+        derived = hashlib.pbkdf2_hmac(self.digest, plain_password.encode("utf-8"), salt, self.iterations)
+        return f"$pbkdf2-{self.digest}${self.iterations}${_b64encode(salt)}${_b64encode(derived)}"
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """비밀번호 검증"""
+        if not plain_password or not hashed_password:
+            return False
+
+        match = _PBKDF2_HASH_PATTERN.match(hashed_password)
+        if not match:
+            return False
+
+        digest, iterations = match.group(1), int(match.group(2))
+        try:
+            salt, expected = _b64decode(match.group(3)), _b64decode(match.group(4))
+            derived = hashlib.pbkdf2_hmac(digest, plain_password.encode("utf-8"), salt, iterations)
+        except ValueError:
+            return False
+        return hmac.compare_digest(derived, expected)
+
+    def identify(self, hashed_password: str) -> bool:
+        """PBKDF2 해시 형식인지 확인"""
+        return bool(_PBKDF2_HASH_PATTERN.match(hashed_password or ""))
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """저장된 해시의 알고리즘/반복 횟수가 현재 설정과 다르면 재해시 필요"""
+        match = _PBKDF2_HASH_PATTERN.match(hashed_password or "")
+        if not match:
+            return True
+        return (match.group(1), int(match.group(2))) != (self.digest, self.iterations)
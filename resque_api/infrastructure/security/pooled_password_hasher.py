@@ -0,0 +1,180 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Iterator, TypeVar
+
+from resque_api.application.ports.security import (
+    AsyncPasswordHasher,
+    BatchItemResult,
+    PasswordHasher,
+    ProgressCallback,
+)
+from resque_api.infrastructure.security.exceptions import HasherQueueFullError
+
+T = TypeVar("T")
+
+
+class PooledPasswordHasher(AsyncPasswordHasher):
+    """스레드 풀 기반 비밀번호 해시 처리 구현
+
+    bcrypt 는 해시 계산 동안 GIL 을 해제하므로 스레드 풀만으로 여러 코어를 활용할 수 있다.
+    실행 중이거나 대기 중인 작업 수는 max_pending 으로 제한되며,
+    한도를 넘는 요청은 대기하지 않고 즉시 HasherQueueFullError 로 거부된다.
+    """
+
+    def __init__(
+        self,
+        hasher: PasswordHasher,
+        max_workers: int | None = None,
+        max_pending: int = 64,
+    ):
+        """
+        Args:
+            hasher: 실제 해시 계산을 수행할 해시 처리기
+            max_workers: 작업 스레드 수 (기본값: CPU 코어 수)
+            max_pending: 실행 중 + 대기 중 작업의 최대 개수
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+
+        self.hasher = hasher
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hasher"
+        )
+        self._slot_freed = threading.Condition()
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """실행 중이거나 대기 중인 작업 수"""
+        return self._pending
+
+    def submit_hash(self, plain_password: str) -> Future[str]:
+        """해시 작업을 풀에 제출하고 Future 반환"""
+        return self._submit(self.hasher.hash, plain_password)
+
+    def submit_verify(self, plain_password: str, hashed_password: str) -> Future[bool]:
+        """검증 작업을 풀에 제출하고 Future 반환"""
+        return self._submit(self.hasher.verify, plain_password, hashed_password)
+
+    def hash(self, plain_password: str) -> str:
+        """비밀번호 해시화 (풀에서 계산 후 결과 대기)"""
+        return self.submit_hash(plain_password).result()
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """비밀번호 검증 (풀에서 계산 후 결과 대기)"""
+        return self.submit_verify(plain_password, hashed_password).result()
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """재해시 필요 여부 (해시 계산이 없으므로 호출 스레드에서 판단)"""
+        return self.hasher.needs_rehash(hashed_password)
+
+    async def hash_async(self, plain_password: str) -> str:
+        """이벤트 루프를 막지 않고 비밀번호 해시화"""
+        return await asyncio.wrap_future(self.submit_hash(plain_password))
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        """이벤트 루프를 막지 않고 비밀번호 검증"""
+        return await asyncio.wrap_future(
+            self.submit_verify(plain_password, hashed_password)
+        )
+
+    def hash_many(
+        self,
+        plain_passwords: Iterable[str],
+        on_progress: ProgressCallback | None = None,
+    ) -> Iterator[BatchItemResult[str]]:
+        """여러 비밀번호를 풀에서 병렬로 해시화
+
+        결과는 완료된 순서대로 반환된다.
+        """
+        items = [(password,) for password in plain_passwords]
+        yield from self._run_many(self.hasher.hash, items, on_progress)
+
+    def verify_many(
+        self,
+        credentials: Iterable[tuple[str, str]],
+        on_progress: ProgressCallback | None = None,
+    ) -> Iterator[BatchItemResult[bool]]:
+        """여러 비밀번호를 풀에서 병렬로 검증
+
+        결과는 완료된 순서대로 반환된다.
+        """
+        yield from self._run_many(self.hasher.verify, list(credentials), on_progress)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """작업 스레드 종료"""
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "PooledPasswordHasher":
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb) -> None:
+        self.shutdown()
+
+    def _run_many(
+        self,
+        fn: Callable[..., T],
+        items: list[tuple],
+        on_progress: ProgressCallback | None,
+    ) -> Iterator[BatchItemResult[T]]:
+        """항목을 일정 개수씩 풀에 흘려보내며 완료된 결과부터 반환
+
+        한 번에 제출하는 작업 수를 제한해 다른 요청이 사용할 대기열 자리를 남겨둔다.
+        """
+        total = len(items)
+        window = min(self.max_pending, self.max_workers * 2)
+        in_flight: dict[Future[T], int] = {}
+        next_index = 0
+        completed = 0
+
+        while next_index < total or in_flight:
+            while next_index < total and len(in_flight) < window:
+                future = self._submit(fn, *items[next_index], block=True)
+                in_flight[future] = next_index
+                next_index += 1
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = in_flight.pop(future)
+                error = future.exception()
+                if error is None:
+                    result = BatchItemResult(index=index, value=future.result())
+                else:
+                    result = BatchItemResult(index=index, error=error)
+
+                completed += 1
+                if on_progress is not None:
+                    on_progress(completed, total)
+                yield result
+
+    def _submit(self, fn: Callable[..., T], *args, block: bool = False) -> Future[T]:
+        with self._slot_freed:
+            if block:
+                self._slot_freed.wait_for(lambda: self._pending < self.max_pending)
+            elif self._pending >= self.max_pending:
+                raise HasherQueueFullError(
+                    f"Password hasher queue is full ({self.max_pending} pending)"
+                )
+            self._pending += 1
+
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    def _release(self) -> None:
+        with self._slot_freed:
+            self._pending -= 1
+            self._slot_freed.notify()
@@ -0,0 +1,406 @@
+import dataclasses
+import struct
+import types
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, Callable, Iterable, Type, TypeVar, Union, get_args, get_origin, get_type_hints
+from uuid import UUID
+
+from resque_api.application.message.common.message import Message
+from resque_api.infrastructure.serialization.exceptions import (
+    SchemaVersionError,
+    UnknownMessageTypeError,
+    UnsupportedFieldTypeError,
+)
+
+SINCE = "since"
+
+Encoder = Callable[[bytearray, Any], None]
+Decoder = Callable[[bytes, int], tuple[Any, int]]
+
+_FLOAT = struct.Struct("<d")
+_INT64 = struct.Struct("<q")
+_UTC_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def since(version: int) -> dict[str, int]:
+    """필드가 추가된 스키마 버전을 나타내는 dataclass field metadata
+
+    예: ``priority: int = field(default=0, metadata=since(2))``
+    """
+    if version < 1:
+        raise ValueError("version must be at least 1")
+    return {SINCE: version}
+
+
+class MessageCodec:
+    """메시지 dataclass 하나에 대해 생성된 스키마 기반 바이너리 코덱
+
+    필드 타입 힌트로부터 필드별 인코더/디코더를 한 번 만들어 두고 재사용한다.
+    UUID 는 16바이트, datetime 은 UTC 기준 int64 마이크로초, Enum 은 멤버 값(정수 또는 문자열),
+    정수와 길이는 varint 로 기록하며 필드 이름은 기록하지 않는다.
+
+    페이로드 앞에는 스키마 버전이 기록된다. 필드 metadata 의 since 로 필드가 추가된 버전을 표시하면
+    이전 버전 페이로드를 디코딩할 때 없는 필드는 기본값으로 채운다.
+    새 필드는 반드시 기본값이 있어야 하고 기존 필드의 순서와 타입은 바꾸지 않아야 한다.
+    """
+
+    def __init__(self, message_type: type):
+        if not dataclasses.is_dataclass(message_type):
+            raise TypeError(f"{message_type.__name__} is not a dataclass")
+
+        self.message_type = message_type
+        self._fields = _schema_fields(message_type)
+        self.version = max((version for _, version, _, _ in self._fields), default=1)
+        self._encoders = [(name, encode) for name, _, encode, _ in self._fields]
+        self._defaults = {name: _default_of(message_type, name) for name, version, _, _ in self._fields if version > 1}
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """인코딩 순서대로의 필드 이름"""
+        return tuple(name for name, _, _, _ in self._fields)
+
+    def encode(self, message: Any) -> bytes:
+        out = bytearray()
+        _write_varint(out, self.version)
+        for name, encode in self._encoders:
+            encode(out, getattr(message, name))
+        return bytes(out)
+
+    def decode(self, data: bytes) -> Any:
+        version, pos = _read_varint(data, 0)
+        if version > self.version:
+            raise SchemaVersionError(self.message_type.__name__, version, self.version)
+
+        values = {}
+        for name, field_version, _, decode in self._fields:
+            if field_version <= version:
+                values[name], pos = decode(data, pos)
+            else:
+                values[name] = self._defaults[name]()
+        return self.message_type(**values)
+
+
+class BinaryCodecRegistry:
+    """메시지 타입 이름별 바이너리 코덱 레지스트리
+
+    EventSerializer 포트를 구현하므로 아웃박스 직렬화기로 사용할 수 있다.
+    """
+
+    def __init__(self, message_types: Iterable[Type[Message]] = ()):
+        self._codecs: dict[str, MessageCodec] = {}
+        for message_type in message_types:
+            self.register(message_type)
+
+    def register(self, message_type: Type[Message]) -> Type[Message]:
+        """메시지 타입 등록 (데코레이터로도 사용 가능)"""
+        registered = self._codecs.get(message_type.__name__)
+        if registered is not None and registered.message_type is not message_type:
+            raise ValueError(f"Message type name already registered: {message_type.__name__}")
+
+        self._codecs[message_type.__name__] = MessageCodec(message_type)
+        return message_type
+
+    def codec_for(self, message_type: str | type) -> MessageCodec:
+        """메시지 타입(또는 이름)의 코덱 조회"""
+        name = message_type if isinstance(message_type, str) else message_type.__name__
+        try:
+            return self._codecs[name]
+        except KeyError:
+            raise UnknownMessageTypeError(name) from None
+
+    def serialize(self, message: Message) -> tuple[str, bytes]:
+        name = type(message).__name__
+        return name, self.codec_for(name).encode(message)
+
+    def deserialize(self, message_type: str, payload: bytes) -> Message:
+        return self.codec_for(message_type).decode(payload)
+
+    def dumps(self, message: Message) -> bytes:
+        """타입 이름을 앞에 붙여 자기 기술적인 바이트열로 인코딩"""
+        name, payload = self.serialize(message)
+        out = bytearray()
+        _encode_str(out, name)
+        return bytes(out) + payload
+
+    def loads(self, data: bytes) -> Message:
+        """dumps 로 만든 바이트열 디코딩"""
+        name, pos = _decode_str(data, 0)
+        return self.deserialize(name, data[pos:])
+
+
+def _schema_fields(cls: type) -> list[tuple[str, int, Encoder, Decoder]]:
+    hints = get_type_hints(cls)
+    typevars = _typevar_bindings(cls)
+    fields = []
+    for f in dataclasses.fields(cls):
+        if not f.init:
+            continue
+        version = f.metadata.get(SINCE, 1)
+        if version > 1 and f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING:
+            raise ValueError(f"{cls.__name__}.{f.name} was added in version {version} and needs a default")
+        try:
+            encode, decode = _compile(hints[f.name], typevars)
+        except UnsupportedFieldTypeError:
+            raise
+        except TypeError:
+            raise UnsupportedFieldTypeError(cls.__name__, f.name, hints[f.name]) from None
+        fields.append((f.name, version, encode, decode))
+    return fields
+
+
+def _default_of(cls: type, name: str) -> Callable[[], Any]:
+    f = next(f for f in dataclasses.fields(cls) if f.name == name)
+    if f.default_factory is not dataclasses.MISSING:
+        return f.default_factory
+    return lambda: f.default
+
+
+def _typevar_bindings(cls: type) -> dict[Any, Any]:
+    """ValueObject[str] 처럼 제네릭 기반 클래스에 지정된 타입 인자를 TypeVar 에 연결"""
+    bindings: dict[Any, Any] = {}
+    for klass in reversed(cls.__mro__):
+        for base in getattr(klass, "__orig_bases__", ()):
+            origin = get_origin(base)
+            params = getattr(origin, "__parameters__", ())
+            for param, arg in zip(params, get_args(base)):
+                bindings[param] = bindings.get(arg, arg)
+    return bindings
+
+
+def _compile(hint: Any, typevars: dict[Any, Any]) -> tuple[Encoder, Decoder]:
+    if isinstance(hint, TypeVar):
+        if hint not in typevars:
+            raise TypeError(hint)
+        return _compile(typevars[hint], typevars)
+
+    origin = get_origin(hint)
+    if origin in (Union, types.UnionType):
+        args = [arg for arg in get_args(hint) if arg is not type(None)]
+        if len(args) != 1:
+            raise TypeError(hint)
+        return _optional(*_compile(args[0], typevars))
+    if origin is tuple:
+        args = get_args(hint)
+        if len(args) == 2 and args[1] is Ellipsis:
+            return _sequence(tuple, *_compile(args[0], typevars))
+        return _fixed_tuple([_compile(arg, typevars) for arg in args])
+    if origin in (list, set, frozenset):
+        (item,) = get_args(hint)
+        return _sequence(origin, *_compile(item, typevars))
+    if origin is dict:
+        key, value = get_args(hint)
+        return _mapping(_compile(key, typevars), _compile(value, typevars))
+
+    if hint is bool:
+        return _encode_bool, _decode_bool
+    if hint is int:
+        return _encode_int, _decode_int
+    if hint is float:
+        return _encode_float, _decode_float
+    if hint is str:
+        return _encode_str, _decode_str
+    if hint is bytes:
+        return _encode_bytes, _decode_bytes
+    if hint is UUID:
+        return _encode_uuid, _decode_uuid
+    if hint is datetime:
+        return _encode_datetime, _decode_datetime
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        return _enum(hint)
+    if isinstance(hint, type) and dataclasses.is_dataclass(hint):
+        return _nested(hint)
+    raise TypeError(hint)
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _encode_bool(out: bytearray, value: bool) -> None:
+    out.append(1 if value else 0)
+
+
+def _decode_bool(data: bytes, pos: int) -> tuple[bool, int]:
+    return data[pos] == 1, pos + 1
+
+
+def _encode_int(out: bytearray, value: int) -> None:
+    _write_varint(out, value << 1 if value >= 0 else (-value << 1) - 1)
+
+
+def _decode_int(data: bytes, pos: int) -> tuple[int, int]:
+    raw, pos = _read_varint(data, pos)
+    return (raw >> 1) if not raw & 1 else -((raw + 1) >> 1), pos
+
+
+def _encode_float(out: bytearray, value: float) -> None:
+    out += _FLOAT.pack(value)
+
+
+def _decode_float(data: bytes, pos: int) -> tuple[float, int]:
+    return _FLOAT.unpack_from(data, pos)[0], pos + _FLOAT.size
+
+
+def _encode_bytes(out: bytearray, value: bytes) -> None:
+    _write_varint(out, len(value))
+    out += value
+
+
+def _decode_bytes(data: bytes, pos: int) -> tuple[bytes, int]:
+    length, pos = _read_varint(data, pos)
+    return bytes(data[pos:pos + length]), pos + length
+
+
+def _encode_str(out: bytearray, value: str) -> None:
+    _encode_bytes(out, value.encode())
+
+
+def _decode_str(data: bytes, pos: int) -> tuple[str, int]:
+    length, pos = _read_varint(data, pos)
+    return str(data[pos:pos + length], "utf-8"), pos + length
+
+
+def _encode_uuid(out: bytearray, value: UUID) -> None:
+    out += value.bytes
+
+
+def _decode_uuid(data: bytes, pos: int) -> tuple[UUID, int]:
+    return UUID(bytes=bytes(data[pos:pos + 16])), pos + 16
+
+
+def _encode_datetime(out: bytearray, value: datetime) -> None:
+    # 첫 바이트는 시간대 유무, 시간대가 있으면 UTC 로 변환해 기록한다.
+    if value.tzinfo is None:
+        out.append(0)
+        out += _INT64.pack((value - _NAIVE_EPOCH) // _MICROSECOND)
+    else:
+        out.append(1)
+        out += _INT64.pack((value - _UTC_EPOCH) // _MICROSECOND)
+
+
+def _decode_datetime(data: bytes, pos: int) -> tuple[datetime, int]:
+    epoch = _UTC_EPOCH if data[pos] else _NAIVE_EPOCH
+    (micros,) = _INT64.unpack_from(data, pos + 1)
+    return epoch + timedelta(microseconds=micros), pos + 1 + _INT64.size
+
+
+def _enum(enum_type: type[Enum]) -> tuple[Encoder, Decoder]:
+    # 정의 순서가 아닌 멤버 값을 기록해야 멤버를 추가하거나 재배치해도 기존 페이로드가 그대로 복원된다.
+    value_types = {type(member.value) for member in enum_type}
+    if value_types == {int}:
+        encode_value, decode_value = _encode_int, _decode_int
+    elif value_types == {str}:
+        encode_value, decode_value = _encode_str, _decode_str
+    else:
+        raise TypeError(enum_type)
+
+    def encode(out: bytearray, value: Enum) -> None:
+        encode_value(out, value.value)
+
+    def decode(data: bytes, pos: int) -> tuple[Enum, int]:
+        value, pos = decode_value(data, pos)
+        return enum_type(value), pos
+
+    return encode, decode
+
+
+def _optional(encode_item: Encoder, decode_item: Decoder) -> tuple[Encoder, Decoder]:
+    def encode(out: bytearray, value: Any) -> None:
+        if value is None:
+            out.append(0)
+        else:
+            out.append(1)
+            encode_item(out, value)
+
+    def decode(data: bytes, pos: int) -> tuple[Any, int]:
+        if not data[pos]:
+            return None, pos + 1
+        return decode_item(data, pos + 1)
+
+    return encode, decode
+
+
+def _sequence(container: type, encode_item: Encoder, decode_item: Decoder) -> tuple[Encoder, Decoder]:
+    def encode(out: bytearray, value: Iterable[Any]) -> None:
+        _write_varint(out, len(value))
+        for item in value:
+            encode_item(out, item)
+
+    def decode(data: bytes, pos: int) -> tuple[Any, int]:
+        count, pos = _read_varint(data, pos)
+        items = []
+        for _ in range(count):
+            item, pos = decode_item(data, pos)
+            items.append(item)
+        return container(items), pos
+
+    return encode, decode
+
+
+def _fixed_tuple(codecs: list[tuple[Encoder, Decoder]]) -> tuple[Encoder, Decoder]:
+    def encode(out: bytearray, value: tuple) -> None:
+        for (encode_item, _), item in zip(codecs, value):
+            encode_item(out, item)
+
+    def decode(data: bytes, pos: int) -> tuple[tuple, int]:
+        items = []
+        for _, decode_item in codecs:
+            item, pos = decode_item(data, pos)
+            items.append(item)
+        return tuple(items), pos
+
+    return encode, decode
+
+
+def _mapping(key: tuple[Encoder, Decoder], value: tuple[Encoder, Decoder]) -> tuple[Encoder, Decoder]:
+    (encode_key, decode_key), (encode_value, decode_value) = key, value
+
+    def encode(out: bytearray, mapping: dict) -> None:
+        _write_varint(out, len(mapping))
+        for k, v in mapping.items():
+            encode_key(out, k)
+            encode_value(out, v)
+
+    def decode(data: bytes, pos: int) -> tuple[dict, int]:
+        count, pos = _read_varint(data, pos)
+        result = {}
+        for _ in range(count):
+            k, pos = decode_key(data, pos)
+            result[k], pos = decode_value(data, pos)
+        return result, pos
+
+    return encode, decode
+
+
+def _nested(cls: type) -> tuple[Encoder, Decoder]:
+    """중첩 dataclass (값 객체) 는 버전 헤더 없이 필드만 이어서 기록"""
+    fields = _schema_fields(cls)
+
+    def encode(out: bytearray, value: Any) -> None:
+        for name, _, encode_field, _ in fields:
+            encode_field(out, getattr(value, name))
+
+    def decode(data: bytes, pos: int) -> tuple[Any, int]:
+        values = {}
+        for name, _, _, decode_field in fields:
+            values[name], pos = decode_field(data, pos)
+        return cls(**values), pos
+
+    return encode, decode
@@ -0,0 +1,22 @@
+class UnsupportedFieldTypeError(Exception):
+    """바이너리 코덱이 지원하지 않는 필드 타입이 있을 때 발생하는 예외"""
+
+    def __init__(self, owner: str, field_name: str, hint: object):
+        super().__init__(f"Unsupported field type for {owner}.{field_name}: {hint!r}")
+
+
+class SchemaVersionError(Exception):
+    """페이로드의 스키마 버전을 디코딩할 수 없을 때 발생하는 예외"""
+
+    def __init__(self, message_type: str, version: int, supported: int):
+        super().__init__(
+            f"Cannot decode {message_type} schema version {version} (supported up to {supported})"
+        )
+
+
+class UnknownMessageTypeError(Exception):
+    """코덱 레지스트리에 등록되지 않은 메시지 타입을 처리하려 할 때 발생하는 예외"""
+
+    def __init__(self, message_type: str):
+        super().__init__(f"Unknown message type: {message_type}")
+        self.message_type = message_type
@@ -19,3 +19,19 @@ class FakePasswordHasher(PasswordHasher):
 def hasher():
     """테스트용 PasswordHasher 제공"""
     return FakePasswordHasher()
+
+
+class FakeAsyncPasswordHasher(FakePasswordHasher):
+    """테스트용 AsyncPasswordHasher 구현"""
+
+    async def hash_async(self, password: str) -> str:
+        return self.hash(password)
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        return self.verify(plain_password, hashed_password)
+
+
+@pytest.fixture
+def async_hasher():
+    """테스트용 AsyncPasswordHasher 제공"""
+    return FakeAsyncPasswordHasher()
@@ -0,0 +1,124 @@
+import threading
+
+import pytest
+
+from resque_api.application.auth.admission import AuthAdmissionController
+from resque_api.application.auth.exceptions import (
+    AuthenticationOverloadedError,
+    AuthenticationRateLimitedError,
+)
+from resque_api.application.ports.rate_limit import BucketDecision, TokenBucketPolicy
+from resque_api.domain.user.entities import User
+
+
+class FakeTokenBucketStore:
+    """키별 허용 횟수만 세는 테스트용 저장소"""
+
+    def __init__(self, allowed_per_key: int):
+        self.allowed_per_key = allowed_per_key
+        self.calls: dict[str, int] = {}
+
+    def consume(self, key, policy, tokens=1.0):
+        self.calls[key] = self.calls.get(key, 0) + 1
+        if self.calls[key] > self.allowed_per_key:
+            return BucketDecision(allowed=False, retry_after=3.0)
+        return BucketDecision(allowed=True)
+
+
+@pytest.fixture
+def policy():
+    return TokenBucketPolicy(capacity=2, refill_per_second=1)
+
+
+class TestAuthAdmissionController:
+    def test_authenticate_success(self, valid_user_data, hasher, policy):
+        """한도 내 요청은 인증 수행"""
+        # Given
+        user = User(**valid_user_data)
+        controller = AuthAdmissionController(FakeTokenBucketStore(5), max_concurrent=1, per_account=policy)
+
+        # When
+        is_authenticated = controller.authenticate("user@example.com", user, "validPassword123", hasher)
+
+        # Then
+        assert is_authenticated is True
+        assert controller.stats().admitted == 1
+        assert controller.stats().in_flight == 0
+
+    def test_email_bucket_applies_to_unknown_user(self, hasher, policy):
+        """존재하지 않는 사용자에 대한 시도도 이메일 버킷 소비"""
+        # Given
+        store = FakeTokenBucketStore(1)
+        controller = AuthAdmissionController(store, max_concurrent=1, per_email=policy)
+        controller.authenticate("Victim@example.com", None, "guess", hasher)
+
+        # When / Then
+        with pytest.raises(AuthenticationRateLimitedError) as exc_info:
+            controller.authenticate("victim@example.com", None, "guess", hasher)
+        assert exc_info.value.retry_after == 3.0
+        assert controller.stats().rate_limited == 1
+
+    def test_account_bucket(self, valid_user_data, hasher, policy, mocker):
+        """계정별 시도 한도 초과 시 해시 검증 전에 거부"""
+        # Given
+        user = User(**valid_user_data)
+        controller = AuthAdmissionController(FakeTokenBucketStore(1), max_concurrent=1, per_account=policy)
+        controller.authenticate("user@example.com", user, "wrong_password", hasher)
+        verify = mocker.patch.object(hasher, "verify")
+
+        # When / Then
+        with pytest.raises(AuthenticationRateLimitedError):
+            controller.authenticate("user@example.com", user, "validPassword123", hasher)
+        verify.assert_not_called()
+
+    def test_fail_fast_when_slots_and_queue_are_full(self, policy):
+        """동시 실행 한도와 대기열이 모두 차면 즉시 거부"""
+        # Given
+        controller = AuthAdmissionController(FakeTokenBucketStore(100), max_concurrent=1, max_waiting=0)
+        entered, release = threading.Event(), threading.Event()
+
+        def hold_slot():
+            with controller.slot():
+                entered.set()
+                release.wait(timeout=5)
+
+        worker = threading.Thread(target=hold_slot)
+        worker.start()
+        entered.wait(timeout=5)
+
+        # When / Then
+        with pytest.raises(AuthenticationOverloadedError):
+            with controller.slot():
+                pass
+        assert controller.stats().overloaded == 1
+
+        release.set()
+        worker.join()
+        assert controller.stats().in_flight == 0
+
+    def test_waiting_request_times_out(self):
+        """대기열에 들어간 요청도 제한 시간이 지나면 거부"""
+        # Given
+        controller = AuthAdmissionController(
+            FakeTokenBucketStore(100), max_concurrent=1, max_waiting=1, wait_timeout=0.01
+        )
+
+        # When / Then
+        with controller.slot():
+            with pytest.raises(AuthenticationOverloadedError):
+                with controller.slot():
+                    pass
+        assert controller.stats().waiting == 0
+
+    def test_rejection_paths_do_not_take_slots(self, valid_user_data, hasher):
+        """해시 검증이 필요 없는 요청은 실행 슬롯을 쓰지 않음"""
+        # Given
+        user = User(**{**valid_user_data, "password": None})
+        controller = AuthAdmissionController(FakeTokenBucketStore(100), max_concurrent=1)
+
+        # When
+        is_authenticated = controller.authenticate("user@example.com", user, "validPassword123", hasher)
+
+        # Then
+        assert is_authenticated is False
+        assert controller.stats().admitted == 0
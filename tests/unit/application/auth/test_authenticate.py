@@ -1,6 +1,12 @@
+import asyncio
+
 import pytest
 
-from resque_api.application.auth.authenticate import authenticate_user
+from resque_api.application.auth.authenticate import (
+    authenticate_user,
+    authenticate_user_async,
+    authenticate_user_with_rehash,
+)
 from resque_api.domain.user.entities import User
 from resque_api.domain.user.value_objects import Password
 
@@ -37,3 +43,82 @@ class TestAuthenticate:
 
         # Then
         assert is_authenticated is False
+
+
+class TestAuthenticateAsync:
+    def test_authenticate_user_async_success(self, valid_user_data, async_hasher):
+        """비동기 사용자 인증 성공 테스트"""
+        # Given
+        user = User(**valid_user_data)
+
+        # When
+        is_authenticated = asyncio.run(
+            authenticate_user_async(user, "validPassword123", async_hasher)
+        )
+
+        # Then
+        assert is_authenticated is True
+
+    def test_authenticate_user_async_with_wrong_password(self, valid_user_data, async_hasher):
+        """비동기 인증 - 잘못된 비밀번호로 인증 실패 테스트"""
+        # Given
+        user = User(**valid_user_data)
+
+        # When
+        is_authenticated = asyncio.run(
+            authenticate_user_async(user, "wrong_password", async_hasher)
+        )
+
+        # Then
+        assert is_authenticated is False
+
+    def test_authenticate_user_async_with_invalid_user(self, async_hasher):
+        """비동기 인증 - 유효하지 않은 사용자로 인증 실패 테스트"""
+        # When
+        is_authenticated = asyncio.run(
+            authenticate_user_async(None, "any_password", async_hasher)
+        )
+
+        # Then
+        assert is_authenticated is False
+
+
+class TestAuthenticateWithRehash:
+    def test_no_rehash_when_hash_is_current(self, valid_user_data, hasher):
+        """해시 설정이 같으면 재해시하지 않음"""
+        # Given
+        user = User(**valid_user_data)
+
+        # When
+        result = authenticate_user_with_rehash(user, "validPassword123", hasher)
+
+        # Then
+        assert result.authenticated is True
+        assert result.rehashed_password is None
+
+    def test_rehash_when_hasher_requires_it(self, valid_user_data, hasher, mocker):
+        """재해시가 필요하면 새 해시를 함께 반환"""
+        # Given
+        user = User(**valid_user_data)
+        mocker.patch.object(hasher, "needs_rehash", return_value=True)
+
+        # When
+        result = authenticate_user_with_rehash(user, "validPassword123", hasher)
+
+        # Then
+        assert result.authenticated is True
+        assert result.rehashed_password == hasher.hash("validPassword123")
+
+    def test_no_rehash_on_failed_authentication(self, valid_user_data, hasher, mocker):
+        """인증 실패 시 재해시하지 않음"""
+        # Given
+        user = User(**valid_user_data)
+        needs_rehash = mocker.patch.object(hasher, "needs_rehash", return_value=True)
+
+        # When
+        result = authenticate_user_with_rehash(user, "wrong_password", hasher)
+
+        # Then
+        assert result.authenticated is False
+        assert result.rehashed_password is None
+        needs_rehash.assert_not_called()
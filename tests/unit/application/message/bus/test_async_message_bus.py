@@ -0,0 +1,243 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import pytest
+from resque_api.application.message.bus.async_message_bus import AsyncMessageBus
+from resque_api.application.message.bus.batch import BatchFailurePolicy
+from resque_api.application.message.bus.exceptions import (
+    HandlerNotFoundError,
+    HandlerTimeoutError,
+    MiddlewareNotSupportedError,
+)
+from resque_api.application.message.bus.metrics import MetricsMiddleware
+from resque_api.application.message.command.base.command import Command
+from resque_api.application.message.event.base.event import Event
+from tests.unit.fakes import FakeUnitOfWork
+
+
+@dataclass(frozen=True, kw_only=True)
+class SampleCommand(Command):
+    value: int = 0
+
+
+@dataclass(frozen=True, kw_only=True)
+class SampleEvent(Event):
+    name: str = "sample"
+
+
+def now():
+    return datetime.now(timezone.utc)
+
+
+class StoringUnitOfWork(FakeUnitOfWork):
+    def __init__(self, store=None):
+        super().__init__()
+        self.store = store if store is not None else []
+        self.pending = []
+
+    def commit(self):
+        super().commit()
+        self.store.extend(self.pending)
+        self.pending.clear()
+
+    def rollback(self):
+        super().rollback()
+        self.pending.clear()
+
+
+class WritingEventHandler:
+    def __init__(self, name, fail=False, delay=0.0):
+        self.name = name
+        self.fail = fail
+        self.delay = delay
+
+    async def handle(self, event, uow):
+        uow.pending.append(self.name)
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(self.name)
+
+
+class EchoCommandHandler:
+    def __init__(self, events=()):
+        self.events = events
+
+    async def handle(self, command, uow):
+        for event in self.events:
+            uow.publish(event)
+        return command.value * 2
+
+
+class SleepingEventHandler:
+    def __init__(self, delay, log):
+        self.delay = delay
+        self.log = log
+
+    async def handle(self, event, uow):
+        self.log.append(("start", self.delay))
+        await asyncio.sleep(self.delay)
+        self.log.append(("end", self.delay))
+
+
+@pytest.fixture
+def uow():
+    return StoringUnitOfWork()
+
+
+class TestAsyncMessageBus:
+    def test_publish_async_command(self, uow):
+        bus = AsyncMessageBus(uow)
+        bus.subscribe(EchoCommandHandler(), SampleCommand)
+
+        result = asyncio.run(bus.publish(SampleCommand(value=21, occured_at=now())))
+
+        assert result == 42
+
+    def test_publish_unregistered_command(self, uow):
+        bus = AsyncMessageBus(uow)
+
+        with pytest.raises(HandlerNotFoundError):
+            asyncio.run(bus.publish(SampleCommand(occured_at=now())))
+
+    def test_event_handlers_run_concurrently(self, uow):
+        log = []
+        bus = AsyncMessageBus(uow, uow_factory=StoringUnitOfWork)
+        bus.subscribe(EchoCommandHandler(events=(SampleEvent(occured_at=now()),)), SampleCommand)
+        bus.subscribe(SleepingEventHandler(0.02, log), SampleEvent)
+        bus.subscribe(SleepingEventHandler(0.01, log), SampleEvent)
+
+        asyncio.run(bus.publish(SampleCommand(occured_at=now())))
+
+        assert log[:2] == [("start", 0.02), ("start", 0.01)]
+        assert log[2:] == [("end", 0.01), ("end", 0.02)]
+        assert len(bus.event_queue) == 0
+
+    def test_concurrency_limit(self, uow):
+        log = []
+        bus = AsyncMessageBus(uow, max_concurrency=1, uow_factory=StoringUnitOfWork)
+        bus.subscribe(SleepingEventHandler(0.02, log), SampleEvent)
+        bus.subscribe(SleepingEventHandler(0.01, log), SampleEvent)
+
+        asyncio.run(bus.publish(SampleEvent(occured_at=now())))
+
+        assert log == [("start", 0.02), ("end", 0.02), ("start", 0.01), ("end", 0.01)]
+
+    def test_concurrency_limit_spans_overlapping_publishes(self, uow):
+        running = []
+        peak = []
+
+        class TrackingEventHandler:
+            async def handle(self, event, uow):
+                running.append(event)
+                peak.append(len(running))
+                await asyncio.sleep(0.01)
+                running.remove(event)
+
+        bus = AsyncMessageBus(uow, max_concurrency=1, uow_factory=StoringUnitOfWork)
+        bus.subscribe(TrackingEventHandler(), SampleEvent)
+
+        async def publish_overlapping():
+            await asyncio.gather(*(bus.publish(SampleEvent(occured_at=now())) for _ in range(3)))
+
+        asyncio.run(publish_overlapping())
+        asyncio.run(publish_overlapping())
+
+        assert len(peak) == 6
+        assert max(peak) == 1
+
+    def test_shared_uow_runs_handlers_one_at_a_time(self, uow):
+        log = []
+        bus = AsyncMessageBus(uow)
+        bus.subscribe(SleepingEventHandler(0.02, log), SampleEvent)
+        bus.subscribe(SleepingEventHandler(0.01, log), SampleEvent)
+
+        asyncio.run(bus.publish(SampleEvent(occured_at=now())))
+
+        assert log == [("start", 0.02), ("end", 0.02), ("start", 0.01), ("end", 0.01)]
+
+    @pytest.mark.parametrize("concurrent", [False, True])
+    def test_failed_handler_writes_are_not_committed_by_siblings(self, concurrent):
+        store = []
+        bus = AsyncMessageBus(
+            StoringUnitOfWork(store), uow_factory=(lambda: StoringUnitOfWork(store)) if concurrent else None
+        )
+        bus.subscribe(WritingEventHandler("failed", fail=True), SampleEvent)
+        bus.subscribe(WritingEventHandler("ok", delay=0.01), SampleEvent)
+
+        with pytest.raises(RuntimeError, match="failed"):
+            asyncio.run(bus.publish(SampleEvent(occured_at=now())))
+
+        assert store == ["ok"]
+
+    def test_handler_timeout(self, uow):
+        log = []
+        bus = AsyncMessageBus(uow, handler_timeout=0.01)
+        bus.subscribe(SleepingEventHandler(1, log), SampleEvent)
+
+        with pytest.raises(HandlerTimeoutError, match="SleepingEventHandler"):
+            asyncio.run(bus.publish(SampleEvent(occured_at=now())))
+
+    def test_sync_handlers_are_supported(self, uow, mocker):
+        handler = mocker.Mock()
+        bus = AsyncMessageBus(uow)
+        bus.subscribe(handler, SampleEvent)
+        event = SampleEvent(occured_at=now())
+
+        asyncio.run(bus.publish(event))
+
+        handler.handle.assert_called_once_with(event, uow)
+
+    def test_middleware_is_rejected(self, uow):
+        bus = AsyncMessageBus(uow)
+
+        with pytest.raises(MiddlewareNotSupportedError):
+            bus.add_middleware(MetricsMiddleware())
+        assert bus.middlewares == []
+
+    def test_invalid_concurrency(self, uow):
+        with pytest.raises(ValueError):
+            AsyncMessageBus(uow, max_concurrency=0)
+
+
+class FailingCommandHandler:
+    async def handle(self, command, uow):
+        raise ValueError(command.value)
+
+
+@dataclass(frozen=True, kw_only=True)
+class FailingCommand(Command):
+    value: int = 0
+
+
+class TestAsyncPublishMany:
+    def test_awaits_handlers_and_dispatches_events(self, uow):
+        log = []
+        bus = AsyncMessageBus(uow)
+        bus.subscribe(EchoCommandHandler(events=(SampleEvent(occured_at=now()),)), SampleCommand)
+        bus.subscribe(SleepingEventHandler(0, log), SampleEvent)
+
+        result = asyncio.run(bus.publish_many([SampleCommand(value=1), SampleCommand(value=2)]))
+
+        assert result.results == (2, 4)
+        assert result.ok
+        assert log == [("start", 0), ("end", 0), ("start", 0), ("end", 0)]
+
+    def test_savepoint_policy_collects_errors(self, uow):
+        bus = AsyncMessageBus(uow)
+        bus.subscribe(EchoCommandHandler(), SampleCommand)
+        bus.subscribe(FailingCommandHandler(), FailingCommand)
+
+        result = asyncio.run(
+            bus.publish_many([SampleCommand(value=1), FailingCommand(value=2)], policy=BatchFailurePolicy.SAVEPOINT)
+        )
+
+        assert result.results == (2, None)
+        assert isinstance(result.errors[1], ValueError)
+
+    def test_all_or_nothing_propagates_error(self, uow):
+        bus = AsyncMessageBus(uow)
+        bus.subscribe(FailingCommandHandler(), FailingCommand)
+
+        with pytest.raises(ValueError):
+            asyncio.run(bus.publish_many([FailingCommand(value=1)]))
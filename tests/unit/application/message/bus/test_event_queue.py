@@ -0,0 +1,253 @@
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import pytest
+from resque_api.application.message.bus.event_queue import BoundedEventQueue, OverflowPolicy
+from resque_api.application.message.bus.exceptions import EventQueueFullError
+from resque_api.application.message.bus.message_bus import MessageBus
+from resque_api.application.message.command.base.command import Command
+from resque_api.application.message.event.base.event import Event
+from resque_api.application.ports.uow import UnitOfWork
+from tests.unit.fakes import FakeUnitOfWork
+
+
+@dataclass(frozen=True, kw_only=True)
+class NumberedEvent(Event):
+    number: int
+
+
+@dataclass(frozen=True, kw_only=True)
+class EmitEvents(Command):
+    ...
+
+
+def make_events(count, start=0):
+    return [NumberedEvent(occured_at=datetime.now(timezone.utc), number=n) for n in range(start, start + count)]
+
+
+def drain(queue):
+    return [queue.popleft().number for _ in range(len(queue))]
+
+
+class TestBoundedEventQueue:
+    def test_fifo_order(self):
+        """용량 안에서는 추가한 순서대로 꺼낸다"""
+        # Given
+        queue = BoundedEventQueue(capacity=5)
+        queue.extend(make_events(3))
+
+        # When / Then
+        assert len(queue) == 3
+        assert drain(queue) == [0, 1, 2]
+        assert not queue
+
+    def test_pop_from_empty_queue_raises(self):
+        """빈 큐에서 꺼내면 IndexError"""
+        with pytest.raises(IndexError):
+            BoundedEventQueue().popleft()
+
+    def test_invalid_capacity(self):
+        """용량은 1 이상이어야 한다"""
+        with pytest.raises(ValueError):
+            BoundedEventQueue(capacity=0)
+
+    def test_unbounded_capacity(self):
+        """capacity 가 None 이면 용량 제한 없이 추가한다"""
+        queue = BoundedEventQueue(capacity=None)
+
+        queue.extend(make_events(20_000))
+
+        assert len(queue) == 20_000
+        assert queue.stats().rejected == 0
+
+    def test_reject_policy_raises_when_full(self):
+        """REJECT 정책은 가득 찬 큐에 추가하면 EventQueueFullError 를 발생시킨다"""
+        # Given
+        queue = BoundedEventQueue(capacity=2, policy=OverflowPolicy.REJECT)
+        queue.extend(make_events(2))
+
+        # When / Then
+        with pytest.raises(EventQueueFullError, match="이벤트 큐가 가득 찼습니다"):
+            queue.append(make_events(1, start=2)[0])
+        assert queue.stats().rejected == 1
+        assert drain(queue) == [0, 1]
+
+    def test_drop_oldest_policy(self):
+        """DROP_OLDEST 정책은 가장 오래된 이벤트를 버린다"""
+        # Given
+        queue = BoundedEventQueue(capacity=3, policy=OverflowPolicy.DROP_OLDEST)
+
+        # When
+        queue.extend(make_events(5))
+
+        # Then
+        assert drain(queue) == [2, 3, 4]
+        assert queue.stats().dropped == 2
+
+    def test_block_policy_times_out(self):
+        """BLOCK 정책은 block_timeout 동안 자리가 나지 않으면 EventQueueFullError"""
+        # Given
+        queue = BoundedEventQueue(capacity=1, policy=OverflowPolicy.BLOCK, block_timeout=0.01)
+        queue.extend(make_events(1))
+
+        # When / Then
+        with pytest.raises(EventQueueFullError):
+            queue.append(make_events(1, start=1)[0])
+
+    def test_block_policy_waits_for_consumer(self):
+        """BLOCK 정책은 다른 스레드가 꺼내면 대기를 마치고 추가한다"""
+        # Given
+        queue = BoundedEventQueue(capacity=1, policy=OverflowPolicy.BLOCK, block_timeout=5)
+        queue.extend(make_events(1))
+        consumed = []
+        consumer = threading.Timer(0.05, lambda: consumed.append(queue.popleft().number))
+
+        # When
+        consumer.start()
+        queue.append(make_events(1, start=1)[0])
+        consumer.join()
+
+        # Then
+        assert consumed == [0]
+        assert drain(queue) == [1]
+
+    def test_spill_policy_preserves_order(self, tmp_path):
+        """SPILL 정책은 초과분을 파일에 기록하고 순서를 유지한다"""
+        # Given
+        queue = BoundedEventQueue(capacity=2, policy=OverflowPolicy.SPILL, spill_dir=str(tmp_path))
+
+        # When
+        queue.extend(make_events(5))
+        stats = queue.stats()
+        first = queue.popleft()
+        queue.extend(make_events(2, start=5))
+
+        # Then
+        assert (stats.depth, stats.in_memory, stats.spilled) == (5, 2, 3)
+        assert first.number == 0
+        assert drain(queue) == [1, 2, 3, 4, 5, 6]
+        assert queue.stats().spilled_total == 5
+        queue.close()
+
+    def test_high_water_mark(self):
+        """high_water_mark 는 꺼낸 뒤에도 최대 길이를 유지한다"""
+        # Given
+        queue = BoundedEventQueue(capacity=10)
+        queue.extend(make_events(4))
+
+        # When
+        drain(queue)
+        queue.extend(make_events(2))
+
+        # Then
+        stats = queue.stats()
+        assert stats.depth == 2
+        assert stats.high_water_mark == 4 == queue.high_water_mark
+
+    def test_clear_removes_spilled_events(self, tmp_path):
+        """clear 는 파일에 기록된 이벤트도 제거한다"""
+        # Given
+        queue = BoundedEventQueue(capacity=1, policy=OverflowPolicy.SPILL, spill_dir=str(tmp_path))
+        queue.extend(make_events(3))
+
+        # When
+        queue.clear()
+
+        # Then
+        assert len(queue) == 0
+        queue.extend(make_events(1, start=7))
+        assert drain(queue) == [7]
+
+
+class TestMessageBusEventQueue:
+    def test_bus_drains_spilled_events(self, mocker, tmp_path):
+        """버스는 파일로 넘친 이벤트까지 순서대로 처리한다"""
+        # Given
+        uow = mocker.create_autospec(UnitOfWork, instance=True)
+        uow.pop_events.side_effect = [make_events(4)] + [()] * 4
+        queue = BoundedEventQueue(capacity=2, policy=OverflowPolicy.SPILL, spill_dir=str(tmp_path))
+        bus = MessageBus(uow, event_queue=queue)
+        received = []
+        handler = mocker.Mock()
+        handler.handle.side_effect = lambda event, uow: received.append(event.number)
+        bus.subscribe(handler, NumberedEvent)
+
+        # When
+        bus._collect_events()
+        bus._dispatch_events()
+
+        # Then
+        assert received == [0, 1, 2, 3]
+        assert queue.stats().high_water_mark == 4
+        assert len(queue) == 0
+
+    def test_bus_propagates_queue_full(self, mocker):
+        """REJECT 큐가 가득 차면 이벤트 수집 시 EventQueueFullError 가 전파된다"""
+        # Given
+        uow = mocker.create_autospec(UnitOfWork, instance=True)
+        uow.pop_events.return_value = make_events(3)
+        bus = MessageBus(uow, event_queue=BoundedEventQueue(capacity=2))
+
+        # When / Then
+        with pytest.raises(EventQueueFullError):
+            bus._collect_events()
+
+    def test_default_bus_queue_keeps_every_committed_event(self):
+        """기본 이벤트 큐는 용량 제한이 없어 커밋된 이벤트를 모두 처리한다"""
+        # Given
+        handled = []
+
+        class EmittingHandler:
+            def handle(self, command, uow):
+                for event in make_events(10_001):
+                    uow.publish(event)
+
+        class CountingHandler:
+            def handle(self, event, uow):
+                handled.append(event.number)
+
+        bus = MessageBus(FakeUnitOfWork())
+        bus.subscribe(EmittingHandler(), EmitEvents)
+        bus.subscribe(CountingHandler(), NumberedEvent)
+
+        # When
+        bus.publish(EmitEvents())
+
+        # Then
+        assert len(handled) == 10_001
+        assert len(bus.event_queue) == 0
+
+    def test_bus_rejects_block_policy(self, mocker):
+        """BLOCK 큐는 publish 스레드가 스스로를 기다리게 되므로 버스 생성 시 거부된다"""
+        # Given
+        uow = mocker.create_autospec(UnitOfWork, instance=True)
+        queue = BoundedEventQueue(capacity=2, policy=OverflowPolicy.BLOCK)
+
+        # When / Then
+        with pytest.raises(ValueError):
+            MessageBus(uow, event_queue=queue)
+
+    def test_command_raising_more_events_than_capacity_fails_fast(self):
+        """커맨드가 용량보다 많은 이벤트를 발생시키면 멈추지 않고 EventQueueFullError 를 발생시킨다"""
+        # Given
+        class EmittingHandler:
+            def handle(self, command, uow):
+                for event in make_events(3):
+                    uow.publish(event)
+
+        bus = MessageBus(FakeUnitOfWork(), event_queue=BoundedEventQueue(capacity=2))
+        bus.subscribe(EmittingHandler(), EmitEvents)
+        outcome = []
+        publisher = threading.Thread(
+            target=lambda: outcome.append(pytest.raises(EventQueueFullError, bus.publish, EmitEvents())),
+            daemon=True,
+        )
+
+        # When
+        publisher.start()
+        publisher.join(timeout=5)
+
+        # Then
+        assert not publisher.is_alive()
+        assert outcome
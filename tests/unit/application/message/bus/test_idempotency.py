@@ -0,0 +1,170 @@
+from dataclasses import dataclass
+
+import pytest
+from resque_api.application.message.bus.batch import BatchFailurePolicy
+from resque_api.application.message.bus.idempotency import IdempotencyMiddleware, idempotency_key
+from resque_api.application.message.bus.message_bus import MessageBus
+from resque_api.application.message.command.base.command import Command
+from resque_api.infrastructure.idempotency.memory_store import InMemoryIdempotencyStore
+from tests.unit.fakes import FakeUnitOfWork
+
+
+@dataclass(frozen=True, kw_only=True)
+class InviteMember(Command):
+    email: str
+
+
+class InviteMemberHandler:
+    def __init__(self):
+        self.invited = []
+
+    def handle(self, command, uow):
+        with uow:
+            if command.email in self.invited:
+                raise ValueError(f"{command.email} already invited")
+            if command.email == "fail@example.com":
+                raise RuntimeError("fail")
+            self.invited.append(command.email)
+        return f"invitation:{command.email}"
+
+
+@pytest.fixture
+def store():
+    return InMemoryIdempotencyStore()
+
+
+@pytest.fixture
+def middleware(store):
+    return IdempotencyMiddleware(store)
+
+
+@pytest.fixture
+def handler():
+    return InviteMemberHandler()
+
+
+def make_bus(uow, handler, middleware):
+    bus = MessageBus(uow)
+    bus.subscribe(handler, InviteMember)
+    bus.add_middleware(middleware)
+    return bus
+
+
+class TestIdempotencyMiddleware:
+    def test_repeat_returns_cached_result(self, handler, middleware):
+        """같은 커맨드를 다시 보내면 핸들러를 실행하지 않고 저장된 결과를 반환한다"""
+        # Given
+        bus = make_bus(FakeUnitOfWork(), handler, middleware)
+        command = InviteMember(email="a@example.com")
+
+        # When
+        first = bus.publish(command)
+        second = bus.publish(command)
+
+        # Then
+        assert first == second == "invitation:a@example.com"
+        assert handler.invited == ["a@example.com"]
+        stats = middleware.stats()
+        assert (stats.hits, stats.misses, stats.stored) == (1, 1, 1)
+        assert stats.hit_ratio == 0.5
+
+    def test_client_supplied_key(self, handler, middleware):
+        """클라이언트 키가 같으면 메시지 id 가 달라도 같은 요청으로 본다"""
+        bus = make_bus(FakeUnitOfWork(), handler, middleware)
+
+        first = bus.publish(InviteMember(email="a@example.com", idempotency_key="req-1"))
+        second = bus.publish(InviteMember(email="a@example.com", idempotency_key="req-1"))
+
+        assert first == second
+        assert handler.invited == ["a@example.com"]
+
+    def test_failed_command_is_not_stored(self, handler, middleware, store):
+        """실패한 커맨드의 결과는 저장되지 않아 재시도 시 다시 실행된다"""
+        # Given
+        bus = make_bus(FakeUnitOfWork(), handler, middleware)
+        command = InviteMember(email="fail@example.com")
+
+        # When
+        with pytest.raises(RuntimeError):
+            bus.publish(command)
+
+        # Then
+        assert store.get(idempotency_key(command)) is None
+
+    def test_result_is_stored_only_after_commit(self, handler, middleware, store):
+        """커밋이 실패하면 결과를 저장하지 않는다"""
+        bus = make_bus(FakeUnitOfWork(fail_commit=True), handler, middleware)
+        command = InviteMember(email="a@example.com")
+
+        with pytest.raises(RuntimeError, match="commit failed"):
+            bus.publish(command)
+
+        assert store.get(idempotency_key(command)) is None
+
+    def test_rolled_back_batch_is_not_stored_later(self, handler, middleware, store):
+        """롤백된 일괄 실행의 결과가 다음 커밋에 섞여 저장되지 않는다"""
+        # Given
+        bus = make_bus(FakeUnitOfWork(), handler, middleware)
+        rolled_back = InviteMember(email="a@example.com")
+
+        # When
+        with pytest.raises(RuntimeError):
+            bus.publish_many([rolled_back, InviteMember(email="fail@example.com")])
+        bus.publish(InviteMember(email="b@example.com"))
+
+        # Then
+        assert store.get(idempotency_key(rolled_back)) is None
+
+    def test_savepoint_batch_stores_successful_commands(self, handler, middleware, store):
+        """SAVEPOINT 일괄 실행은 성공한 커맨드의 결과만 저장한다"""
+        bus = make_bus(FakeUnitOfWork(), handler, middleware)
+        ok, failed = InviteMember(email="a@example.com"), InviteMember(email="fail@example.com")
+
+        bus.publish_many([ok, failed], policy=BatchFailurePolicy.SAVEPOINT)
+
+        assert store.get(idempotency_key(ok)).result == "invitation:a@example.com"
+        assert store.get(idempotency_key(failed)) is None
+
+    def test_nested_command_is_stored_after_outer_commit(self, handler, middleware, store):
+        """바깥 트랜잭션에 합류한 커맨드의 결과는 바깥 트랜잭션이 커밋된 뒤에 저장된다"""
+        # Given
+        uow = FakeUnitOfWork()
+        bus = make_bus(uow, handler, middleware)
+        command = InviteMember(email="a@example.com")
+
+        # When
+        with uow:
+            bus.publish(command)
+            stored_before_commit = store.get(idempotency_key(command))
+
+        # Then
+        assert stored_before_commit is None
+        assert store.get(idempotency_key(command)).result == "invitation:a@example.com"
+
+    def test_nested_command_is_not_stored_when_outer_rolls_back(self, handler, middleware, store):
+        """바깥 트랜잭션이 롤백되면 합류한 커맨드의 결과를 저장하지 않아 재시도 시 다시 실행된다"""
+        # Given
+        uow = FakeUnitOfWork()
+        bus = make_bus(uow, handler, middleware)
+        command = InviteMember(email="a@example.com")
+
+        # When
+        with pytest.raises(RuntimeError):
+            with uow:
+                bus.publish(command)
+                raise RuntimeError("outer failed")
+
+        # Then
+        assert store.get(idempotency_key(command)) is None
+        assert middleware.stats().stored == 0
+
+    def test_key_is_scoped_by_command_type(self):
+        """멱등성 키는 커맨드 타입별로 구분된다"""
+
+        @dataclass(frozen=True, kw_only=True)
+        class OtherCommand(Command):
+            pass
+
+        assert idempotency_key(OtherCommand(idempotency_key="k")) != idempotency_key(
+            InviteMember(email="a@example.com", idempotency_key="k")
+        )
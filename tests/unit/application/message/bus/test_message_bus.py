@@ -1,10 +1,30 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
 import pytest
+from resque_api.application.message.bus.batch import BatchFailurePolicy
+from resque_api.application.message.bus.exceptions import HandlerNotFoundError
 from resque_api.application.message.bus.message_bus import MessageBus
 from resque_api.application.message.command.base.command import Command
 from resque_api.application.message.event.base.event import Event
 from resque_api.application.ports.uow import UnitOfWork
 from resque_api.application.message.command.base.command_handler import CommandHandler
-from resque_api.application.message.event.base.event_handler import EventHandler
+from resque_api.application.message.event.base.event_handler import BatchEventHandler, EventHandler
+from tests.unit.fakes import FakeUnitOfWork
+
+
+@dataclass(frozen=True, kw_only=True)
+class SampleEvent(Event):
+    name: str = "sample"
+
+
+@dataclass(frozen=True, kw_only=True)
+class FollowUpEvent(Event):
+    name: str = "follow-up"
+
+
+def make_event(event_type=SampleEvent, **kwargs):
+    return event_type(occured_at=datetime.now(timezone.utc), **kwargs)
 
 
 @pytest.fixture
@@ -25,7 +45,9 @@ def mock_event(mocker):
 
 @pytest.fixture
 def uow(mocker):
-    return mocker.create_autospec(UnitOfWork, instance=True)
+    uow = mocker.create_autospec(UnitOfWork, instance=True)
+    uow.pop_events.return_value = ()
+    return uow
 
 @pytest.fixture
 def message_bus(uow):
@@ -54,19 +76,275 @@ class TestMessagePublishing:
             message_bus.publish(mock_command)
 
 class TestEventQueue:
-    def test_add_event_to_queue(self, message_bus, mock_event_handler, mock_event, mocker):
-        message_bus.subscribe(mock_event_handler, type(mock_event))
-        message_bus.uow.pop_events.return_value = [mock_event]
+    def test_events_from_command_are_dispatched(self, message_bus, mock_command_handler, mock_command, mock_event_handler):
+        event = make_event()
+        message_bus.subscribe(mock_command_handler, type(mock_command))
+        message_bus.subscribe(mock_event_handler, SampleEvent)
+        message_bus.uow.pop_events.side_effect = [(event,), ()]
+
+        message_bus.publish(mock_command)
+
+        mock_event_handler.handle.assert_called_once_with(event, message_bus.uow)
+
+    def test_process_event_queue(self, message_bus, mock_command_handler, mock_command):
+        message_bus.subscribe(mock_command_handler, type(mock_command))
+        message_bus.uow.pop_events.side_effect = [(make_event(), make_event()), ()]
+
+        message_bus.publish(mock_command)
+
+        assert len(message_bus.event_queue) == 0
+
+    def test_events_of_failed_commit_are_not_dispatched_later(self, mock_event_handler):
+        class EmittingHandler:
+            def handle(self, command, uow):
+                uow.publish(make_event(name=command.name))
+
+        @dataclass(frozen=True, kw_only=True)
+        class Emit(Command):
+            name: str
+
+        uow = FakeUnitOfWork(fail_commit=True)
+        bus = MessageBus(uow)
+        bus.subscribe(EmittingHandler(), Emit)
+        bus.subscribe(mock_event_handler, SampleEvent)
+
+        with pytest.raises(RuntimeError, match="commit failed"):
+            bus.publish(Emit(name="first"))
+        uow.fail_commit = False
+        bus.publish(Emit(name="second"))
+
+        handled = [call.args[0].name for call in mock_event_handler.handle.call_args_list]
+        assert handled == ["second"]
+
+    def test_unhandled_event_is_ignored(self, message_bus):
+        message_bus.publish(make_event())
+
+        assert len(message_bus.event_queue) == 0
+
+
+class TestEventFanOut:
+    def test_event_fans_out_to_every_handler(self, message_bus, mocker):
+        handlers = [mocker.create_autospec(EventHandler, instance=True) for _ in range(3)]
+        for handler in handlers:
+            message_bus.subscribe(handler, SampleEvent)
+        event = make_event()
+
+        message_bus.publish(event)
+
+        for handler in handlers:
+            handler.handle.assert_called_once_with(event, message_bus.uow)
+
+    def test_prevent_duplicate_event_handler(self, message_bus, mock_event_handler):
+        message_bus.subscribe(mock_event_handler, SampleEvent)
+        with pytest.raises(Exception, match="핸들러가 이미 등록되었습니다"):
+            message_bus.subscribe(mock_event_handler, SampleEvent)
+
+    def test_events_raised_by_handlers_are_processed(self, message_bus, mocker):
+        follow_up = make_event(FollowUpEvent)
+        first = mocker.create_autospec(EventHandler, instance=True)
+        second = mocker.create_autospec(EventHandler, instance=True)
+        message_bus.subscribe(first, SampleEvent)
+        message_bus.subscribe(second, FollowUpEvent)
+        message_bus.uow.pop_events.side_effect = [(follow_up,), ()]
+
+        message_bus.publish(make_event())
+
+        second.handle.assert_called_once_with(follow_up, message_bus.uow)
+        assert len(message_bus.event_queue) == 0
+
+
+class TestBatchEventHandler:
+    def test_batch_handler_receives_events_of_one_cycle(self, message_bus, mock_command_handler, mock_command, mocker):
+        batch_handler = mocker.create_autospec(BatchEventHandler, instance=True)
+        message_bus.subscribe(mock_command_handler, type(mock_command))
+        message_bus.subscribe_batch(batch_handler, SampleEvent)
+        events = (make_event(name="a"), make_event(FollowUpEvent), make_event(name="b"))
+        message_bus.uow.pop_events.side_effect = [events, ()]
+
+        message_bus.publish(mock_command)
+
+        batch_handler.handle_batch.assert_called_once_with((events[0], events[2]), message_bus.uow)
+
+    def test_batch_handler_called_per_cycle(self, message_bus, mocker):
+        per_event = mocker.create_autospec(EventHandler, instance=True)
+        batch_handler = mocker.create_autospec(BatchEventHandler, instance=True)
+        message_bus.subscribe(per_event, FollowUpEvent)
+        message_bus.subscribe_batch(batch_handler, SampleEvent)
+        chained = make_event(name="chained")
+        message_bus.uow.pop_events.side_effect = [(chained,), ()]
+
+        message_bus.publish(make_event(FollowUpEvent))
+
+        batch_handler.handle_batch.assert_called_once_with((chained,), message_bus.uow)
+
+
+@dataclass(frozen=True, kw_only=True)
+class SpecialEvent(SampleEvent):
+    name: str = "special"
+
+
+class TestPolymorphicDispatch:
+    def test_base_event_handler_receives_subclass_events(self, message_bus, mocker):
+        base_handler = mocker.create_autospec(EventHandler, instance=True)
+        specific_handler = mocker.create_autospec(EventHandler, instance=True)
+        message_bus.subscribe(base_handler, Event)
+        message_bus.subscribe(specific_handler, SpecialEvent)
+        event = make_event(SpecialEvent)
+
+        message_bus.publish(event)
+
+        base_handler.handle.assert_called_once_with(event, message_bus.uow)
+        specific_handler.handle.assert_called_once_with(event, message_bus.uow)
+        assert message_bus.resolve_event_handlers(SpecialEvent) == (specific_handler, base_handler)
+
+    def test_handler_registered_on_several_bases_is_called_once(self, message_bus, mock_event_handler):
+        message_bus.subscribe(mock_event_handler, SampleEvent)
+        message_bus.subscribe(mock_event_handler, SpecialEvent)
+
+        message_bus.publish(make_event(SpecialEvent))
+
+        mock_event_handler.handle.assert_called_once()
+
+    def test_most_specific_command_handler_wins(self, message_bus, mocker):
+        @dataclass(frozen=True, kw_only=True)
+        class BaseCommand(Command):
+            ...
+
+        @dataclass(frozen=True, kw_only=True)
+        class ChildCommand(BaseCommand):
+            ...
+
+        base_handler = mocker.create_autospec(CommandHandler, instance=True)
+        child_handler = mocker.create_autospec(CommandHandler, instance=True)
+        message_bus.subscribe(base_handler, BaseCommand)
+
+        assert message_bus.resolve_handler(ChildCommand) is base_handler
+
+        message_bus.subscribe(child_handler, ChildCommand)
+
+        assert message_bus.resolve_handler(ChildCommand) is child_handler
+        assert message_bus.resolve_handler(BaseCommand) is base_handler
+
+    def test_resolution_cache_is_invalidated_on_subscribe(self, message_bus, mocker):
+        first = mocker.create_autospec(EventHandler, instance=True)
+        second = mocker.create_autospec(EventHandler, instance=True)
+        message_bus.subscribe(first, SampleEvent)
+        assert message_bus.resolve_event_handlers(SpecialEvent) == (first,)
+
+        message_bus.subscribe(second, Event)
+
+        assert message_bus.resolve_event_handlers(SpecialEvent) == (first, second)
+
+    def test_base_batch_handler_receives_all_subclass_events_at_once(self, message_bus, mocker):
+        batch_handler = mocker.create_autospec(BatchEventHandler, instance=True)
+        message_bus.subscribe_batch(batch_handler, SampleEvent)
+        events = (make_event(), make_event(SpecialEvent), make_event(FollowUpEvent))
+        message_bus.event_queue.extend(events)
+
+        message_bus._dispatch_events()
+
+        batch_handler.handle_batch.assert_called_once_with(events[:2], message_bus.uow)
+
+
+@dataclass(frozen=True, kw_only=True)
+class ImportRequirement(Command):
+    title: str
+
+
+class ImportRequirementHandler:
+    """제목이 'fail' 이면 실패하는 테스트용 핸들러"""
+
+    def handle(self, command, uow):
+        with uow:
+            if command.title == "fail":
+                raise ValueError(command.title)
+            uow.rows.append(command.title)
+            uow.publish(make_event(name=command.title))
+        return command.title.upper()
+
+
+class RecordingUnitOfWork(UnitOfWork):
+    def __init__(self):
+        super().__init__()
+        self.rows: list[str] = []
+        self.committed: list[str] = []
+        self.commits = 0
+        self.pops = 0
+
+    def commit(self):
+        self.committed = list(self.rows)
+        self.commits += 1
+
+    def rollback(self):
+        self.rows = list(self.committed)
+
+    def pop_events(self):
+        self.pops += 1
+        return super().pop_events()
+
+    def _begin_savepoint(self):
+        return len(self.rows)
+
+    def _rollback_to_savepoint(self, token):
+        del self.rows[token:]
+
+
+def make_import(title):
+    return ImportRequirement(title=title, occured_at=datetime.now(timezone.utc))
+
+
+class TestPublishMany:
+    @pytest.fixture
+    def recording_uow(self):
+        return RecordingUnitOfWork()
+
+    @pytest.fixture
+    def bus(self, recording_uow, mocker):
+        bus = MessageBus(recording_uow)
+        bus.subscribe(ImportRequirementHandler(), ImportRequirement)
+        return bus
+
+    def test_single_commit_and_drain_for_batch(self, bus, recording_uow):
+        result = bus.publish_many(make_import(f"req-{i}") for i in range(50))
+
+        assert result.ok
+        assert result.results[:2] == ("REQ-0", "REQ-1")
+        assert recording_uow.commits == 1
+        assert recording_uow.pops == 1
+        assert len(recording_uow.committed) == 50
+
+    def test_batch_events_are_dispatched_together(self, bus, mocker):
+        batch_handler = mocker.create_autospec(BatchEventHandler, instance=True)
+        bus.subscribe_batch(batch_handler, SampleEvent)
+
+        bus.publish_many(make_import(f"req-{i}") for i in range(50))
+
+        (events, _), _ = batch_handler.handle_batch.call_args
+        assert [e.name for e in events] == [f"req-{i}" for i in range(50)]
+
+    def test_all_or_nothing_rolls_back_batch(self, bus, recording_uow):
+        with pytest.raises(ValueError):
+            bus.publish_many([make_import("a"), make_import("fail"), make_import("b")])
 
-        message_bus.publish(mock_event)
+        assert recording_uow.commits == 0
+        assert recording_uow.committed == []
+        assert recording_uow.pop_events() == ()
 
-        assert mock_event in message_bus.event_queue
+    def test_savepoint_policy_skips_failed_commands(self, bus, recording_uow):
+        result = bus.publish_many(
+            [make_import("a"), make_import("fail"), make_import("b")],
+            policy=BatchFailurePolicy.SAVEPOINT,
+        )
 
-    def test_process_event_queue(self, message_bus, mock_event_handler, mock_event, mocker):
-        message_bus.subscribe(mock_event_handler, type(mock_event))
-        message_bus.uow.pop_events.return_value = [mock_event]
+        assert not result.ok
+        assert result.results == ("A", None, "B")
+        assert isinstance(result.errors[1], ValueError)
+        assert recording_uow.commits == 1
+        assert recording_uow.committed == ["a", "b"]
 
-        message_bus.publish(mock_event)
-        message_bus.event_queue.clear()
+    def test_unregistered_command_fails_before_transaction(self, bus, recording_uow, mock_command):
+        with pytest.raises(HandlerNotFoundError):
+            bus.publish_many([make_import("a"), mock_command])
 
-        assert len(message_bus.event_queue) == 0 
\ No newline at end of file
+        assert recording_uow.rows == []
+        assert not recording_uow.in_transaction
@@ -0,0 +1,141 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import pytest
+from resque_api.application.message.bus.message_bus import MessageBus
+from resque_api.application.message.bus.metrics import MetricsMiddleware
+from resque_api.application.message.bus.middleware import MessageStage
+from resque_api.application.message.command.base.command import Command
+from resque_api.application.message.event.base.event import Event
+from tests.unit.fakes import FakeUnitOfWork
+
+
+@dataclass(frozen=True, kw_only=True)
+class CreateProject(Command):
+    title: str = "project"
+
+
+@dataclass(frozen=True, kw_only=True)
+class ProjectCreated(Event):
+    ...
+
+
+def now():
+    return datetime.now(timezone.utc)
+
+
+class CreateProjectHandler:
+    def handle(self, command, uow):
+        with uow:
+            if command.title == "fail":
+                raise ValueError("fail")
+            uow.publish(ProjectCreated(occured_at=now()))
+        return command.title
+
+
+class RecordingMiddleware:
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+
+    def __call__(self, context, call_next):
+        self.log.append((self.name, "before", context.stage, context.message_type.__name__))
+        result = call_next()
+        self.log.append((self.name, "after", context.stage, context.message_type.__name__))
+        return result
+
+
+@pytest.fixture
+def uow():
+    return FakeUnitOfWork()
+
+
+@pytest.fixture
+def bus(uow, mocker):
+    bus = MessageBus(uow)
+    bus.subscribe(CreateProjectHandler(), CreateProject)
+    bus.subscribe(mocker.Mock(), ProjectCreated)
+    return bus
+
+
+class TestMiddlewarePipeline:
+    def test_middlewares_wrap_handler_and_commit(self, bus, uow):
+        log = []
+        bus.add_middleware(RecordingMiddleware("outer", log))
+        bus.add_middleware(RecordingMiddleware("inner", log))
+
+        result = bus.publish(CreateProject(occured_at=now()))
+
+        assert result == "project"
+        assert uow.commits == 2  # 커맨드 트랜잭션 + 이벤트 핸들러 트랜잭션
+        assert log[:4] == [
+            ("outer", "before", MessageStage.COMMAND, "CreateProject"),
+            ("inner", "before", MessageStage.COMMAND, "CreateProject"),
+            ("inner", "after", MessageStage.COMMAND, "CreateProject"),
+            ("outer", "after", MessageStage.COMMAND, "CreateProject"),
+        ]
+        stages = [(stage, name) for _, when, stage, name in log if when == "before"][::2]
+        assert stages == [
+            (MessageStage.COMMAND, "CreateProject"),
+            (MessageStage.COMMIT, "CreateProject"),
+            (MessageStage.EVENT, "ProjectCreated"),
+            (MessageStage.COMMIT, "ProjectCreated"),
+        ]
+
+    def test_middleware_can_short_circuit(self, bus, uow):
+        bus.add_middleware(lambda context, call_next: "cached" if context.stage is MessageStage.COMMAND else call_next())
+
+        assert bus.publish(CreateProject(occured_at=now())) == "cached"
+        assert uow.pop_events() == ()
+
+
+class TestMetricsMiddleware:
+    def test_records_calls_and_stages(self, bus):
+        metrics = MetricsMiddleware()
+        bus.add_middleware(metrics)
+
+        bus.publish(CreateProject(occured_at=now()))
+        bus.publish(CreateProject(occured_at=now()))
+
+        snapshot = metrics.snapshot()
+        assert snapshot["CreateProject"]["command"]["calls"] == 2
+        assert snapshot["CreateProject"]["commit"]["calls"] == 2
+        assert snapshot["ProjectCreated"]["event"]["calls"] == 2
+        assert snapshot["CreateProject"]["command"]["buckets"][float("inf")] == 2
+
+    def test_records_errors(self, bus):
+        metrics = MetricsMiddleware()
+        bus.add_middleware(metrics)
+
+        with pytest.raises(ValueError):
+            bus.publish(CreateProject(title="fail", occured_at=now()))
+
+        snapshot = metrics.snapshot()
+        assert snapshot["CreateProject"]["command"]["errors"] == 1
+        assert "commit" not in snapshot["CreateProject"]
+
+    def test_histogram_buckets_are_cumulative(self):
+        metrics = MetricsMiddleware(buckets=(0.01, 0.1))
+        for seconds in (0.005, 0.05, 0.5):
+            metrics.record("CreateProject", MessageStage.COMMAND, seconds)
+
+        buckets = metrics.snapshot()["CreateProject"]["command"]["buckets"]
+
+        assert buckets == {0.01: 1, 0.1: 2, float("inf"): 3}
+
+    def test_prometheus_export(self):
+        metrics = MetricsMiddleware(buckets=(0.01,))
+        metrics.record("CreateProject", MessageStage.COMMIT, 0.002)
+        metrics.record("CreateProject", MessageStage.COMMIT, 0.02, failed=True)
+
+        text = metrics.to_prometheus()
+
+        assert 'resque_message_calls_total{message_type="CreateProject",stage="commit"} 2' in text
+        assert 'resque_message_errors_total{message_type="CreateProject",stage="commit"} 1' in text
+        assert 'resque_message_duration_seconds_bucket{message_type="CreateProject",stage="commit",le="0.01"} 1' in text
+        assert 'resque_message_duration_seconds_bucket{message_type="CreateProject",stage="commit",le="+Inf"} 2' in text
+        assert "# TYPE resque_message_duration_seconds histogram" in text
+
+    def test_invalid_buckets(self):
+        with pytest.raises(ValueError):
+            MetricsMiddleware(buckets=(0.1, 0.01))
@@ -0,0 +1,243 @@
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from resque_api.application.message.bus.exceptions import DispatcherNotRunningError
+from resque_api.application.message.bus.message_bus import MessageBus
+from resque_api.application.message.bus.partitioned_dispatcher import PartitionedEventDispatcher
+from resque_api.application.message.event.base.event import Event
+from tests.unit.fakes import FakeUnitOfWork
+
+
+@dataclass(frozen=True, kw_only=True)
+class SequencedEvent(Event):
+    sequence: int = 0
+
+
+@dataclass(frozen=True, kw_only=True)
+class ChainedEvent(SequencedEvent):
+    ...
+
+
+def make_event(event_type=SequencedEvent, **kwargs):
+    return event_type(occured_at=datetime.now(timezone.utc), **kwargs)
+
+
+class RecordingHandler:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.seen: dict = {}
+        self.threads: set[str] = set()
+
+    def handle(self, event, uow):
+        time.sleep(self.delay)
+        with self.lock:
+            self.seen.setdefault(event.aggregate_id, []).append(event.sequence)
+            self.threads.add(threading.current_thread().name)
+
+
+@pytest.fixture
+def dispatcher():
+    dispatcher = PartitionedEventDispatcher(FakeUnitOfWork, workers=4, max_queue_depth=16)
+    yield dispatcher
+    dispatcher.shutdown(drain=False)
+
+
+class TestPartitionedEventDispatcher:
+    def test_preserves_per_aggregate_order(self, dispatcher):
+        handler = RecordingHandler(delay=0.001)
+        bus = MessageBus(FakeUnitOfWork(), event_dispatcher=dispatcher)
+        bus.subscribe(handler, SequencedEvent)
+        dispatcher.start()
+        aggregates = [uuid4() for _ in range(8)]
+
+        for sequence in range(10):
+            for aggregate_id in aggregates:
+                bus.publish(make_event(aggregate_id=aggregate_id, sequence=sequence))
+        dispatcher.join()
+
+        assert set(handler.seen) == set(aggregates)
+        assert all(sequences == list(range(10)) for sequences in handler.seen.values())
+        assert len(handler.threads) > 1
+        assert dispatcher.stats().processed == 80
+
+    def test_same_aggregate_goes_to_same_partition(self, dispatcher):
+        aggregate_id = uuid4()
+        partitions = {dispatcher.partition_of(make_event(aggregate_id=aggregate_id)) for _ in range(20)}
+
+        assert len(partitions) == 1
+
+    def test_events_raised_by_handlers_are_dispatched(self, dispatcher):
+        aggregate_id = uuid4()
+        chained = RecordingHandler()
+
+        class RaisingHandler:
+            def handle(self, event, uow):
+                uow.publish(make_event(ChainedEvent, aggregate_id=aggregate_id))
+
+        handlers = {SequencedEvent: (RaisingHandler(),), ChainedEvent: (chained,)}
+        dispatcher.bind(lambda event_type: handlers.get(event_type, ()))
+        dispatcher.start()
+
+        dispatcher.dispatch(make_event(aggregate_id=aggregate_id))
+        dispatcher.join()
+
+        assert chained.seen == {aggregate_id: [0]}
+
+    def test_handler_errors_are_isolated(self, dispatcher):
+        errors = []
+        dispatcher.on_error = lambda event, handler, error: errors.append(error)
+
+        class FailingHandler:
+            def handle(self, event, uow):
+                raise RuntimeError("boom")
+
+        recorder = RecordingHandler()
+        dispatcher.bind(lambda event_type: (FailingHandler(), recorder))
+        dispatcher.start()
+
+        dispatcher.dispatch(make_event(aggregate_id=uuid4()))
+        dispatcher.join()
+
+        assert len(errors) == 1
+        assert sum(len(v) for v in recorder.seen.values()) == 1
+        assert dispatcher.stats().failed == 1
+
+    def test_graceful_drain_on_shutdown(self):
+        handler = RecordingHandler(delay=0.001)
+        dispatcher = PartitionedEventDispatcher(FakeUnitOfWork, workers=2, max_queue_depth=100)
+        dispatcher.bind(lambda event_type: (handler,))
+        dispatcher.start()
+        aggregate_id = uuid4()
+
+        for sequence in range(30):
+            dispatcher.dispatch(make_event(aggregate_id=aggregate_id, sequence=sequence))
+        dispatcher.shutdown(drain=True)
+
+        assert handler.seen[aggregate_id] == list(range(30))
+        assert dispatcher.queue_depths() == (0, 0)
+        assert max(dispatcher.stats().high_water_marks) >= 1
+
+    def test_dispatch_requires_running_dispatcher(self, dispatcher):
+        dispatcher.bind(lambda event_type: ())
+
+        with pytest.raises(DispatcherNotRunningError):
+            dispatcher.dispatch(make_event())
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            PartitionedEventDispatcher(FakeUnitOfWork, workers=0)
+        with pytest.raises(ValueError):
+            PartitionedEventDispatcher(FakeUnitOfWork, max_queue_depth=0)
+
+
+class TestDispatcherIntegration:
+    def test_bus_transaction_and_middleware_wrap_handlers(self):
+        uows = []
+        stages = []
+
+        def uow_factory():
+            uows.append(FakeUnitOfWork())
+            return uows[-1]
+
+        dispatcher = PartitionedEventDispatcher(uow_factory, workers=1)
+        bus = MessageBus(FakeUnitOfWork(), event_dispatcher=dispatcher)
+
+        def record_stage(context, call_next):
+            stages.append(context.stage.value)
+            return call_next()
+
+        bus.add_middleware(record_stage)
+
+        class FailingHandler:
+            def handle(self, event, uow):
+                raise RuntimeError("boom")
+
+        bus.subscribe(RecordingHandler(), SequencedEvent)
+        bus.subscribe(FailingHandler(), SequencedEvent)
+        dispatcher.on_error = lambda event, handler, error: None
+
+        with dispatcher:
+            bus.publish(make_event(aggregate_id=uuid4()))
+            dispatcher.join()
+
+        assert stages == ["event", "commit", "event"]
+        assert (uows[0].commits, uows[0].rollbacks) == (1, 1)
+
+    def test_cross_partition_dispatch_does_not_deadlock(self):
+        """가득 찬 두 파티션이 서로에게 이벤트를 보내도 교착되지 않는다"""
+        handled = []
+
+        class PingPongHandler:
+            def handle(self, event, uow):
+                handled.append(event.sequence)
+                if event.sequence < 40:
+                    for offset in (1, 2, 3):
+                        uow.publish(make_event(aggregate_id=1 - event.aggregate_id, sequence=event.sequence + 10 * offset))
+
+        dispatcher = PartitionedEventDispatcher(
+            FakeUnitOfWork, workers=2, max_queue_depth=1, partition_key=lambda event: event.aggregate_id
+        )
+        dispatcher.bind(lambda event_type: (PingPongHandler(),))
+        dispatcher.start()
+
+        for sequence in range(4):
+            dispatcher.dispatch(make_event(aggregate_id=sequence % 2, sequence=sequence))
+        finished = threading.Thread(target=dispatcher.join, daemon=True)
+        finished.start()
+        finished.join(timeout=5)
+
+        assert not finished.is_alive()
+        assert dispatcher.stats().spilled > 0
+        dispatcher.shutdown()
+
+    def test_shutdown_drains_cross_partition_follow_ups(self):
+        """종료 중에 처리 중인 핸들러가 다른 파티션으로 보낸 후속 이벤트도 처리한 뒤 종료한다"""
+        handled = []
+        started = threading.Event()
+
+        class FollowUpHandler:
+            def handle(self, event, uow):
+                if event.aggregate_id == 0:
+                    started.set()
+                    time.sleep(0.1)
+                    for sequence in range(3):
+                        uow.publish(make_event(aggregate_id=1, sequence=sequence))
+                else:
+                    handled.append(event.sequence)
+
+        dispatcher = PartitionedEventDispatcher(
+            FakeUnitOfWork, workers=2, max_queue_depth=1, partition_key=lambda event: event.aggregate_id
+        )
+        dispatcher.bind(lambda event_type: (FollowUpHandler(),))
+        dispatcher.start()
+
+        dispatcher.dispatch(make_event(aggregate_id=0))
+        assert started.wait(5)
+        dispatcher.shutdown(timeout=5)
+
+        assert handled == [0, 1, 2]
+        assert dispatcher.queue_depths() == (0, 0)
+
+    def test_failing_on_error_does_not_kill_worker(self, dispatcher):
+        def on_error(event, handler, error):
+            raise ValueError("callback failed")
+
+        class FailingHandler:
+            def handle(self, event, uow):
+                raise RuntimeError("boom")
+
+        dispatcher.on_error = on_error
+        dispatcher.bind(lambda event_type: (FailingHandler(),))
+        dispatcher.start()
+        aggregate_id = uuid4()
+
+        dispatcher.dispatch(make_event(aggregate_id=aggregate_id))
+        dispatcher.dispatch(make_event(aggregate_id=aggregate_id))
+        dispatcher.join()
+
+        assert dispatcher.stats().failed == 2
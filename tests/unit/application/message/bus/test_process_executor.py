@@ -0,0 +1,147 @@
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import pytest
+from resque_api.application.message.bus.exceptions import RemoteHandlerError
+from resque_api.application.message.bus.message_bus import MessageBus
+from resque_api.application.message.bus.process_executor import ProcessHandlerExecutor
+from resque_api.application.message.event.base.event import Event
+from resque_api.application.message.event.base.event_handler import ProcessEventHandler
+from resque_api.application.ports.uow import UnitOfWork
+
+
+@dataclass(frozen=True, kw_only=True)
+class NumberEvent(Event):
+    number: int
+
+
+def make_events(*numbers):
+    return [NumberEvent(occured_at=datetime.now(timezone.utc), number=n) for n in numbers]
+
+
+class SquareHandler(ProcessEventHandler[NumberEvent]):
+    def __init__(self):
+        self.results = []
+
+    def compute(self, event):
+        if event.number < 0:
+            raise ValueError(f"negative: {event.number}")
+        return event.number ** 2, os.getpid()
+
+    def on_result(self, event, result, uow):
+        self.results.append(result[0])
+
+
+class UnpicklableError(Exception):
+    def __init__(self, lock):
+        super().__init__("unpicklable")
+        self.lock = lock
+
+
+class UnpicklableFailureHandler(ProcessEventHandler[NumberEvent]):
+    def compute(self, event):
+        import threading
+
+        raise UnpicklableError(threading.Lock())
+
+
+@pytest.fixture
+def executor():
+    executor = ProcessHandlerExecutor(max_workers=2, chunksize=2)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture
+def uow(mocker):
+    uow = mocker.create_autospec(UnitOfWork, instance=True)
+    uow.pop_events.return_value = ()
+    return uow
+
+
+class TestProcessHandlerExecutor:
+    def test_map_runs_in_worker_processes(self, executor):
+        """compute 는 워커 프로세스에서 실행되고 결과는 이벤트 순서대로 반환된다"""
+        # When
+        outcomes = executor.map(SquareHandler(), make_events(1, 2, 3, 4, 5))
+
+        # Then
+        assert [outcome.value[0] for outcome in outcomes] == [1, 4, 9, 16, 25]
+        assert all(outcome.value[1] != os.getpid() for outcome in outcomes)
+        assert executor.stats().completed == 5
+
+    def test_errors_are_returned_per_event(self, executor):
+        """compute 예외는 해당 이벤트의 결과로 전달되고 원격 traceback 이 연결된다"""
+        # When
+        outcomes = executor.map(SquareHandler(), make_events(1, -1, 2))
+
+        # Then
+        assert [outcome.ok for outcome in outcomes] == [True, False, True]
+        with pytest.raises(ValueError, match="negative: -1") as excinfo:
+            outcomes[1].unwrap()
+        assert isinstance(excinfo.value.__cause__, RemoteHandlerError)
+        assert "compute" in excinfo.value.__cause__.remote_traceback
+        assert executor.stats().failed == 1
+
+    def test_unpicklable_error_is_replaced(self, executor):
+        """피클할 수 없는 예외는 RemoteHandlerError 로 대체된다"""
+        (outcome,) = executor.map(UnpicklableFailureHandler(), make_events(1))
+
+        with pytest.raises(RemoteHandlerError, match="UnpicklableError"):
+            outcome.unwrap()
+
+    def test_workers_are_recycled(self):
+        """max_tasks_per_child 개 작업을 처리한 워커는 새 프로세스로 교체된다"""
+        with ProcessHandlerExecutor(max_workers=1, max_tasks_per_child=1) as executor:
+            outcomes = executor.map(SquareHandler(), make_events(1, 2, 3))
+
+        assert len({outcome.value[1] for outcome in outcomes}) == 3
+
+    def test_invalid_arguments(self):
+        """설정값 검증"""
+        with pytest.raises(ValueError):
+            ProcessHandlerExecutor(max_workers=0)
+        with pytest.raises(ValueError):
+            ProcessHandlerExecutor(chunksize=0)
+        with pytest.raises(ValueError):
+            ProcessHandlerExecutor(max_tasks_per_child=0)
+
+
+class TestMessageBusProcessHandlers:
+    def test_results_are_applied_in_bus_transaction(self, uow, executor):
+        """결과는 이벤트마다 버스 트랜잭션 안에서 on_result 로 전달된다"""
+        # Given
+        bus = MessageBus(uow, process_executor=executor)
+        handler = SquareHandler()
+        bus.subscribe(handler, NumberEvent)
+
+        # When
+        bus.event_queue.extend(make_events(2, 3))
+        bus._dispatch_events()
+
+        # Then
+        assert handler.results == [4, 9]
+        assert uow.__enter__.call_count == 2
+
+    def test_errors_propagate_from_bus(self, uow, executor):
+        """compute 예외는 publish 호출자에게 전파되고 트랜잭션은 롤백된다"""
+        # Given
+        bus = MessageBus(uow, process_executor=executor)
+        bus.subscribe(SquareHandler(), NumberEvent)
+
+        # When / Then
+        with pytest.raises(ValueError, match="negative"):
+            bus.publish(make_events(-1)[0])
+        exc_type = uow.__exit__.call_args.args[0]
+        assert exc_type is ValueError
+
+    def test_runs_inline_without_executor(self, uow):
+        """실행기가 없으면 현재 프로세스에서 compute 후 on_result 를 호출한다"""
+        bus = MessageBus(uow)
+        handler = SquareHandler()
+        bus.subscribe(handler, NumberEvent)
+
+        bus.publish(make_events(3)[0])
+
+        assert handler.results == [9]
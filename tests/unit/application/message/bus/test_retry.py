@@ -0,0 +1,128 @@
+from dataclasses import dataclass
+
+import pytest
+from resque_api.application.message.bus.message_bus import MessageBus
+from resque_api.application.message.bus.retry import RetryPolicy
+from resque_api.application.message.command.base.command import Command
+from resque_api.application.message.event.base.event import Event
+from resque_api.application.ports.repository.exceptions import ConcurrencyConflictError
+from tests.unit.fakes import FakeUnitOfWork
+
+
+@dataclass(frozen=True, kw_only=True)
+class RenameProject(Command):
+    title: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class ProjectRenamed(Event):
+    title: str
+
+
+class ConflictingHandler:
+    """처음 conflicts 번은 충돌로 실패하는 핸들러"""
+
+    def __init__(self, conflicts, error=None):
+        self.conflicts = conflicts
+        self.error = error or ConcurrencyConflictError("project-1", 3)
+        self.calls = 0
+
+    def handle(self, command, uow):
+        self.calls += 1
+        uow.publish(ProjectRenamed(title=command.title))
+        if self.calls <= self.conflicts:
+            raise self.error
+        return command.title
+
+
+class RecordingEventHandler:
+    def __init__(self):
+        self.received = []
+
+    def handle(self, event, uow):
+        self.received.append(event.title)
+
+
+@pytest.fixture
+def sleeps():
+    return []
+
+
+@pytest.fixture
+def policy(sleeps):
+    return RetryPolicy(max_attempts=3, base_delay=0.1, multiplier=2.0, jitter=False, sleep=sleeps.append)
+
+
+def make_bus(policy, handler, uow=None):
+    bus = MessageBus(uow or FakeUnitOfWork(), retry_policy=policy)
+    bus.subscribe(handler, RenameProject)
+    return bus
+
+
+class TestRetryPolicy:
+    def test_delay_grows_exponentially_up_to_max(self):
+        """대기 시간은 지수적으로 늘어나고 max_delay 를 넘지 않는다"""
+        policy = RetryPolicy(base_delay=0.1, max_delay=0.3, jitter=False)
+
+        assert [policy.delay(attempt) for attempt in (1, 2, 3)] == [0.1, 0.2, 0.3]
+
+    def test_jitter_scales_delay(self):
+        """지터가 켜져 있으면 0 과 대기 시간 사이의 값을 사용한다"""
+        policy = RetryPolicy(base_delay=0.2, random=lambda: 0.5)
+
+        assert policy.delay(1) == pytest.approx(0.1)
+
+
+class TestCommandRetry:
+    def test_conflict_is_retried_with_backoff(self, policy, sleeps):
+        """충돌로 실패한 커맨드는 백오프 후 다시 실행되고, 롤백된 시도의 이벤트는 버려진다"""
+        # Given
+        handler = ConflictingHandler(conflicts=2)
+        events = RecordingEventHandler()
+        bus = make_bus(policy, handler)
+        bus.subscribe(events, ProjectRenamed)
+
+        # When
+        result = bus.publish(RenameProject(title="renamed"))
+
+        # Then
+        assert result == "renamed"
+        assert handler.calls == 3
+        assert sleeps == [0.1, 0.2]
+        assert bus.retries == 2
+        assert bus.uow.rollbacks == 2
+        assert events.received == ["renamed"]
+
+    def test_gives_up_after_max_attempts(self, policy, sleeps):
+        """최대 실행 횟수를 넘으면 마지막 예외를 전파한다"""
+        # Given
+        bus = make_bus(policy, ConflictingHandler(conflicts=5))
+
+        # When / Then
+        with pytest.raises(ConcurrencyConflictError):
+            bus.publish(RenameProject(title="renamed"))
+        assert len(sleeps) == 2
+
+    def test_other_errors_are_not_retried(self, policy, sleeps):
+        """재시도 대상이 아닌 예외는 바로 전파된다"""
+        # Given
+        handler = ConflictingHandler(conflicts=1, error=ValueError("invalid title"))
+        bus = make_bus(policy, handler)
+
+        # When / Then
+        with pytest.raises(ValueError):
+            bus.publish(RenameProject(title="renamed"))
+        assert handler.calls == 1
+        assert sleeps == []
+
+    def test_not_retried_inside_outer_transaction(self, policy, sleeps):
+        """바깥 트랜잭션에 합류한 커맨드는 재시도하지 않는다"""
+        # Given
+        handler = ConflictingHandler(conflicts=1)
+        bus = make_bus(policy, handler)
+
+        # When / Then
+        with pytest.raises(ConcurrencyConflictError):
+            with bus.uow:
+                bus.publish(RenameProject(title="renamed"))
+        assert handler.calls == 1
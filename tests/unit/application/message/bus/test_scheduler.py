@@ -0,0 +1,242 @@
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from resque_api.application.message.bus.exceptions import SchedulerNotConfiguredError
+from resque_api.application.message.bus.message_bus import MessageBus
+from resque_api.application.message.bus.scheduler import MessageScheduler
+from resque_api.application.message.event.base.event import Event
+from tests.unit.fakes import FakeUnitOfWork
+
+
+@dataclass(frozen=True, kw_only=True)
+class InvitationExpired(Event):
+    email: str
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class RecordingHandler:
+    def __init__(self):
+        self.received = []
+
+    def handle(self, event, uow):
+        self.received.append(event.email)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def scheduler(clock):
+    return MessageScheduler(clock=clock)
+
+
+@pytest.fixture
+def handler():
+    return RecordingHandler()
+
+
+@pytest.fixture
+def bus(scheduler, handler):
+    bus = MessageBus(FakeUnitOfWork(), scheduler=scheduler)
+    bus.subscribe(handler, InvitationExpired)
+    return bus
+
+
+class TestMessageScheduler:
+    def test_publish_after_delay(self, bus, scheduler, handler, clock):
+        """지연 시간이 지나야 메시지가 발행된다"""
+        # Given
+        bus.publish_after(InvitationExpired(email="a@example.com"), timedelta(days=7))
+
+        # When
+        clock.now += timedelta(days=7).total_seconds() - 1
+        before = scheduler.run_due()
+        clock.now += 1
+        after = scheduler.run_due()
+
+        # Then
+        assert (before, after) == (0, 1)
+        assert handler.received == ["a@example.com"]
+        assert len(scheduler) == 0
+
+    def test_publish_at_orders_by_due_time(self, bus, scheduler, handler, clock):
+        """발행 시각 순서대로 발행되고, 같은 시각은 예약 순서를 따른다"""
+        # Given
+        base = datetime.fromtimestamp(clock.now, timezone.utc)
+        bus.publish_at(InvitationExpired(email="late"), base + timedelta(hours=48))
+        bus.publish_at(InvitationExpired(email="early-1"), base + timedelta(hours=1))
+        bus.publish_at(InvitationExpired(email="early-2"), base + timedelta(hours=1))
+
+        # When
+        clock.now += timedelta(hours=48).total_seconds()
+        scheduler.run_due()
+
+        # Then
+        assert handler.received == ["early-1", "early-2", "late"]
+
+    def test_naive_datetime_is_rejected(self, bus):
+        """시간대가 없는 datetime 은 ValueError"""
+        with pytest.raises(ValueError):
+            bus.publish_at(InvitationExpired(email="a"), datetime(2030, 1, 1))
+
+    def test_cancel(self, bus, scheduler, handler, clock):
+        """취소한 예약은 발행되지 않는다"""
+        # Given
+        timer_id = bus.publish_after(InvitationExpired(email="cancelled"), 10)
+        bus.publish_after(InvitationExpired(email="kept"), 20)
+
+        # When
+        cancelled = scheduler.cancel(timer_id)
+        clock.now += 30
+        scheduler.run_due()
+
+        # Then
+        assert cancelled is True
+        assert scheduler.cancel(timer_id) is False
+        assert handler.received == ["kept"]
+        assert scheduler.stats().cancelled == 1
+
+    def test_cancelled_entries_are_compacted(self, scheduler):
+        """취소된 항목이 힙의 절반을 넘으면 힙을 다시 만든다"""
+        ids = [scheduler.schedule_after(InvitationExpired(email=str(n)), n) for n in range(200)]
+
+        for timer_id in ids[:150]:
+            scheduler.cancel(timer_id)
+
+        stats = scheduler.stats()
+        assert stats.pending == 50
+        assert stats.heap_size < 100
+        assert scheduler.next_due() == 1_000.0 + 150
+
+    def test_failed_publish_raises_and_continues(self, scheduler, clock):
+        """발행 실패 시 나머지 예약은 발행하고 첫 번째 예외를 다시 발생시킨다"""
+        # Given
+        published = []
+
+        def publish(message):
+            if message.email == "fail":
+                raise RuntimeError("boom")
+            published.append(message.email)
+
+        scheduler.bind(publish)
+        scheduler.schedule_after(InvitationExpired(email="fail"), 1)
+        scheduler.schedule_after(InvitationExpired(email="ok"), 2)
+        clock.now += 5
+
+        # When / Then
+        with pytest.raises(RuntimeError, match="boom"):
+            scheduler.run_due()
+        assert published == ["ok"]
+        assert scheduler.stats().failed == 1
+
+    def test_failed_publish_is_retried_with_backoff(self, scheduler, clock):
+        """발행에 실패한 예약은 실패 횟수에 따라 늦춰 다시 발행한다"""
+        # Given
+        attempts = []
+
+        def publish(message):
+            attempts.append(clock.now)
+            if len(attempts) < 3:
+                raise RuntimeError("boom")
+
+        scheduler = MessageScheduler(clock=clock, on_error=lambda timer, e: None, retry_backoff=10.0)
+        scheduler.bind(publish)
+        scheduler.schedule_after(InvitationExpired(email="a"), 0)
+
+        # When
+        for _ in range(4):
+            scheduler.run_due()
+            clock.now = scheduler.next_due() or clock.now
+
+        # Then
+        assert attempts == [1_000.0, 1_010.0, 1_030.0]
+        assert len(scheduler) == 0
+        assert scheduler.stats().failed == 2
+
+    def test_failed_publish_is_abandoned_after_max_attempts(self, clock):
+        """max_attempts 번 실패한 예약은 포기한다"""
+        # Given
+        errors = []
+        scheduler = MessageScheduler(
+            clock=clock, on_error=lambda timer, e: errors.append(timer.attempts), max_attempts=2, retry_backoff=0.0
+        )
+        scheduler.bind(lambda message: (_ for _ in ()).throw(RuntimeError("boom")))
+        scheduler.schedule_after(InvitationExpired(email="a"), 0)
+
+        # When
+        scheduler.run_due()
+        scheduler.run_due()
+
+        # Then
+        assert errors == [0, 1]
+        assert len(scheduler) == 0
+        assert scheduler.stats().abandoned == 1
+
+    def test_background_thread_uses_dedicated_bus(self, handler):
+        """백그라운드 스레드는 예약을 받은 버스가 아닌 전용 버스로 발행한다"""
+        # Given
+        scheduler = MessageScheduler()
+        bus = MessageBus(FakeUnitOfWork(), scheduler=scheduler)
+        worker_bus = MessageBus(FakeUnitOfWork())
+        delivered = threading.Event()
+        handler.handle = lambda event, uow: delivered.set()
+        worker_bus.subscribe(handler, InvitationExpired)
+
+        # When
+        scheduler.start(worker_bus.publish)
+        try:
+            bus.publish_after(InvitationExpired(email="a"), 0.01)
+
+            # Then
+            assert delivered.wait(5)
+        finally:
+            scheduler.stop()
+
+    def test_background_thread_rejects_bound_bus(self, bus, scheduler):
+        """예약을 받는 버스로 백그라운드 발행을 시작하면 SchedulerNotConfiguredError"""
+        with pytest.raises(SchedulerNotConfiguredError):
+            scheduler.start(bus.publish)
+
+    def test_background_failure_is_logged(self, caplog):
+        """on_error 가 없으면 백그라운드 발행 실패를 로그로 남긴다"""
+        # Given
+        scheduler = MessageScheduler(max_attempts=1)
+        abandoned = threading.Event()
+
+        def publish(message):
+            abandoned.set()
+            raise RuntimeError("boom")
+
+        # When
+        with caplog.at_level(logging.ERROR, logger="resque_api.application.message.bus.scheduler"):
+            scheduler.start(publish)
+            try:
+                scheduler.schedule_after(InvitationExpired(email="a"), 0)
+                assert abandoned.wait(5)
+            finally:
+                scheduler.stop()
+
+        # Then
+        assert "boom" in caplog.text
+
+    def test_bus_without_scheduler(self):
+        """스케줄러가 없는 버스에 예약하면 SchedulerNotConfiguredError"""
+        with pytest.raises(SchedulerNotConfiguredError):
+            MessageBus(FakeUnitOfWork()).publish_after(InvitationExpired(email="a"), 1)
+
+    def test_unbound_scheduler(self, scheduler):
+        """발행 함수가 연결되지 않은 스케줄러는 실행할 수 없다"""
+        with pytest.raises(SchedulerNotConfiguredError):
+            scheduler.run_due()
@@ -0,0 +1,196 @@
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import pytest
+from resque_api.application.message.bus.message_bus import MessageBus
+from resque_api.application.message.event.base.event import Event
+from resque_api.application.message.outbox.relay import OutboxRelay
+from resque_api.infrastructure.outbox.json_serializer import JsonEventSerializer
+from resque_api.infrastructure.outbox.sqlite_outbox import SqliteOutbox
+from resque_api.infrastructure.persistence.sqlite_uow import SqliteUnitOfWork
+
+
+@dataclass(frozen=True, kw_only=True)
+class NumberedEvent(Event):
+    number: int
+
+
+def make_events(count):
+    return [NumberedEvent(occured_at=datetime.now(timezone.utc), number=n) for n in range(count)]
+
+
+class RecordingHandler:
+    def __init__(self, fail_on=(), always_fail_on=()):
+        self.received = []
+        self.fail_on = set(fail_on)
+        self.always_fail_on = set(always_fail_on)
+
+    def handle(self, event, uow):
+        if event.number in self.always_fail_on:
+            raise RuntimeError(f"poison {event.number}")
+        if event.number in self.fail_on:
+            self.fail_on.discard(event.number)
+            raise RuntimeError(f"failed {event.number}")
+        self.received.append(event.number)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def outbox(clock):
+    connection = sqlite3.connect(":memory:", check_same_thread=False)
+    outbox = SqliteOutbox(connection, JsonEventSerializer([NumberedEvent]), clock=clock)
+    outbox.create_table()
+    yield outbox
+    connection.close()
+
+
+@pytest.fixture
+def bus(outbox):
+    return MessageBus(SqliteUnitOfWork(outbox.connection))
+
+
+@pytest.fixture
+def handler(bus):
+    handler = RecordingHandler()
+    bus.subscribe(handler, NumberedEvent)
+    return handler
+
+
+def write_events(outbox, count):
+    with outbox.connection:
+        outbox.add(make_events(count))
+
+
+class TestOutboxRelay:
+    def test_run_once_delivers_a_batch(self, outbox, bus, handler):
+        """run_once 는 batch_size 개씩 순서대로 전달하고 전달 완료로 표시한다"""
+        # Given
+        write_events(outbox, 5)
+        relay = OutboxRelay(outbox, bus, batch_size=3)
+
+        # When
+        first, second, third = relay.run_once(), relay.run_once(), relay.run_once()
+
+        # Then
+        assert (first, second, third) == (3, 2, 0)
+        assert handler.received == [0, 1, 2, 3, 4]
+        assert outbox.pending_count() == 0
+        assert relay.stats().delivered == 5
+
+    def test_failure_stops_batch_and_retries(self, outbox, bus):
+        """전달 실패 시 배치의 나머지는 미루고 다음 폴링에서 다시 전달한다"""
+        # Given
+        handler = RecordingHandler(fail_on={1})
+        bus.subscribe(handler, NumberedEvent)
+        errors = []
+        write_events(outbox, 3)
+        relay = OutboxRelay(
+            outbox, bus, retry_backoff=0.0, on_error=lambda entry, e: errors.append(entry.event.number)
+        )
+
+        # When
+        delivered_first = relay.run_once()
+        delivered_second = relay.run_once()
+
+        # Then
+        assert (delivered_first, delivered_second) == (1, 2)
+        assert handler.received == [0, 1, 2]
+        assert errors == [1]
+        assert relay.stats().failed == 1
+
+    def test_failed_entry_is_retried_after_backoff(self, outbox, bus, clock):
+        """실패한 이벤트와 그 뒤의 이벤트는 실패 횟수에 따른 대기 시간이 지난 뒤에 다시 전달한다"""
+        # Given
+        handler = RecordingHandler(fail_on={0})
+        bus.subscribe(handler, NumberedEvent)
+        write_events(outbox, 2)
+        relay = OutboxRelay(outbox, bus, retry_backoff=10.0)
+        relay.run_once()
+
+        # When
+        before_backoff = relay.run_once()
+        clock.now += 10.0
+        after_backoff = relay.run_once()
+
+        # Then
+        assert (before_backoff, after_backoff) == (0, 2)
+        assert handler.received == [0, 1]
+
+    def test_poison_entry_is_dead_lettered(self, outbox, bus):
+        """max_attempts 번 실패한 이벤트는 데드레터로 옮기고 뒤의 이벤트를 이어서 전달한다"""
+        # Given
+        handler = RecordingHandler(always_fail_on={0})
+        bus.subscribe(handler, NumberedEvent)
+        write_events(outbox, 3)
+        relay = OutboxRelay(outbox, bus, max_attempts=3, retry_backoff=0.0)
+
+        # When
+        delivered = [relay.run_once() for _ in range(3)]
+
+        # Then
+        assert delivered == [0, 0, 2]
+        assert handler.received == [1, 2]
+        assert outbox.pending_count() == 0
+        assert outbox.dead_letter_count() == 1
+        assert relay.stats().failed == 3
+        assert relay.stats().dead_lettered == 1
+
+    def test_compact(self, outbox, bus, handler):
+        """compact 는 보관 기간이 지난 전달 완료 행을 삭제한다"""
+        # Given
+        write_events(outbox, 2)
+        relay = OutboxRelay(outbox, bus, retention=0.0)
+        relay.run_once()
+
+        # When
+        removed = relay.compact()
+
+        # Then
+        assert removed == 2
+        assert relay.stats().compacted == 2
+
+    def test_background_thread(self, outbox, bus):
+        """백그라운드 스레드가 밀린 이벤트를 배치 단위로 모두 전달한다"""
+        # Given
+        done = threading.Event()
+        handler = RecordingHandler()
+        original = handler.handle
+
+        def handle(event, uow):
+            original(event, uow)
+            if len(handler.received) == 4:
+                done.set()
+
+        handler.handle = handle
+        bus.subscribe(handler, NumberedEvent)
+        write_events(outbox, 4)
+
+        # When
+        with OutboxRelay(outbox, bus, batch_size=2, poll_interval=0.01):
+            assert done.wait(5)
+
+        # Then
+        assert handler.received == [0, 1, 2, 3]
+
+    def test_invalid_arguments(self, outbox, bus):
+        """batch_size 와 poll_interval 검증"""
+        with pytest.raises(ValueError):
+            OutboxRelay(outbox, bus, batch_size=0)
+        with pytest.raises(ValueError):
+            OutboxRelay(outbox, bus, poll_interval=0)
+        with pytest.raises(ValueError):
+            OutboxRelay(outbox, bus, max_attempts=0)
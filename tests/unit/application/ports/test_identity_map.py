@@ -0,0 +1,163 @@
+import pytest
+
+from resque_api.application.ports.repository.exceptions import AggregateNotFoundError
+from resque_api.application.ports.repository.identity_map import IdentityMap
+from resque_api.application.ports.repository.repository import Repository
+from tests.unit.fakes import FakeUnitOfWork
+
+
+class Aggregate:
+    def __init__(self, id: int, data: str):
+        self.id = id
+        self.data = data
+
+
+class CountingRepository(Repository):
+    def __init__(self, identity_map: IdentityMap | None = None):
+        self.identity_map = identity_map
+        self._aggregates = {}
+        self.loads = 0
+
+    def _save(self, aggregate):
+        self._aggregates[aggregate.id] = aggregate
+
+    def _get(self, aggregate_id):
+        self.loads += 1
+        return self._aggregates.get(aggregate_id)
+
+    def _find_all(self):
+        return [Aggregate(a.id, a.data) for a in self._aggregates.values()]
+
+    def _update(self, aggregate):
+        self._aggregates[aggregate.id] = aggregate
+        return True
+
+    def _delete(self, aggregate_id, expected_version=None):
+        return self._aggregates.pop(aggregate_id, None) is not None
+
+
+class ItemUnitOfWork(FakeUnitOfWork):
+    def __init__(self):
+        super().__init__()
+        self.items = CountingRepository(self.identity_map)
+
+
+@pytest.fixture
+def uow():
+    uow = ItemUnitOfWork()
+    uow.items._aggregates[1] = Aggregate(1, "stored")
+    return uow
+
+
+class TestIdentityMap:
+    def test_get_loads_each_id_once_per_transaction(self, uow):
+        """같은 트랜잭션에서 같은 ID 는 한 번만 불러오고 같은 인스턴스를 반환한다"""
+        # Given
+        with uow:
+            # When
+            first = uow.items.get(1)
+            second = uow.items.get(1)
+
+        # Then
+        assert first is second
+        assert uow.items.loads == 1
+        stats = uow.identity_map.stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert stats.hit_ratio == 0.5
+
+    def test_update_refreshes_tracked_instance(self, uow):
+        """update 한 인스턴스가 이후 get 에서 반환된다"""
+        # Given
+        with uow:
+            uow.items.get(1)
+            updated = Aggregate(1, "updated")
+
+            # When
+            uow.items.update(updated)
+
+            # Then
+            assert uow.items.get(1) is updated
+        assert uow.items.loads == 1
+
+    def test_save_tracks_new_aggregate(self, uow):
+        """save 한 애그리거트는 저장소를 다시 조회하지 않는다"""
+        # Given
+        aggregate = Aggregate(2, "new")
+
+        # When
+        with uow:
+            uow.items.save(aggregate)
+            loaded = uow.items.get(2)
+
+        # Then
+        assert loaded is aggregate
+        assert uow.items.loads == 0
+
+    def test_find_all_returns_tracked_instances(self, uow):
+        """전체 조회 결과에서도 이미 보관된 인스턴스를 재사용한다"""
+        # Given
+        with uow:
+            tracked = uow.items.get(1)
+
+            # When
+            aggregates = uow.items.find_all()
+
+        # Then
+        assert aggregates[0] is tracked
+
+    def test_delete_discards_tracked_instance(self, uow):
+        """삭제한 애그리거트는 보관에서 제거된다"""
+        # Given
+        with uow:
+            uow.items.get(1)
+
+            # When
+            uow.items.delete(1)
+
+            # Then
+            with pytest.raises(AggregateNotFoundError):
+                uow.items.get(1)
+
+    def test_cleared_when_transaction_ends(self, uow):
+        """트랜잭션이 끝나면 비워지고 다음 트랜잭션은 다시 불러온다"""
+        # Given
+        with uow:
+            uow.items.get(1)
+
+        # When
+        with uow:
+            uow.items.get(1)
+
+        # Then
+        assert len(uow.identity_map) == 0
+        assert uow.items.loads == 2
+
+    def test_cleared_on_savepoint_rollback(self, uow):
+        """세이브포인트가 롤백되면 비워진다"""
+        # Given
+        with uow:
+            uow.items.get(1)
+
+            # When
+            with pytest.raises(RuntimeError):
+                with uow.savepoint():
+                    uow.items.update(Aggregate(1, "discarded"))
+                    raise RuntimeError("boom")
+
+            # Then
+            assert len(uow.identity_map) == 0
+            uow.items.get(1)
+            assert uow.items.loads == 2
+
+    def test_repository_without_identity_map_always_loads(self):
+        """아이덴티티 맵이 없으면 매번 저장소를 조회한다"""
+        # Given
+        repository = CountingRepository()
+        repository.save(Aggregate(1, "stored"))
+
+        # When
+        repository.get(1)
+        repository.get(1)
+
+        # Then
+        assert repository.loads == 2
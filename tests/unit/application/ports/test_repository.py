@@ -1,8 +1,15 @@
+from dataclasses import dataclass, replace
 from typing import List, Optional
 
 import pytest
-from resque_api.application.ports.repository.exceptions import AggregateNotFoundError, DeleteNonExistentAggregateError
+from resque_api.application.ports.repository.exceptions import (
+    AggregateNotFoundError,
+    ConcurrencyConflictError,
+    DeleteNonExistentAggregateError,
+    InvalidPageCursorError,
+)
 from resque_api.application.ports.repository.repository import Repository
+from resque_api.domain.base.aggregate import Aggregate
 
 class Entity:
     def __init__(self, id: int, data: str):
@@ -22,13 +29,14 @@ class FakeRepository(Repository):
     def _find_all(self) -> List[Entity]:
         return list(self._entities.values())
 
-    def _update(self, entity: Entity) -> None:
-        if entity.id in self._entities:
-            self._entities[entity.id] = entity
+    def _update(self, entity: Entity) -> bool:
+        if entity.id not in self._entities:
+            return False
+        self._entities[entity.id] = entity
+        return True
 
-    def _delete(self, entity_id: int) -> None:
-        if entity_id in self._entities:
-            del self._entities[entity_id]
+    def _delete(self, entity_id: int, expected_version: Optional[int] = None) -> bool:
+        return self._entities.pop(entity_id, None) is not None
 
 class TestCreateEntity:
     def test_create_new_entity(self):
@@ -87,4 +95,136 @@ class TestDeleteEntity:
         repo = FakeRepository()
         with pytest.raises(DeleteNonExistentAggregateError):
             repo.delete(999)
-        
\ No newline at end of file
+        
+
+class TestBulkOperations:
+    def test_get_many_reports_missing_ids(self):
+        repo = FakeRepository()
+        repo.save_many([Entity(id=1, data="a"), Entity(id=2, data="b")])
+
+        result = repo.get_many([2, 999, 1, 2])
+
+        assert [e.id for e in result.found] == [2, 1]
+        assert result.missing == [999]
+
+    def test_delete_many_returns_missing_ids(self):
+        repo = FakeRepository()
+        repo.save_many([Entity(id=1, data="a"), Entity(id=2, data="b")])
+
+        missing = repo.delete_many([1, 999])
+
+        assert missing == [999]
+        assert list(repo._entities) == [2]
+
+    def test_empty_input(self):
+        repo = FakeRepository()
+
+        repo.save_many([])
+
+        assert repo.get_many([]).found == []
+        assert repo.delete_many([]) == []
+
+
+@dataclass(frozen=True)
+class VersionedAggregate(Aggregate):
+    data: str
+
+
+class VersionedRepository(Repository):
+    """저장된 version 을 조건으로 수정/삭제하는 가짜 저장소"""
+
+    def __init__(self):
+        self._aggregates = {}
+
+    def _save(self, aggregate):
+        self._aggregates[aggregate.id] = aggregate
+
+    def _get(self, aggregate_id):
+        return self._aggregates.get(aggregate_id)
+
+    def _update(self, aggregate):
+        stored = self._aggregates.get(aggregate.id)
+        if stored is None or stored.version != aggregate.version:
+            return False
+        self._aggregates[aggregate.id] = replace(aggregate, version=aggregate.version + 1)
+        return True
+
+    def _delete(self, aggregate_id, expected_version=None):
+        stored = self._aggregates.get(aggregate_id)
+        if stored is None or (expected_version is not None and stored.version != expected_version):
+            return False
+        del self._aggregates[aggregate_id]
+        return True
+
+
+class TestOptimisticConcurrency:
+    def test_update_returns_next_version(self):
+        repo = VersionedRepository()
+        aggregate = VersionedAggregate(data="a")
+        repo.save(aggregate)
+
+        stored = repo.update(replace(aggregate, data="b"))
+
+        assert stored.version == 1
+        assert repo.get(aggregate.id).data == "b"
+
+    def test_stale_update_raises_conflict(self):
+        repo = VersionedRepository()
+        aggregate = VersionedAggregate(data="a")
+        repo.save(aggregate)
+        repo.update(replace(aggregate, data="first"))
+
+        with pytest.raises(ConcurrencyConflictError):
+            repo.update(replace(aggregate, data="second"))
+        assert repo.get(aggregate.id).data == "first"
+
+    def test_update_of_missing_aggregate_raises_not_found(self):
+        repo = VersionedRepository()
+        aggregate = VersionedAggregate(data="a")
+        repo.save(aggregate)
+        repo.delete(aggregate.id)
+
+        with pytest.raises(AggregateNotFoundError):
+            repo.update(aggregate)
+        with pytest.raises(AggregateNotFoundError):
+            repo.update(VersionedAggregate(data="never saved"))
+
+    def test_stale_delete_raises_conflict(self):
+        repo = VersionedRepository()
+        aggregate = VersionedAggregate(data="a")
+        repo.save(aggregate)
+        repo.update(aggregate)
+
+        with pytest.raises(ConcurrencyConflictError):
+            repo.delete(aggregate.id, expected_version=0)
+        repo.delete(aggregate.id, expected_version=1)
+        assert aggregate.id not in repo._aggregates
+
+
+class TestStreamingAndPagination:
+    @pytest.fixture
+    def repo(self):
+        repo = FakeRepository()
+        repo.save_many([Entity(id=i, data=f"item {i}") for i in (3, 1, 5, 2, 4)])
+        return repo
+
+    def test_iter_all_yields_in_id_order(self, repo):
+        assert [e.id for e in repo.iter_all(batch_size=2)] == [1, 2, 3, 4, 5]
+
+    def test_page_walks_all_items_with_cursor(self, repo):
+        first = repo.page(limit=2)
+        second = repo.page(after=first.next_cursor, limit=2)
+        last = repo.page(after=second.next_cursor, limit=2)
+
+        assert [[e.id for e in p.items] for p in (first, second, last)] == [[1, 2], [3, 4], [5]]
+        assert not last.has_next
+
+    def test_cursor_for_other_ordering_is_rejected(self, repo):
+        cursor = repo.page(limit=1).next_cursor
+
+        with pytest.raises(InvalidPageCursorError):
+            repo.page(after=cursor, order_by="created_at")
+
+    def test_malformed_cursor_is_rejected(self, repo):
+        with pytest.raises(InvalidPageCursorError):
+            repo.page(after="not-a-cursor")
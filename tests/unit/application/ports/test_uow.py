@@ -0,0 +1,151 @@
+import pytest
+
+from tests.unit.fakes import FakeUnitOfWork
+
+
+class DictUnitOfWork(FakeUnitOfWork):
+    def __init__(self):
+        super().__init__()
+        self.data: dict = {}
+        self.committed: dict = {}
+
+    def commit(self) -> None:
+        super().commit()
+        self.committed = dict(self.data)
+
+    def rollback(self) -> None:
+        super().rollback()
+        self.data = dict(self.committed)
+
+    def _begin_savepoint(self):
+        return dict(self.data)
+
+    def _rollback_to_savepoint(self, token) -> None:
+        self.data = token
+
+
+class TestNestedTransaction:
+    def test_only_outermost_block_commits(self):
+        uow = DictUnitOfWork()
+
+        with uow:
+            with uow:
+                uow.data["a"] = 1
+            assert uow.commits == 0
+            assert uow.in_transaction
+
+        assert uow.commits == 1
+        assert not uow.in_transaction
+        assert uow.committed == {"a": 1}
+
+    def test_inner_error_rolls_back_outer_transaction(self):
+        uow = DictUnitOfWork()
+
+        with pytest.raises(RuntimeError):
+            with uow:
+                uow.data["a"] = 1
+                with uow:
+                    raise RuntimeError("boom")
+
+        assert uow.commits == 0
+        assert uow.rollbacks == 1
+        assert uow.data == {}
+
+    def test_rollback_discards_events(self):
+        uow = DictUnitOfWork()
+
+        with pytest.raises(RuntimeError):
+            with uow:
+                uow.publish("event")
+                raise RuntimeError("boom")
+
+        assert uow.pop_events() == ()
+
+
+class TestSavepoint:
+    def test_savepoint_rolls_back_block_only(self):
+        uow = DictUnitOfWork()
+
+        with uow:
+            uow.data["kept"] = 1
+            uow.publish("kept-event")
+            with pytest.raises(RuntimeError):
+                with uow.savepoint():
+                    uow.data["discarded"] = 2
+                    uow.publish("discarded-event")
+                    raise RuntimeError("boom")
+
+        assert uow.committed == {"kept": 1}
+        assert uow.pop_events() == ("kept-event",)
+
+    def test_successful_savepoint_keeps_changes(self):
+        uow = DictUnitOfWork()
+
+        with uow:
+            with uow.savepoint():
+                uow.data["a"] = 1
+
+        assert uow.committed == {"a": 1}
+
+
+class TestTransactionHooks:
+    def test_commit_hooks_run_after_outermost_commit(self):
+        uow = DictUnitOfWork()
+        calls = []
+
+        with uow:
+            with uow:
+                uow.on_commit(lambda: calls.append(uow.commits))
+            assert calls == []
+
+        assert calls == [1]
+
+    def test_rollback_hooks_run_on_failure(self):
+        uow = DictUnitOfWork()
+        calls = []
+
+        with pytest.raises(RuntimeError):
+            with uow:
+                uow.on_commit(lambda: calls.append("commit"))
+                uow.on_rollback(lambda: calls.append("rollback"))
+                raise RuntimeError("boom")
+
+        assert calls == ["rollback"]
+
+    def test_savepoint_rollback_drops_its_commit_hooks(self):
+        uow = DictUnitOfWork()
+        calls = []
+
+        with uow:
+            uow.on_commit(lambda: calls.append("outer"))
+            with pytest.raises(RuntimeError):
+                with uow.savepoint():
+                    uow.on_commit(lambda: calls.append("inner"))
+                    uow.on_rollback(lambda: calls.append("inner rolled back"))
+                    raise RuntimeError("boom")
+
+        assert calls == ["inner rolled back", "outer"]
+
+    def test_failed_commit_discards_events(self):
+        uow = FakeUnitOfWork(fail_commit=True)
+        calls = []
+
+        with pytest.raises(RuntimeError, match="commit failed"):
+            with uow:
+                uow.publish("lost")
+                uow.on_rollback(lambda: calls.append("rollback"))
+
+        uow.fail_commit = False
+        with uow:
+            uow.publish("kept")
+
+        assert calls == ["rollback"]
+        assert uow.pop_events() == ("kept",)
+
+    def test_commit_hook_outside_transaction_runs_immediately(self):
+        uow = DictUnitOfWork()
+        calls = []
+
+        uow.on_commit(lambda: calls.append("now"))
+
+        assert calls == ["now"]
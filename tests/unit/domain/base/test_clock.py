@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from resque_api.application.message.event.base.event import Event
+from resque_api.domain.base.clock import MonotonicUTCClock, utc_now
+
+
+class FakeTime:
+    def __init__(self):
+        self.wall = 1_700_000_000 * 1_000_000_000
+        self.monotonic = 0
+
+    def wall_ns(self):
+        return self.wall
+
+    def monotonic_ns(self):
+        return self.monotonic
+
+    def advance(self, seconds):
+        self.wall += int(seconds * 1_000_000_000)
+        self.monotonic += int(seconds * 1_000_000_000)
+
+
+@dataclass(frozen=True, kw_only=True)
+class ClockedEvent(Event):
+    pass
+
+
+class TestMonotonicUTCClock:
+    def test_returns_aware_utc(self):
+        """시간대가 UTC 인 현재 시각을 반환한다"""
+        now = utc_now()
+
+        assert now.tzinfo is timezone.utc
+        assert abs((datetime.now(timezone.utc) - now).total_seconds()) < 1
+
+    def test_follows_monotonic_time(self):
+        """시작 시각에 monotonic 경과 시간을 더한다"""
+        # Given
+        fake = FakeTime()
+        clock = MonotonicUTCClock(wall_ns=fake.wall_ns, monotonic_ns=fake.monotonic_ns)
+
+        # When
+        fake.advance(1.5)
+
+        # Then
+        assert clock() == datetime(2023, 11, 14, 22, 13, 21, 500000, tzinfo=timezone.utc)
+
+    def test_never_goes_backwards_on_resync(self):
+        """재동기화 시 벽시계가 뒤로 가도 반환값은 감소하지 않는다"""
+        # Given
+        fake = FakeTime()
+        clock = MonotonicUTCClock(resync_interval=1.0, wall_ns=fake.wall_ns, monotonic_ns=fake.monotonic_ns)
+        fake.advance(2)
+        before = clock()
+
+        # When
+        fake.wall -= 10 * 1_000_000_000
+        fake.monotonic += 2 * 1_000_000_000
+        after = clock()
+
+        # Then
+        assert after >= before
+
+
+class TestMessageDefaults:
+    def test_message_defaults_are_per_instance(self):
+        """메시지마다 새 ID 와 생성 시각이 부여되고 ID 는 생성 순서대로 정렬된다"""
+        first, second = ClockedEvent(), ClockedEvent()
+
+        assert first.id < second.id
+        assert first.occured_at <= second.occured_at
+        assert first.occured_at.tzinfo is timezone.utc
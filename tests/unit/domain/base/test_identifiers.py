@@ -0,0 +1,69 @@
+from datetime import datetime, timezone
+
+import pytest
+from resque_api.domain.base.identifiers import UUIDv7Generator, uuid7, uuid7_timestamp
+
+
+class FakeClock:
+    def __init__(self, ms):
+        self.ms = ms
+
+    def __call__(self):
+        return self.ms * 1_000_000
+
+
+class TestUUIDv7Generator:
+    def test_version_and_variant(self):
+        """RFC 9562 UUIDv7 형식으로 생성된다"""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_ids_sort_in_creation_order(self):
+        """같은 밀리초 안에서도 생성 순서대로 정렬된다"""
+        # Given
+        generator = UUIDv7Generator(clock_ns=FakeClock(1_700_000_000_000))
+
+        # When
+        ids = [generator() for _ in range(1000)]
+
+        # Then
+        assert ids == sorted(ids)
+        assert len(set(ids)) == 1000
+
+    def test_monotonic_when_clock_goes_backwards(self):
+        """시계가 뒤로 가도 이전 ID 보다 큰 ID 를 생성한다"""
+        # Given
+        clock = FakeClock(1_700_000_000_000)
+        generator = UUIDv7Generator(clock_ns=clock)
+        first = generator()
+
+        # When
+        clock.ms -= 5_000
+        second = generator()
+
+        # Then
+        assert second > first
+
+    def test_counter_overflow_advances_timestamp(self):
+        """한 밀리초 안에서 카운터가 넘치면 타임스탬프를 앞당겨 순서를 유지한다"""
+        generator = UUIDv7Generator(clock_ns=FakeClock(1_700_000_000_000))
+
+        ids = [generator() for _ in range(5000)]
+
+        assert ids == sorted(ids)
+        assert uuid7_timestamp(ids[-1]) > uuid7_timestamp(ids[0])
+
+    def test_timestamp(self):
+        """ID 에서 생성 시각을 읽을 수 있다"""
+        generator = UUIDv7Generator(clock_ns=FakeClock(1_700_000_000_123))
+
+        assert uuid7_timestamp(generator()) == datetime(2023, 11, 14, 22, 13, 20, 123000, tzinfo=timezone.utc)
+
+    def test_timestamp_rejects_other_versions(self):
+        """UUIDv7 이 아니면 ValueError"""
+        from uuid import uuid4
+
+        with pytest.raises(ValueError):
+            uuid7_timestamp(uuid4())
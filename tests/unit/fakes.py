@@ -0,0 +1,31 @@
+from resque_api.application.ports.uow import UnitOfWork
+
+
+class FakeUnitOfWork(UnitOfWork):
+    """커밋/롤백 횟수만 기록하는 테스트용 UnitOfWork
+
+    저장소나 상태가 필요한 테스트는 상속해서 추가한다. 세이브포인트 훅은 아무것도 하지 않는다.
+    """
+
+    def __init__(self, fail_commit=False):
+        super().__init__()
+        self.commits = 0
+        self.rollbacks = 0
+        self.fail_commit = fail_commit
+
+    def commit(self):
+        if self.fail_commit:
+            raise RuntimeError("commit failed")
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def _begin_savepoint(self):
+        return None
+
+    def _rollback_to_savepoint(self, token):
+        pass
+
+    def _release_savepoint(self, token):
+        pass
@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+
+import pytest
+from resque_api.domain.base.aggregate import Aggregate
+from resque_api.infrastructure.cache.aggregate_cache import AggregateCache
+
+
+@dataclass(frozen=True)
+class Note(Aggregate):
+    body: str
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestAggregateCache:
+    def test_evicts_least_recently_used_entry(self, clock):
+        """항목 수가 넘치면 가장 오래 사용되지 않은 항목을 제거한다"""
+        # Given
+        cache = AggregateCache(max_entries=2, clock=clock)
+        cache.put("a", Note(body="a"))
+        cache.put("b", Note(body="b"))
+        cache.get("a")
+
+        # When
+        cache.put("c", Note(body="c"))
+
+        # Then
+        assert cache.get("b") is None
+        assert cache.get("a").body == "a"
+        assert cache.stats().evictions == 1
+
+    def test_expires_after_ttl(self, clock):
+        """ttl 이 지난 항목은 조회되지 않는다"""
+        # Given
+        cache = AggregateCache(ttl=10, clock=clock)
+        cache.put("a", Note(body="a"))
+
+        # When
+        clock.now += 10
+
+        # Then
+        assert cache.get("a") is None
+        assert cache.stats().expirations == 1
+
+    def test_evicts_by_total_bytes(self, clock):
+        """크기 합이 max_bytes 를 넘으면 오래된 항목부터 제거하고, 한도보다 큰 항목은 저장하지 않는다"""
+        # Given
+        cache = AggregateCache(max_bytes=100, clock=clock, sizeof=lambda note: len(note.body))
+        cache.put("a", Note(body="x" * 60))
+
+        # When
+        cache.put("b", Note(body="y" * 60))
+        stored = cache.put("c", Note(body="z" * 101))
+
+        # Then
+        assert cache.get("a") is None
+        assert cache.stats().bytes == 60
+        assert stored is False
+
+    def test_put_is_skipped_after_concurrent_invalidation(self, clock):
+        """불러오는 동안 무효화가 있었으면 불러온 값을 저장하지 않는다"""
+        # Given
+        cache = AggregateCache(clock=clock)
+        generation = cache.generation
+
+        # When
+        cache.invalidate(["a"])
+        stored = cache.put("a", Note(body="stale"), generation)
+
+        # Then
+        assert stored is False
+        assert cache.get("a") is None
+
+    def test_stats_hit_ratio(self, clock):
+        """히트율을 집계한다"""
+        # Given
+        cache = AggregateCache(clock=clock)
+        cache.put("a", Note(body="a"))
+
+        # When
+        cache.get("a")
+        cache.get("a")
+        cache.get("missing")
+
+        # Then
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (2, 1, 1)
+        assert stats.hit_ratio == pytest.approx(2 / 3)
@@ -0,0 +1,145 @@
+from dataclasses import dataclass, replace
+
+import pytest
+from resque_api.application.ports.repository.repository import Repository
+from resque_api.domain.base.aggregate import Aggregate
+from resque_api.infrastructure.cache.aggregate_cache import AggregateCache
+from resque_api.infrastructure.cache.caching_repository import CachingRepository
+from tests.unit.fakes import FakeUnitOfWork
+
+
+@dataclass(frozen=True)
+class Note(Aggregate):
+    body: str
+
+
+class CountingRepository(Repository):
+    def __init__(self):
+        self.rows = {}
+        self.loads = 0
+
+    def _save(self, aggregate):
+        self.rows[aggregate.id] = aggregate
+
+    def _get(self, aggregate_id):
+        self.loads += 1
+        return self.rows.get(aggregate_id)
+
+    def _get_many(self, aggregate_ids):
+        self.loads += 1
+        return [self.rows[i] for i in aggregate_ids if i in self.rows]
+
+    def _update(self, aggregate):
+        stored = self.rows.get(aggregate.id)
+        if stored is None or stored.version != aggregate.version:
+            return False
+        self.rows[aggregate.id] = replace(aggregate, version=aggregate.version + 1)
+        return True
+
+    def _delete(self, aggregate_id, expected_version=None):
+        return self.rows.pop(aggregate_id, None) is not None
+
+
+class NoteUnitOfWork(FakeUnitOfWork):
+    def __init__(self):
+        super().__init__()
+        self.inner = CountingRepository()
+        self.cache = AggregateCache()
+
+    @property
+    def notes(self):
+        return CachingRepository(self.inner, self.cache, self)
+
+
+@pytest.fixture
+def uow():
+    return NoteUnitOfWork()
+
+
+@pytest.fixture
+def note(uow):
+    note = Note(body="draft")
+    uow.inner.rows[note.id] = note
+    return note
+
+
+class TestCachingRepository:
+    def test_get_reads_through_cache(self, uow, note):
+        """처음 조회한 애그리거트는 다음 트랜잭션부터 캐시에서 반환된다"""
+        # Given
+        with uow:
+            uow.notes.get(note.id)
+
+        # When
+        with uow:
+            loaded = uow.notes.get(note.id)
+
+        # Then
+        assert loaded == note
+        assert uow.inner.loads == 1
+        assert uow.cache.stats().hits == 1
+
+    def test_update_invalidates_on_commit(self, uow, note):
+        """커밋된 수정은 캐시에서 제거되어 다음 조회에 반영된다"""
+        # Given
+        with uow:
+            uow.notes.get(note.id)
+
+        # When
+        with uow:
+            uow.notes.update(replace(note, body="published"))
+
+        # Then
+        with uow:
+            assert uow.notes.get(note.id).body == "published"
+        assert uow.cache.stats().invalidations >= 1
+
+    def test_uncommitted_write_bypasses_cache(self, uow, note):
+        """커밋 전에는 수정한 ID 를 캐시에 넣지 않는다"""
+        # Given
+        with uow:
+            repository = uow.notes
+            repository.update(replace(note, body="pending"))
+            uow.identity_map.clear()
+
+            # When
+            repository.get(note.id)
+
+            # Then
+            assert len(uow.cache) == 0
+
+    def test_rollback_discards_pending_invalidation(self, uow, note):
+        """롤백되면 대기 중인 무효화는 버려지고 다음 조회부터 다시 캐시를 사용한다"""
+        # Given
+        with pytest.raises(RuntimeError):
+            with uow:
+                uow.notes.delete(note.id)
+                uow.inner.rows[note.id] = note  # 저장소 롤백 흉내
+                raise RuntimeError("boom")
+
+        # When
+        with uow:
+            uow.notes.get(note.id)
+        with uow:
+            uow.notes.get(note.id)
+
+        # Then
+        assert uow.cache.stats().hits == 1
+
+    def test_get_many_loads_only_uncached_ids(self, uow, note):
+        """get_many 는 캐시에 없는 ID 만 저장소에서 불러온다"""
+        # Given
+        other = Note(body="other")
+        uow.inner.rows[other.id] = other
+        with uow:
+            uow.notes.get(note.id)
+        uow.inner.loads = 0
+
+        # When
+        with uow:
+            result = uow.notes.get_many([note.id, other.id])
+
+        # Then
+        assert {n.id for n in result.found} == {note.id, other.id}
+        assert uow.inner.loads == 1
+        assert len(uow.cache) == 2
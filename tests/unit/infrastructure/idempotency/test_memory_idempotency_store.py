@@ -0,0 +1,66 @@
+import pytest
+from resque_api.infrastructure.idempotency.memory_store import InMemoryIdempotencyStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestInMemoryIdempotencyStore:
+    def test_get_and_put(self, clock):
+        """저장한 결과를 조회하고 적중/미적중을 센다"""
+        # Given
+        store = InMemoryIdempotencyStore(clock=clock)
+
+        # When
+        missing = store.get("k")
+        store.put("k", None)
+        record = store.get("k")
+
+        # Then
+        assert missing is None
+        assert record is not None and record.result is None
+        stats = store.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+    def test_expires_after_ttl(self, clock):
+        """ttl 이 지난 키는 만료된다"""
+        store = InMemoryIdempotencyStore(ttl=10, clock=clock)
+        store.put("k", "result")
+
+        clock.now = 10
+        assert store.get("k") is None
+        assert store.stats().expirations == 1
+        assert len(store) == 0
+
+    def test_evicts_least_recently_used(self, clock):
+        """max_entries 를 넘으면 가장 오래 사용되지 않은 키부터 제거한다"""
+        # Given
+        store = InMemoryIdempotencyStore(max_entries=2, clock=clock)
+        store.put("a", 1)
+        store.put("b", 2)
+
+        # When
+        store.get("a")
+        store.put("c", 3)
+
+        # Then
+        assert store.get("b") is None
+        assert store.get("a").result == 1
+        assert store.stats().evictions == 1
+
+    def test_invalid_arguments(self):
+        """설정값 검증"""
+        with pytest.raises(ValueError):
+            InMemoryIdempotencyStore(max_entries=0)
+        with pytest.raises(ValueError):
+            InMemoryIdempotencyStore(ttl=0)
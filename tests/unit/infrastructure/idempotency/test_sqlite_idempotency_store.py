@@ -0,0 +1,77 @@
+import sqlite3
+
+import pytest
+from resque_api.infrastructure.idempotency.sqlite_store import SqliteIdempotencyStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    yield connection
+    connection.close()
+
+
+def make_store(connection, clock, **kwargs):
+    store = SqliteIdempotencyStore(connection, clock=clock, **kwargs)
+    store.create_table()
+    return store
+
+
+class TestSqliteIdempotencyStore:
+    def test_round_trip(self, connection, clock):
+        """결과를 저장하고 다른 인스턴스에서도 조회할 수 있다"""
+        # Given
+        make_store(connection, clock).put("k", {"invitation": "a@example.com"})
+
+        # When
+        record = make_store(connection, clock).get("k")
+
+        # Then
+        assert record.result == {"invitation": "a@example.com"}
+        assert record.stored_at == 1000.0
+
+    def test_expired_keys(self, connection, clock):
+        """ttl 이 지난 키는 조회되지 않고 purge_expired 로 삭제된다"""
+        # Given
+        store = make_store(connection, clock, ttl=10)
+        store.put("old", 1)
+        clock.now += 20
+        store.put("new", 2)
+
+        # When
+        missing = store.get("old")
+        removed = store.purge_expired()
+
+        # Then
+        assert missing is None
+        assert removed == 1
+        stats = store.stats()
+        assert (stats.size, stats.misses, stats.expirations) == (1, 1, 1)
+
+    def test_max_entries(self, connection, clock):
+        """max_entries 를 넘으면 가장 먼저 저장된 키부터 제거한다"""
+        # Given
+        store = make_store(connection, clock, max_entries=2)
+
+        # When
+        for key in ("a", "b", "c"):
+            clock.now += 1
+            store.put(key, key)
+
+        # Then
+        assert store.get("a") is None
+        assert store.get("c").result == "c"
+        assert store.stats().evictions == 1
@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
+from uuid import UUID, uuid4
+
+import pytest
+from resque_api.application.message.event.base.event import Event
+from resque_api.infrastructure.outbox.exceptions import UnknownEventTypeError
+from resque_api.infrastructure.outbox.json_serializer import JsonEventSerializer
+
+
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@dataclass(frozen=True)
+class Label:
+    name: str
+    color: Color
+
+
+@dataclass(frozen=True, kw_only=True)
+class LabeledEvent(Event):
+    owner_id: UUID
+    labels: tuple[Label, ...] = ()
+    due_at: datetime | None = None
+
+
+def make_event(**kwargs):
+    return LabeledEvent(occured_at=datetime.now(timezone.utc), owner_id=uuid4(), **kwargs)
+
+
+class TestJsonEventSerializer:
+    def test_round_trip(self):
+        """UUID, datetime, Enum, 중첩 값 객체를 원래 타입으로 복원한다"""
+        # Given
+        serializer = JsonEventSerializer([LabeledEvent])
+        event = make_event(
+            aggregate_id=uuid4(),
+            labels=(Label("bug", Color.RED), Label("ui", Color.BLUE)),
+            due_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        )
+
+        # When
+        event_type, payload = serializer.serialize(event)
+        restored = serializer.deserialize(event_type, payload)
+
+        # Then
+        assert event_type == "LabeledEvent"
+        assert isinstance(payload, bytes)
+        assert restored == event
+
+    def test_optional_none(self):
+        """None 인 선택 필드도 복원된다"""
+        serializer = JsonEventSerializer([LabeledEvent])
+        event = make_event()
+
+        assert serializer.deserialize(*serializer.serialize(event)) == event
+
+    def test_unregistered_type(self):
+        """등록되지 않은 이벤트 타입은 UnknownEventTypeError"""
+        serializer = JsonEventSerializer()
+
+        with pytest.raises(UnknownEventTypeError):
+            serializer.serialize(make_event())
+        with pytest.raises(UnknownEventTypeError):
+            serializer.deserialize("LabeledEvent", b"{}")
+
+    def test_register_as_decorator(self):
+        """register 는 데코레이터로 사용할 수 있다"""
+        serializer = JsonEventSerializer()
+
+        @serializer.register
+        @dataclass(frozen=True, kw_only=True)
+        class DecoratedEvent(Event):
+            pass
+
+        event = DecoratedEvent(occured_at=datetime.now(timezone.utc))
+        assert serializer.deserialize(*serializer.serialize(event)) == event
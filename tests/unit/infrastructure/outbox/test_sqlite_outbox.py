@@ -0,0 +1,206 @@
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import pytest
+from resque_api.application.message.event.base.event import Event
+from resque_api.infrastructure.outbox.json_serializer import JsonEventSerializer
+from resque_api.infrastructure.outbox.sqlite_outbox import SqliteOutbox
+from resque_api.infrastructure.persistence.sqlite_uow import SqliteUnitOfWork
+
+
+@dataclass(frozen=True, kw_only=True)
+class NumberedEvent(Event):
+    number: int
+
+
+def make_event(number):
+    return NumberedEvent(occured_at=datetime.now(timezone.utc), number=number)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE items (name TEXT NOT NULL)")
+    connection.commit()
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def outbox(connection, clock):
+    outbox = SqliteOutbox(connection, JsonEventSerializer([NumberedEvent]), clock=clock)
+    outbox.create_table()
+    return outbox
+
+
+@pytest.fixture
+def uow(connection, outbox):
+    return SqliteUnitOfWork(connection, outbox)
+
+
+def item_names(connection):
+    return [name for (name,) in connection.execute("SELECT name FROM items ORDER BY rowid")]
+
+
+class TestSqliteOutbox:
+    def test_fetch_pending_in_order(self, outbox):
+        """미전달 이벤트를 기록 순서대로 limit 개 조회한다"""
+        # Given
+        outbox.add([make_event(n) for n in range(5)])
+
+        # When
+        entries = outbox.fetch_pending(3)
+
+        # Then
+        assert [entry.event.number for entry in entries] == [0, 1, 2]
+        assert outbox.pending_count() == 5
+
+    def test_mark_delivered_and_failed(self, outbox):
+        """전달 완료된 이벤트는 조회되지 않고, 실패 횟수는 누적된다"""
+        # Given
+        outbox.add([make_event(n) for n in range(3)])
+        first, second, _ = outbox.fetch_pending(3)
+
+        # When
+        outbox.mark_delivered([first.id])
+        outbox.mark_failed(second.id, "boom")
+        outbox.mark_failed(second.id, "boom")
+
+        # Then
+        pending = outbox.fetch_pending(10)
+        assert [entry.event.number for entry in pending] == [1, 2]
+        assert pending[0].attempts == 2
+
+    def test_failed_entry_blocks_later_entries_until_retry_at(self, outbox, clock):
+        """재시도 대기 중인 이벤트부터는 대기 시간이 지날 때까지 조회하지 않는다"""
+        # Given
+        outbox.add([make_event(n) for n in range(3)])
+        _, second, _ = outbox.fetch_pending(3)
+
+        # When
+        outbox.mark_failed(second.id, "boom", retry_after=5.0)
+
+        # Then
+        assert [entry.event.number for entry in outbox.fetch_pending(10)] == [0]
+        clock.now += 5.0
+        assert [entry.event.number for entry in outbox.fetch_pending(10)] == [0, 1, 2]
+
+    def test_mark_dead_excludes_entry(self, outbox):
+        """데드레터로 옮긴 이벤트는 조회되지 않는다"""
+        # Given
+        outbox.add([make_event(n) for n in range(2)])
+        first, _ = outbox.fetch_pending(2)
+
+        # When
+        outbox.mark_dead(first.id, "poison")
+
+        # Then
+        assert [entry.event.number for entry in outbox.fetch_pending(10)] == [1]
+        assert outbox.pending_count() == 1
+        assert outbox.dead_letter_count() == 1
+
+    def test_undeserializable_row_is_dead_lettered(self, connection, outbox):
+        """복원할 수 없는 행은 데드레터로 옮기고 나머지 행은 그대로 조회한다"""
+        # Given
+        outbox.add([make_event(0)])
+        connection.execute(
+            "INSERT INTO outbox (event_id, event_type, payload, created_at) VALUES ('x', 'UnknownEvent', '{}', 0)"
+        )
+        outbox.add([make_event(2)])
+
+        # When
+        entries = outbox.fetch_pending(10)
+
+        # Then
+        assert [entry.event.number for entry in entries] == [0, 2]
+        assert outbox.dead_letter_count() == 1
+        assert [entry.event.number for entry in outbox.fetch_pending(10)] == [0, 2]
+
+    def test_compact_removes_old_delivered_rows(self, outbox, clock):
+        """compact 는 기준 시각 이전에 전달된 행만 삭제한다"""
+        # Given
+        outbox.add([make_event(n) for n in range(3)])
+        first, second, _ = outbox.fetch_pending(3)
+        outbox.mark_delivered([first.id])
+        clock.now += 100
+        outbox.mark_delivered([second.id])
+
+        # When
+        removed = outbox.compact(delivered_before=1050.0)
+
+        # Then
+        assert removed == 1
+        assert outbox.compact(delivered_before=2000.0) == 1
+        assert outbox.pending_count() == 1
+
+    def test_invalid_table_name(self, connection):
+        """테이블 이름은 식별자여야 한다"""
+        with pytest.raises(ValueError):
+            SqliteOutbox(connection, JsonEventSerializer(), table="outbox; DROP TABLE items")
+
+
+class TestSqliteUnitOfWork:
+    def test_commit_writes_events_with_changes(self, connection, uow, outbox):
+        """커밋 시 변경 사항과 이벤트가 함께 기록되고 메모리 이벤트는 비워진다"""
+        # When
+        with uow:
+            connection.execute("INSERT INTO items VALUES ('a')")
+            uow.publish(make_event(1))
+
+        # Then
+        assert item_names(connection) == ["a"]
+        assert [entry.event.number for entry in outbox.fetch_pending(10)] == [1]
+        assert uow.pop_events() == ()
+
+    def test_rollback_discards_events_with_changes(self, connection, uow, outbox):
+        """롤백 시 변경 사항과 이벤트가 함께 버려진다"""
+        # When
+        with pytest.raises(RuntimeError):
+            with uow:
+                connection.execute("INSERT INTO items VALUES ('a')")
+                uow.publish(make_event(1))
+                raise RuntimeError("boom")
+
+        # Then
+        assert item_names(connection) == []
+        assert outbox.pending_count() == 0
+
+    def test_savepoint_rolls_back_inner_block(self, connection, uow, outbox):
+        """세이브포인트 안의 실패는 그 블록의 변경과 이벤트만 되돌린다"""
+        # When
+        with uow:
+            connection.execute("INSERT INTO items VALUES ('kept')")
+            uow.publish(make_event(1))
+            with pytest.raises(RuntimeError):
+                with uow.savepoint():
+                    connection.execute("INSERT INTO items VALUES ('dropped')")
+                    uow.publish(make_event(2))
+                    raise RuntimeError("boom")
+
+        # Then
+        assert item_names(connection) == ["kept"]
+        assert [entry.event.number for entry in outbox.fetch_pending(10)] == [1]
+
+    def test_without_outbox_keeps_events_in_memory(self, connection):
+        """아웃박스가 없으면 커밋 후에도 이벤트를 버스가 수집할 수 있다"""
+        uow = SqliteUnitOfWork(connection)
+        event = make_event(1)
+
+        with uow:
+            uow.publish(event)
+
+        assert uow.pop_events() == (event,)
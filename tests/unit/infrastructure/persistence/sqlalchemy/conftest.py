@@ -0,0 +1,19 @@
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from resque_api.infrastructure.persistence.sqlalchemy.engine import PoolSettings, create_engine_from_settings
+from resque_api.infrastructure.persistence.sqlalchemy.tables import metadata
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """임시 파일 SQLite 엔진 (테이블 생성 완료)"""
+    engine = create_engine_from_settings(f"sqlite:///{tmp_path / 'resque.db'}", PoolSettings(pool_size=2, max_overflow=0))
+    metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(engine, expire_on_commit=False)
@@ -0,0 +1,41 @@
+from resque_api.infrastructure.persistence.sqlalchemy.engine import (
+    PoolMetrics,
+    PoolSettings,
+    create_engine_from_settings,
+)
+from resque_api.infrastructure.persistence.sqlalchemy.uow import SqlAlchemyUnitOfWork
+
+
+class TestPoolMetrics:
+    def test_records_checkout_and_checkin_per_unit_of_work(self, engine, session_factory, sample_user):
+        """UnitOfWork 마다 커넥션을 한 번 빌리고 블록이 끝나면 반납한다"""
+        # Given
+        metrics = PoolMetrics(engine)
+        uow = SqlAlchemyUnitOfWork(session_factory)
+
+        # When
+        for _ in range(3):
+            with uow:
+                uow.users.find_all()
+
+        # Then
+        stats = metrics.snapshot()
+        assert stats.checkouts == 3
+        assert stats.checkins == 3
+        assert stats.in_use == 0
+        assert stats.max_in_use == 1
+        assert stats.size == 2
+
+    def test_memory_sqlite_shares_single_connection(self):
+        """메모리 SQLite 는 풀 설정과 관계없이 커넥션 하나를 공유한다"""
+        # Given
+        engine = create_engine_from_settings("sqlite://", PoolSettings(pool_size=10))
+        metrics = PoolMetrics(engine)
+
+        # When
+        with engine.connect(), engine.connect():
+            pass
+
+        # Then
+        assert metrics.snapshot().connects <= 1
+        engine.dispose()
@@ -0,0 +1,290 @@
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event
+
+from resque_api.application.ports.repository.exceptions import (
+    AggregateNotFoundError,
+    DeleteNonExistentAggregateError,
+)
+from resque_api.domain.base.identifiers import uuid7
+from resque_api.domain.common.value_objects import Email
+from resque_api.domain.project.entities import ProjectMember
+from resque_api.domain.project.value_objects import ProjectRole
+from resque_api.domain.requirement.entities import Requirement
+from resque_api.domain.requirement.value_objects import (
+    RequirementDescription,
+    RequirementPriority,
+    RequirementTitle,
+)
+from resque_api.domain.user.value_objects import UserStatus
+from resque_api.infrastructure.persistence.sqlalchemy.uow import SqlAlchemyUnitOfWork
+
+
+@pytest.fixture
+def uow(session_factory):
+    return SqlAlchemyUnitOfWork(session_factory)
+
+
+@pytest.fixture
+def member(valid_project) -> ProjectMember:
+    return valid_project.members[0]
+
+
+@pytest.fixture
+def requirement(valid_project, member) -> Requirement:
+    return Requirement(
+        project_id=valid_project.id,
+        title=RequirementTitle("Requirement"),
+        description=RequirementDescription("Requirement description"),
+        assignee_id=member.id,
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow(),
+        priority=RequirementPriority(1),
+    )
+
+
+class TestSqlAlchemyRepositories:
+    def test_user_round_trip(self, uow, valid_user):
+        """사용자의 모든 필드가 보존된다"""
+        # Given
+        with uow:
+            uow.users.save(valid_user)
+            uow.commit()
+
+        # When
+        with uow:
+            loaded = uow.users.get(valid_user.id)
+
+        # Then
+        assert loaded.email.value == valid_user.email
+        assert loaded.password == valid_user.password
+        assert loaded.status == valid_user.status
+        assert loaded.created_at == valid_user.created_at
+        assert loaded.created_at.tzinfo is not None
+
+    def test_project_round_trip_with_members_and_invitations(self, uow, valid_project):
+        """프로젝트 멤버와 초대가 보존된다"""
+        # Given
+        project, invitation = valid_project.invite_member(Email("invite@example.com"), ProjectRole.MEMBER)
+        with uow:
+            uow.projects.save(project)
+            uow.commit()
+
+        # When
+        with uow:
+            loaded = uow.projects.get(project.id)
+
+        # Then
+        assert [(m.id, m.user_id, m.role) for m in loaded.members] == [
+            (m.id, m.user_id, m.role) for m in project.members
+        ]
+        loaded_invitation = loaded.invitations[invitation.code]
+        assert loaded_invitation.email.value == "invite@example.com"
+        assert loaded_invitation.expires_at == invitation.expires_at
+
+    def test_requirement_round_trip(self, uow, requirement, member):
+        """요구사항의 태그, 댓글, 의존성, 시각이 보존된다"""
+        # Given
+        requirement, comment = requirement.add_tag("backend").add_comment(member, "looks good")
+        requirement = replace(requirement, dependencies=[comment.id])
+        with uow:
+            uow.requirements.save(requirement)
+            uow.commit()
+
+        # When
+        with uow:
+            loaded = uow.requirements.get(requirement.id)
+
+        # Then
+        assert loaded.tags == requirement.tags
+        assert loaded.comments[comment.id].content == "looks good"
+        assert loaded.comments[comment.id].created_at == comment.created_at
+        assert loaded.dependencies == [comment.id]
+        assert loaded.created_at == requirement.created_at.replace(tzinfo=timezone.utc)
+
+    def test_update_and_find_all(self, uow, sample_user, valid_user):
+        """수정한 값이 반영되고 전체 조회에 모두 포함된다"""
+        # Given
+        with uow:
+            uow.users.save(sample_user)
+            uow.users.save(valid_user)
+            uow.commit()
+
+        # When
+        with uow:
+            uow.users.update(replace(sample_user, status=UserStatus.INACTIVE))
+            uow.commit()
+
+        # Then
+        with uow:
+            assert uow.users.get(sample_user.id).status == UserStatus.INACTIVE
+            assert {user.id for user in uow.users.find_all()} == {sample_user.id, valid_user.id}
+
+    def test_delete(self, uow, sample_user):
+        """삭제한 애그리거트는 조회되지 않고, 없는 애그리거트 삭제는 실패한다"""
+        # Given
+        with uow:
+            uow.users.save(sample_user)
+            uow.commit()
+
+        # When
+        with uow:
+            uow.users.delete(sample_user.id)
+            uow.commit()
+
+        # Then
+        with uow:
+            with pytest.raises(AggregateNotFoundError):
+                uow.users.get(sample_user.id)
+            with pytest.raises(DeleteNonExistentAggregateError):
+                uow.users.delete(sample_user.id)
+
+
+class TestSqlAlchemyBulkOperations:
+    @pytest.fixture
+    def statements(self, engine):
+        statements = []
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if not statement.startswith(("BEGIN", "SAVEPOINT", "RELEASE")):
+                statements.append(statement.split()[0])
+
+        yield statements
+        event.remove(engine, "before_cursor_execute", record)
+
+    @pytest.fixture
+    def requirements(self, requirement):
+        return [
+            replace(requirement, id=uuid7(), title=RequirementTitle(f"Requirement {i}")) for i in range(600)
+        ]
+
+    def test_save_many_uses_single_insert(self, uow, requirements, statements):
+        """여러 애그리거트를 INSERT 한 번(executemany)으로 저장한다"""
+        # When
+        with uow:
+            uow.requirements.save_many(requirements)
+            uow.commit()
+
+        # Then
+        assert statements == ["INSERT"]
+        with uow:
+            assert len(uow.requirements.find_all()) == 600
+
+    def test_get_many_uses_in_queries_and_reports_missing(self, uow, requirements, statements):
+        """IN 조회를 청크 단위로 실행하고, 없는 ID 는 missing 으로 반환한다"""
+        # Given
+        with uow:
+            uow.requirements.save_many(requirements)
+            uow.commit()
+        statements.clear()
+        unknown = uuid7()
+
+        # When
+        with uow:
+            result = uow.requirements.get_many([*(str(r.id) for r in requirements), unknown])
+
+        # Then
+        assert [r.id for r in result.found] == [r.id for r in requirements]
+        assert result.missing == [unknown]
+        assert statements == ["SELECT", "SELECT"]
+
+    def test_delete_many_returns_missing(self, uow, requirements):
+        """존재하는 ID 만 삭제하고 없는 ID 를 반환한다"""
+        # Given
+        with uow:
+            uow.requirements.save_many(requirements[:3])
+            uow.commit()
+        unknown = uuid7()
+
+        # When
+        with uow:
+            missing = uow.requirements.delete_many([requirements[0].id, unknown])
+            uow.commit()
+
+        # Then
+        assert missing == [unknown]
+        with uow:
+            assert {r.id for r in uow.requirements.find_all()} == {r.id for r in requirements[1:3]}
+
+    def test_delete_many_uses_one_delete_per_chunk(self, uow, requirements, statements):
+        """청크마다 DELETE ... RETURNING 한 번으로 삭제하고 없는 ID 를 반환한다"""
+        # Given
+        with uow:
+            uow.requirements.save_many(requirements)
+            uow.commit()
+        statements.clear()
+        unknown = uuid7()
+
+        # When
+        with uow:
+            missing = uow.requirements.delete_many([*(r.id for r in requirements), unknown])
+            uow.commit()
+
+        # Then
+        assert missing == [unknown]
+        assert statements == ["DELETE", "DELETE"]
+        with uow:
+            assert uow.requirements.find_all() == []
+
+
+class TestSqlAlchemyStreamingAndPagination:
+    @pytest.fixture
+    def requirements(self, uow, requirement):
+        base = datetime(2030, 1, 1, tzinfo=timezone.utc)
+        requirements = [
+            replace(requirement, id=uuid7(), created_at=base + timedelta(minutes=i % 7)) for i in range(250)
+        ]
+        with uow:
+            uow.requirements.save_many(requirements)
+            uow.commit()
+        return requirements
+
+    def test_iter_all_streams_every_row_in_id_order(self, uow, requirements):
+        """모든 행을 ID 순서로 스트리밍한다"""
+        # When
+        with uow:
+            streamed = [r.id for r in uow.requirements.iter_all(batch_size=40)]
+
+        # Then
+        assert streamed == sorted(r.id for r in requirements)
+
+    @pytest.mark.parametrize("order_by", ["id", "created_at"])
+    def test_page_visits_each_row_once_in_stable_order(self, uow, requirements, order_by):
+        """커서를 따라가면 모든 행을 중복 없이 (정렬 값, ID) 순서로 한 번씩 방문한다"""
+        # Given
+        pages, cursor = [], None
+
+        # When
+        with uow:
+            while True:
+                page = uow.requirements.page(after=cursor, limit=60, order_by=order_by)
+                pages.append(page.items)
+                if not page.has_next:
+                    break
+                cursor = page.next_cursor
+
+        # Then
+        visited = [r.id for items in pages for r in items]
+        expected = sorted(requirements, key=lambda r: (getattr(r, order_by), r.id))
+        assert visited == [r.id for r in expected]
+        assert [len(items) for items in pages] == [60, 60, 60, 60, 10]
+
+    def test_page_is_stable_when_earlier_rows_are_deleted(self, uow, requirements):
+        """앞 페이지의 행이 삭제돼도 다음 페이지는 밀리지 않는다"""
+        # Given
+        with uow:
+            first = uow.requirements.page(limit=10)
+        with uow:
+            uow.requirements.delete_many([r.id for r in first.items[:5]])
+            uow.commit()
+
+        # When
+        with uow:
+            second = uow.requirements.page(after=first.next_cursor, limit=10)
+
+        # Then
+        ordered = sorted(r.id for r in requirements)
+        assert [r.id for r in second.items] == ordered[10:20]
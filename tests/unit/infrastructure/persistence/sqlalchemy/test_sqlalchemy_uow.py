@@ -0,0 +1,139 @@
+from dataclasses import replace
+
+import pytest
+from sqlalchemy import event
+
+from resque_api.application.ports.repository.exceptions import AggregateNotFoundError, ConcurrencyConflictError
+from resque_api.domain.user.value_objects import UserStatus
+from resque_api.infrastructure.cache.aggregate_cache import AggregateCache
+from resque_api.infrastructure.persistence.sqlalchemy.uow import SqlAlchemyUnitOfWork
+
+
+class TestSqlAlchemyUnitOfWork:
+    def test_commit_persists_across_units_of_work(self, session_factory, sample_user):
+        """커밋한 변경은 다음 UnitOfWork 에서 조회된다"""
+        # Given
+        uow = SqlAlchemyUnitOfWork(session_factory)
+
+        # When
+        with uow:
+            uow.users.save(sample_user)
+            uow.commit()
+
+        # Then
+        with SqlAlchemyUnitOfWork(session_factory) as other:
+            assert other.users.get(sample_user.id).email == sample_user.email
+
+    def test_exception_rolls_back(self, session_factory, sample_user):
+        """블록에서 예외가 나면 변경이 롤백된다"""
+        # Given
+        uow = SqlAlchemyUnitOfWork(session_factory)
+
+        # When
+        with pytest.raises(RuntimeError):
+            with uow:
+                uow.users.save(sample_user)
+                raise RuntimeError("boom")
+
+        # Then
+        with uow:
+            with pytest.raises(AggregateNotFoundError):
+                uow.users.get(sample_user.id)
+
+    def test_savepoint_rolls_back_only_inner_changes(self, session_factory, sample_user, valid_project):
+        """세이브포인트 안의 변경만 롤백되고 바깥 변경은 커밋된다"""
+        # Given
+        uow = SqlAlchemyUnitOfWork(session_factory)
+
+        # When
+        with uow:
+            uow.users.save(sample_user)
+            with pytest.raises(RuntimeError):
+                with uow.savepoint():
+                    uow.projects.save(valid_project)
+                    raise RuntimeError("boom")
+            uow.commit()
+
+        # Then
+        with uow:
+            assert uow.users.get(sample_user.id) == sample_user
+            with pytest.raises(AggregateNotFoundError):
+                uow.projects.get(valid_project.id)
+
+    def test_session_is_shared_within_block_and_closed_after(self, session_factory):
+        """중첩 블록은 같은 세션을 쓰고, 가장 바깥 블록이 끝나면 세션이 닫힌다"""
+        # Given
+        uow = SqlAlchemyUnitOfWork(session_factory)
+
+        # When
+        with uow:
+            outer = uow.session
+            with uow:
+                inner = uow.session
+
+        # Then
+        assert outer is inner
+        assert uow.session is None
+
+    def test_identity_map_normalizes_string_ids(self, session_factory, sample_user):
+        """문자열 ID 와 UUID 로 조회해도 같은 인스턴스를 반환한다"""
+        # Given
+        uow = SqlAlchemyUnitOfWork(session_factory)
+        with uow:
+            uow.users.save(sample_user)
+            uow.commit()
+
+        # When
+        with uow:
+            first = uow.users.get(str(sample_user.id))
+            second = uow.users.get(sample_user.id)
+
+        # Then
+        assert first is second
+        assert uow.identity_map.stats().hits == 1
+
+    def test_concurrent_update_conflicts(self, session_factory, sample_user):
+        """먼저 커밋한 수정이 있으면 같은 버전을 읽은 다른 수정은 충돌한다"""
+        # Given
+        with SqlAlchemyUnitOfWork(session_factory) as uow:
+            uow.users.save(sample_user)
+        first, second = SqlAlchemyUnitOfWork(session_factory), SqlAlchemyUnitOfWork(session_factory)
+        with first:
+            loaded_first = first.users.get(sample_user.id)
+        with second:
+            loaded_second = second.users.get(sample_user.id)
+
+        # When
+        with first:
+            stored = first.users.update(replace(loaded_first, status=UserStatus.INACTIVE))
+
+        # Then
+        assert stored.version == 1
+        with pytest.raises(ConcurrencyConflictError):
+            with second:
+                second.users.update(replace(loaded_second, password=None))
+        with pytest.raises(ConcurrencyConflictError):
+            with second:
+                second.users.delete(sample_user.id, expected_version=0)
+        with second:
+            assert second.users.get(sample_user.id).version == 1
+
+    def test_cache_serves_users_across_units_of_work(self, engine, session_factory, sample_user):
+        """캐시를 지정하면 커밋 후 다른 UnitOfWork 의 조회가 데이터베이스를 거치지 않는다"""
+        # Given
+        cache = AggregateCache()
+        with SqlAlchemyUnitOfWork(session_factory, cache=cache) as uow:
+            uow.users.save(sample_user)
+        with SqlAlchemyUnitOfWork(session_factory, cache=cache) as uow:
+            uow.users.get(sample_user.id)
+        selects = []
+        event.listen(engine, "before_cursor_execute", lambda *args: selects.append(args[2]))
+
+        # When
+        with SqlAlchemyUnitOfWork(session_factory, cache=cache) as uow:
+            loaded = uow.users.get(str(sample_user.id))
+
+        # Then
+        assert loaded == sample_user
+        assert not any(statement.startswith("SELECT") for statement in selects)
+        assert cache.stats().hits == 1
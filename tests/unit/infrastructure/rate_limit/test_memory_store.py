@@ -0,0 +1,67 @@
+import pytest
+
+from resque_api.application.ports.rate_limit import TokenBucketPolicy
+from resque_api.infrastructure.rate_limit.memory_store import InMemoryTokenBucketStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestInMemoryTokenBucketStore:
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def policy(self):
+        return TokenBucketPolicy(capacity=2, refill_per_second=0.5)
+
+    def test_consume_until_empty(self, clock, policy):
+        """버킷 용량만큼 소비 후 거부"""
+        store = InMemoryTokenBucketStore(clock=clock)
+
+        assert store.consume("k", policy).allowed
+        assert store.consume("k", policy).allowed
+
+        decision = store.consume("k", policy)
+        assert not decision.allowed
+        assert decision.retry_after == pytest.approx(2.0)
+
+    def test_refill_over_time(self, clock, policy):
+        """시간이 지나면 토큰 보충"""
+        store = InMemoryTokenBucketStore(clock=clock)
+        store.consume("k", policy)
+        store.consume("k", policy)
+
+        clock.now = 2.0
+
+        assert store.consume("k", policy).allowed
+        assert not store.consume("k", policy).allowed
+
+    def test_keys_are_independent(self, clock, policy):
+        """키별로 독립된 버킷 사용"""
+        store = InMemoryTokenBucketStore(clock=clock)
+        store.consume("a", policy)
+        store.consume("a", policy)
+
+        assert store.consume("b", policy).allowed
+
+    def test_evict_least_recently_used_bucket(self, clock, policy):
+        """최대 키 수를 넘으면 오래된 버킷 제거"""
+        store = InMemoryTokenBucketStore(max_keys=2, clock=clock)
+        for key in ("a", "b", "c"):
+            store.consume(key, policy)
+
+        assert len(store) == 2
+        store.consume("a", policy)
+        assert store.consume("a", policy).allowed  # 제거 후 새 버킷으로 시작
+
+    def test_invalid_policy(self):
+        """잘못된 정책 거부"""
+        with pytest.raises(ValueError):
+            TokenBucketPolicy(capacity=0, refill_per_second=1)
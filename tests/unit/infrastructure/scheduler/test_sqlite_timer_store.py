@@ -0,0 +1,122 @@
+import sqlite3
+import threading
+from dataclasses import dataclass
+
+import pytest
+from resque_api.application.message.bus.scheduler import MessageScheduler
+from resque_api.application.message.event.base.event import Event
+from resque_api.infrastructure.scheduler.sqlite_timer_store import SqliteTimerStore
+from resque_api.infrastructure.serialization.binary_codec import BinaryCodecRegistry
+
+
+@dataclass(frozen=True, kw_only=True)
+class ReminderDue(Event):
+    email: str
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def store(connection):
+    store = SqliteTimerStore(connection, BinaryCodecRegistry([ReminderDue]))
+    store.create_table()
+    return store
+
+
+class TestSqliteTimerStore:
+    def test_timers_survive_restart(self, store):
+        """재시작한 스케줄러가 남아 있던 예약을 복원해 발행한다"""
+        # Given
+        clock = FakeClock()
+        before_restart = MessageScheduler(store=store, clock=clock)
+        before_restart.schedule_after(ReminderDue(email="a@example.com"), 48 * 3600)
+        cancelled = before_restart.schedule_after(ReminderDue(email="b@example.com"), 10)
+        before_restart.cancel(cancelled)
+
+        # When
+        after_restart = MessageScheduler(store=store, clock=clock)
+        restored = after_restart.load()
+        published = []
+        after_restart.bind(lambda message: published.append(message.email))
+        clock.now += 48 * 3600
+        after_restart.run_due()
+
+        # Then
+        assert restored == 1
+        assert published == ["a@example.com"]
+        assert store.load_pending() == []
+
+    def test_failed_publish_stays_in_store(self, store):
+        """발행에 실패한 예약은 저장소에 남는다"""
+        clock = FakeClock()
+        scheduler = MessageScheduler(store=store, clock=clock, on_error=lambda timer, e: None)
+        scheduler.bind(lambda message: (_ for _ in ()).throw(RuntimeError("boom")))
+        scheduler.schedule_after(ReminderDue(email="a@example.com"), 1)
+
+        clock.now += 1
+        scheduler.run_due()
+
+        assert [timer.message.email for timer in store.load_pending()] == ["a@example.com"]
+
+    def test_background_thread_removes_published_timers(self, tmp_path):
+        """백그라운드 스레드에서 발행한 예약은 저장소에서 삭제된다"""
+        # Given
+        store = SqliteTimerStore.connect(str(tmp_path / "timers.db"), BinaryCodecRegistry([ReminderDue]))
+        store.create_table()
+        scheduler = MessageScheduler(store=store)
+        published = threading.Event()
+
+        # When
+        scheduler.start(lambda message: published.set())
+        try:
+            scheduler.schedule_after(ReminderDue(email="a@example.com"), 0)
+            assert published.wait(5)
+        finally:
+            scheduler.stop(timeout=5)
+
+        # Then
+        assert store.load_pending() == []
+        assert scheduler.stats().published == 1
+        store.connection.close()
+
+    def test_failed_remove_is_reported_and_not_republished(self, store):
+        """발행 후 저장소 삭제에 실패하면 on_error 로 보고하고 다시 발행하지 않는다"""
+        # Given
+        errors = []
+        published = []
+        scheduler = MessageScheduler(
+            store=store, clock=FakeClock(), on_error=lambda timer, e: errors.append(type(e))
+        )
+        scheduler.bind(lambda message: published.append(message.email))
+        scheduler.schedule_after(ReminderDue(email="a@example.com"), 0)
+        store.connection.close()
+
+        # When
+        scheduler.run_due()
+        scheduler.run_due()
+
+        # Then
+        assert published == ["a@example.com"]
+        assert errors == [sqlite3.ProgrammingError]
+        assert scheduler.stats().published == 1
+
+    def test_load_pending_orders_by_due_time(self, store):
+        """예약은 발행 시각 순서대로 조회된다"""
+        scheduler = MessageScheduler(store=store, clock=FakeClock())
+        scheduler.schedule_after(ReminderDue(email="late"), 20)
+        scheduler.schedule_after(ReminderDue(email="early"), 10)
+
+        assert [timer.message.email for timer in store.load_pending()] == ["early", "late"]
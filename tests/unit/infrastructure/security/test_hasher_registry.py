@@ -0,0 +1,56 @@
+import pytest
+
+from resque_api.infrastructure.security.exceptions import UnknownHashSchemeError
+from resque_api.infrastructure.security.hasher_registry import PasswordHasherRegistry
+from resque_api.infrastructure.security.password_hasher import (
+    BcryptPasswordHasher,
+    Pbkdf2PasswordHasher,
+    ScryptPasswordHasher,
+)
+
+
+class TestPasswordHasherRegistry:
+    """PasswordHasherRegistry 테스트"""
+
+    @pytest.fixture
+    def hashers(self):
+        return [
+            BcryptPasswordHasher(rounds=4),
+            ScryptPasswordHasher(log_n=4),
+            Pbkdf2PasswordHasher(iterations=1000),
+        ]
+
+    @pytest.fixture
+    def registry(self, hashers):
+        return PasswordHasherRegistry(hashers, default_scheme="scrypt")
+
+    def test_hash_with_default_scheme(self, registry):
+        """새 비밀번호는 기본 알고리즘으로 해시"""
+        hashed = registry.hash("password")
+
+        assert hashed.startswith("$scrypt$")
+        assert registry.verify("password", hashed)
+        assert registry.needs_rehash(hashed) is False
+
+    @pytest.mark.parametrize("scheme", ["bcrypt", "pbkdf2"])
+    def test_verify_legacy_scheme(self, registry, scheme):
+        """다른 알고리즘으로 저장된 해시도 검증하고 재해시 대상으로 판단"""
+        # Given
+        hashed = registry.hashers[scheme].hash("password")
+
+        # Then
+        assert registry.identify(hashed) is registry.hashers[scheme]
+        assert registry.verify("password", hashed) is True
+        assert registry.verify("wrong", hashed) is False
+        assert registry.needs_rehash(hashed) is True
+
+    def test_unknown_hash(self, registry):
+        """알 수 없는 형식의 해시는 검증 실패"""
+        assert registry.identify("unknown") is None
+        assert registry.verify("password", "unknown") is False
+        assert registry.needs_rehash("unknown") is True
+
+    def test_unknown_default_scheme(self, hashers):
+        """등록되지 않은 기본 알고리즘 거부"""
+        with pytest.raises(UnknownHashSchemeError):
+            PasswordHasherRegistry(hashers, default_scheme="argon2")
@@ -2,7 +2,11 @@ import secrets
 
 import pytest
 
-from resque_api.infrastructure.security.password_hasher import BcryptPasswordHasher
+from resque_api.infrastructure.security.password_hasher import (
+    BcryptPasswordHasher,
+    Pbkdf2PasswordHasher,
+    ScryptPasswordHasher,
+)
 
 
 class TestBcryptPasswordHasher:
@@ -96,3 +100,116 @@ class TestBcryptPasswordHasher:
         # 라운드 수 검증
         assert hash1.startswith("$2b$04$")
         assert hash2.startswith("$2b$05$")
+
+    def test_hash_many_and_verify_many(self, hasher, secure_password):
+        """포트 기본 구현의 순차 일괄 처리"""
+        # When
+        hashed = list(hasher.hash_many([secure_password, ""]))
+        verified = list(hasher.verify_many([(secure_password, hashed[0].value)]))
+
+        # Then
+        assert [r.index for r in hashed] == [0, 1]
+        assert hashed[0].ok and isinstance(hashed[1].error, ValueError)
+        assert verified[0].value is True
+
+    def test_needs_rehash(self, hasher, secure_password):
+        """라운드 수가 다르거나 bcrypt 형식이 아니면 재해시 필요"""
+        # Given
+        current = hasher.hash(secure_password)
+        outdated = BcryptPasswordHasher(rounds=5).hash(secure_password)
+
+        # Then
+        assert hasher.needs_rehash(current) is False
+        assert hasher.needs_rehash(outdated) is True
+        assert hasher.needs_rehash("invalid_format") is True
+
+    def test_calibrate_respects_bounds(self):
+        """보정 결과가 라운드 범위 안에 있음"""
+        # When
+        fastest = BcryptPasswordHasher.calibrate(target_seconds=1e-9, min_rounds=4, max_rounds=6)
+        slowest = BcryptPasswordHasher.calibrate(target_seconds=60, min_rounds=4, max_rounds=6)
+
+        # Then
+        assert fastest.rounds == 4
+        assert slowest.rounds == 6
+
+    def test_calibrate_picks_rounds_under_target(self, mocker):
+        """측정 시간이 두 배씩 늘어난다고 보고 목표 이하의 최대 라운드 선택"""
+        # Given
+        mocker.patch.object(BcryptPasswordHasher, "_measure_verify_seconds", return_value=0.01)
+
+        # When
+        hasher = BcryptPasswordHasher.calibrate(target_seconds=0.05, min_rounds=10, max_rounds=16)
+
+        # Then
+        assert hasher.rounds == 12  # 0.01 -> 0.02 -> 0.04 (<= 0.05)
+
+    def test_calibrate_rejects_invalid_range(self):
+        """잘못된 라운드 범위 거부"""
+        with pytest.raises(ValueError):
+            BcryptPasswordHasher.calibrate(min_rounds=12, max_rounds=10)
+
+
+@pytest.mark.parametrize(
+    "hasher, prefix",
+    [
+        (ScryptPasswordHasher(log_n=4, r=8, p=1), "$scrypt$ln=4,r=8,p=1$"),
+        (Pbkdf2PasswordHasher(iterations=1000), "$pbkdf2-sha256$1000$"),
+    ],
+    ids=["scrypt", "pbkdf2"],
+)
+class TestHashlibPasswordHashers:
+    """hashlib 기반 해셔 공통 테스트"""
+
+    def test_hash_and_verify(self, hasher, prefix):
+        """해시 생성 및 검증"""
+        # When
+        hashed = hasher.hash("correct horse")
+
+        # Then
+        assert hashed.startswith(prefix)
+        assert hasher.identify(hashed)
+        assert hasher.verify("correct horse", hashed) is True
+        assert hasher.verify("wrong horse", hashed) is False
+
+    def test_hash_with_empty_password(self, hasher, prefix):
+        """빈 비밀번호 해시화 시도"""
+        with pytest.raises(ValueError, match="Password cannot be empty"):
+            hasher.hash("")
+
+    @pytest.mark.parametrize("invalid_hash", ["", "invalid_format", "$2b$04$" + "a" * 53])
+    def test_verify_with_invalid_hash(self, hasher, prefix, invalid_hash):
+        """잘못된 해시 형식 검증"""
+        assert not hasher.verify("correct horse", invalid_hash)
+        assert not hasher.identify(invalid_hash)
+
+    def test_needs_rehash(self, hasher, prefix):
+        """현재 설정으로 만든 해시는 재해시 불필요"""
+        hashed = hasher.hash("correct horse")
+
+        assert hasher.needs_rehash(hashed) is False
+        assert hasher.needs_rehash("invalid_format") is True
+
+
+class TestScryptPasswordHasher:
+    @pytest.mark.parametrize(
+        "cost",
+        ["ln=99,r=8,p=1", "ln=4,r=4096,p=1", "ln=4,r=8,p=999999999999", "ln=0,r=8,p=1"],
+        ids=["huge-ln", "huge-r", "huge-p", "zero-ln"],
+    )
+    def test_verify_rejects_out_of_range_cost(self, cost):
+        """범위를 벗어난 비용 설정의 저장 해시는 scrypt 를 실행하지 않고 False"""
+        # Given
+        hasher = ScryptPasswordHasher(log_n=4)
+        salt_and_hash = hasher.hash("correct horse").split("$", 3)[3]
+
+        # When
+        verified = hasher.verify("correct horse", f"$scrypt${cost}${salt_and_hash}")
+
+        # Then
+        assert verified is False
+
+    def test_out_of_range_cost_is_rejected_at_construction(self):
+        """허용 범위를 벗어난 비용 설정으로는 해셔를 만들 수 없다"""
+        with pytest.raises(ValueError):
+            ScryptPasswordHasher(log_n=32)
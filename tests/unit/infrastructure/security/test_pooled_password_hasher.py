@@ -0,0 +1,143 @@
+import asyncio
+import secrets
+import threading
+
+import pytest
+
+from resque_api.infrastructure.security.exceptions import HasherQueueFullError
+from resque_api.infrastructure.security.password_hasher import BcryptPasswordHasher
+from resque_api.infrastructure.security.pooled_password_hasher import PooledPasswordHasher
+
+
+class BlockingPasswordHasher:
+    """release 될 때까지 검증을 멈추는 테스트용 해시 처리기"""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def hash(self, plain_password: str) -> str:
+        self.release.wait(timeout=5)
+        return plain_password[::-1]
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        self.release.wait(timeout=5)
+        return plain_password[::-1] == hashed_password
+
+
+class TestPooledPasswordHasher:
+    """PooledPasswordHasher 테스트"""
+
+    @pytest.fixture
+    def hasher(self):
+        """테스트용 풀 해셔 인스턴스"""
+        with PooledPasswordHasher(BcryptPasswordHasher(rounds=4), max_workers=2) as hasher:
+            yield hasher
+
+    @pytest.fixture
+    def secure_password(self):
+        """안전한 테스트용 비밀번호 생성"""
+        return secrets.token_urlsafe(16)
+
+    def test_hash_and_verify(self, hasher, secure_password):
+        """풀을 거친 해시 생성 및 검증"""
+        # When
+        hashed = hasher.hash(secure_password)
+
+        # Then
+        assert hashed.startswith("$2b$04$")
+        assert hasher.verify(secure_password, hashed) is True
+        assert hasher.verify("wrong-password", hashed) is False
+
+    def test_submit_verify_returns_future(self, hasher, secure_password):
+        """submit_verify 는 Future 를 반환"""
+        # Given
+        hashed = hasher.hash(secure_password)
+
+        # When
+        future = hasher.submit_verify(secure_password, hashed)
+
+        # Then
+        assert future.result(timeout=5) is True
+
+    def test_verify_async(self, hasher, secure_password):
+        """이벤트 루프에서 여러 검증을 동시에 대기"""
+        # Given
+        hashed = hasher.hash(secure_password)
+
+        async def verify_all():
+            return await asyncio.gather(
+                hasher.verify_async(secure_password, hashed),
+                hasher.verify_async("wrong-password", hashed),
+            )
+
+        # When
+        results = asyncio.run(verify_all())
+
+        # Then
+        assert results == [True, False]
+
+    def test_reject_when_queue_is_full(self):
+        """대기 작업 한도 초과 시 즉시 거부"""
+        # Given
+        blocking = BlockingPasswordHasher()
+        hasher = PooledPasswordHasher(blocking, max_workers=1, max_pending=2)
+        futures = [hasher.submit_verify("abc", "cba") for _ in range(2)]
+
+        # When / Then
+        with pytest.raises(HasherQueueFullError):
+            hasher.submit_verify("abc", "cba")
+        assert hasher.pending == 2
+
+        blocking.release.set()
+        assert all(f.result(timeout=5) for f in futures)
+        hasher.shutdown()
+        assert hasher.pending == 0
+
+    @pytest.mark.parametrize("kwargs", [{"max_workers": 0}, {"max_pending": 0}])
+    def test_invalid_pool_size(self, kwargs):
+        """잘못된 풀 설정 거부"""
+        with pytest.raises(ValueError):
+            PooledPasswordHasher(BcryptPasswordHasher(rounds=4), **kwargs)
+
+
+class TestPooledPasswordHasherBatch:
+    """PooledPasswordHasher 일괄 처리 테스트"""
+
+    @pytest.fixture
+    def hasher(self):
+        with PooledPasswordHasher(BcryptPasswordHasher(rounds=4), max_workers=2, max_pending=3) as hasher:
+            yield hasher
+
+    def test_hash_many_isolates_errors(self, hasher):
+        """일부 항목 실패가 나머지 항목에 영향을 주지 않음"""
+        # Given
+        passwords = ["password-0", "", "password-2", "password-3"]
+
+        # When
+        results = {r.index: r for r in hasher.hash_many(passwords)}
+
+        # Then
+        assert sorted(results) == [0, 1, 2, 3]
+        assert not results[1].ok
+        assert isinstance(results[1].error, ValueError)
+        for index in (0, 2, 3):
+            assert results[index].ok
+            assert hasher.verify(passwords[index], results[index].value)
+
+    def test_verify_many_reports_progress(self, hasher):
+        """진행 상황 콜백이 항목마다 호출됨"""
+        # Given
+        hashed = hasher.hash("password")
+        credentials = [("password", hashed), ("wrong", hashed)] * 3
+        progress = []
+
+        # When
+        results = list(
+            hasher.verify_many(credentials, on_progress=lambda done, total: progress.append((done, total)))
+        )
+
+        # Then
+        assert sorted((r.index, r.value) for r in results) == [
+            (i, i % 2 == 0) for i in range(6)
+        ]
+        assert progress == [(i, 6) for i in range(1, 7)]
@@ -0,0 +1,211 @@
+import pickle
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from uuid import UUID, uuid4
+
+import pytest
+from resque_api.application.message.event.base.event import Event
+from resque_api.domain.common.value_objects import Email
+from resque_api.infrastructure.serialization.binary_codec import BinaryCodecRegistry, MessageCodec, since
+from resque_api.infrastructure.serialization.exceptions import (
+    SchemaVersionError,
+    UnknownMessageTypeError,
+    UnsupportedFieldTypeError,
+)
+
+
+class Priority(Enum):
+    LOW = "low"
+    HIGH = "high"
+
+
+@dataclass(frozen=True)
+class Tag:
+    name: str
+    weight: float
+
+
+@dataclass(frozen=True, kw_only=True)
+class RichEvent(Event):
+    owner_id: UUID
+    email: Email
+    priority: Priority
+    count: int
+    ratio: float
+    active: bool
+    note: str | None
+    tags: tuple[Tag, ...] = ()
+    scores: dict[str, int] = field(default_factory=dict)
+    raw: bytes = b""
+
+
+@dataclass(frozen=True, kw_only=True)
+class VersionedEventV1(Event):
+    title: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class VersionedEventV2(Event):
+    title: str
+    priority: Priority = field(default=Priority.LOW, metadata=since(2))
+    labels: tuple[str, ...] = field(default=(), metadata=since(2))
+
+
+def make_rich_event(**overrides):
+    data = dict(
+        occured_at=datetime.now(timezone.utc),
+        aggregate_id=uuid4(),
+        owner_id=uuid4(),
+        email=Email("codec@example.com"),
+        priority=Priority.HIGH,
+        count=-123456789,
+        ratio=0.25,
+        active=True,
+        note="노트",
+        tags=(Tag("a", 1.5), Tag("b", -2.0)),
+        scores={"x": 1, "y": -2},
+        raw=b"\x00\x01",
+    )
+    return RichEvent(**{**data, **overrides})
+
+
+class TestMessageCodec:
+    def test_round_trip(self):
+        """모든 지원 타입이 원래 값과 타입으로 복원된다"""
+        # Given
+        codec = MessageCodec(RichEvent)
+        event = make_rich_event()
+
+        # When
+        restored = codec.decode(codec.encode(event))
+
+        # Then
+        assert restored == event
+        assert isinstance(restored.email, Email)
+        assert restored.occured_at.tzinfo is not None
+
+    def test_optional_none_and_naive_datetime(self):
+        """None 과 시간대 없는 datetime 도 그대로 복원된다"""
+        codec = MessageCodec(RichEvent)
+        event = make_rich_event(note=None, aggregate_id=None, occured_at=datetime(2024, 5, 1, 12, 30, 1, 999))
+
+        assert codec.decode(codec.encode(event)) == event
+
+    def test_payload_is_smaller_than_pickle(self):
+        """필드 이름을 기록하지 않으므로 pickle 보다 작다"""
+        codec = MessageCodec(RichEvent)
+        event = make_rich_event()
+
+        assert len(codec.encode(event)) < len(pickle.dumps(event)) / 2
+
+    def test_decode_older_version_fills_defaults(self):
+        """이전 버전 페이로드는 새 필드를 기본값으로 채워 디코딩한다"""
+        # Given
+        old = VersionedEventV1(occured_at=datetime.now(timezone.utc), title="old")
+        payload = MessageCodec(VersionedEventV1).encode(old)
+
+        # When
+        restored = MessageCodec(VersionedEventV2).decode(payload)
+
+        # Then
+        assert restored.title == "old"
+        assert restored.id == old.id
+        assert (restored.priority, restored.labels) == (Priority.LOW, ())
+
+    def test_decode_newer_version_fails(self):
+        """디코더보다 새 버전의 페이로드는 SchemaVersionError"""
+        new = VersionedEventV2(occured_at=datetime.now(timezone.utc), title="new")
+        payload = MessageCodec(VersionedEventV2).encode(new)
+
+        with pytest.raises(SchemaVersionError):
+            MessageCodec(VersionedEventV1).decode(payload)
+
+    def test_versioned_field_requires_default(self):
+        """since 로 추가한 필드는 기본값이 있어야 한다"""
+
+        @dataclass(frozen=True, kw_only=True)
+        class MissingDefaultEvent(Event):
+            title: str = field(metadata=since(2))
+
+        with pytest.raises(ValueError):
+            MessageCodec(MissingDefaultEvent)
+
+    def test_enum_survives_member_reordering(self):
+        """Enum 은 멤버 값으로 기록되므로 멤버를 추가하거나 재배치해도 같은 멤버로 복원된다"""
+
+        # Given
+        class StatusV1(Enum):
+            ACTIVE = 1
+            INACTIVE = 2
+
+        class StatusV2(Enum):
+            PENDING = 0
+            INACTIVE = 2
+            ACTIVE = 1
+
+        @dataclass(frozen=True, kw_only=True)
+        class StatusEventV1(Event):
+            status: StatusV1
+
+        @dataclass(frozen=True, kw_only=True)
+        class StatusEventV2(Event):
+            status: StatusV2
+
+        old = StatusEventV1(occured_at=datetime.now(timezone.utc), status=StatusV1.INACTIVE)
+
+        # When
+        restored = MessageCodec(StatusEventV2).decode(MessageCodec(StatusEventV1).encode(old))
+
+        # Then
+        assert restored.status is StatusV2.INACTIVE
+
+    def test_enum_with_mixed_value_types_is_unsupported(self):
+        """멤버 값이 정수나 문자열로 통일되지 않은 Enum 은 코덱 생성 시점에 실패한다"""
+
+        class Mixed(Enum):
+            ONE = 1
+            TWO = "two"
+
+        @dataclass(frozen=True, kw_only=True)
+        class MixedEvent(Event):
+            value: Mixed
+
+        with pytest.raises(UnsupportedFieldTypeError):
+            MessageCodec(MixedEvent)
+
+    def test_unsupported_field_type(self):
+        """지원하지 않는 필드 타입은 코덱 생성 시점에 실패한다"""
+
+        @dataclass(frozen=True, kw_only=True)
+        class UnsupportedEvent(Event):
+            payload: object
+
+        with pytest.raises(UnsupportedFieldTypeError):
+            MessageCodec(UnsupportedEvent)
+
+
+class TestBinaryCodecRegistry:
+    def test_dumps_and_loads(self):
+        """dumps 결과에는 타입 이름이 포함되어 loads 로 복원된다"""
+        registry = BinaryCodecRegistry([RichEvent, VersionedEventV2])
+        event = make_rich_event()
+
+        assert registry.loads(registry.dumps(event)) == event
+
+    def test_serializer_port(self):
+        """EventSerializer 포트로 사용할 수 있다"""
+        registry = BinaryCodecRegistry([RichEvent])
+        event = make_rich_event()
+
+        event_type, payload = registry.serialize(event)
+
+        assert event_type == "RichEvent"
+        assert registry.deserialize(event_type, payload) == event
+
+    def test_unknown_type(self):
+        """등록되지 않은 타입은 UnknownMessageTypeError"""
+        registry = BinaryCodecRegistry()
+
+        with pytest.raises(UnknownMessageTypeError):
+            registry.serialize(make_rich_event())
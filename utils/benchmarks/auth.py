@@ -0,0 +1,116 @@
+"""인증 및 비밀번호 해시 벤치마크
+
+hash/verify, authenticate_user 의 성공 경로와 거부 경로(비활성 사용자, EMAIL 이외의
+인증 제공자, 빈 비밀번호), 그리고 스레드 수별 동시 검증의 지연 시간 백분위수와
+처리량을 JSON 으로 출력한다. 실행 결과를 파일로 저장해 두면 라운드 수나 코드 변경 전후를
+비교할 수 있다.
+"""
+
+import argparse
+import platform
+import threading
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from resque_api.application.auth.authenticate import authenticate_user
+from resque_api.domain.common.value_objects import Email
+from resque_api.domain.user.entities import User
+from resque_api.domain.user.exceptions import InactiveUserError
+from resque_api.domain.user.value_objects import AuthProvider, Password, UserStatus
+from resque_api.infrastructure.security.password_hasher import BcryptPasswordHasher
+from utils.benchmarks.common import emit, summarize, time_calls
+
+PASSWORD = "benchmark-password-123"
+
+
+def make_user(hashed: str, **overrides) -> User:
+    data = {
+        "id": uuid4(),
+        "email": Email("bench@example.com"),
+        "status": UserStatus.ACTIVE,
+        "auth_provider": AuthProvider.EMAIL,
+        "created_at": datetime.now(timezone.utc),
+        "password": Password(hashed),
+    }
+    return User(**{**data, **overrides})
+
+
+def authenticate_inactive(user: User, hasher) -> None:
+    try:
+        authenticate_user(user, PASSWORD, hasher)
+    except InactiveUserError:
+        pass
+
+
+def concurrent_verify(hasher, hashed: str, threads: int, per_thread: int) -> dict:
+    """threads 개의 스레드가 동시에 검증할 때의 지연 시간과 전체 처리량"""
+    samples: list[float] = []
+    lock = threading.Lock()
+    start = threading.Barrier(threads + 1)
+
+    def worker():
+        local = []
+        start.wait()
+        for _ in range(per_thread):
+            started = time.perf_counter()
+            hasher.verify(PASSWORD, hashed)
+            local.append(time.perf_counter() - started)
+        with lock:
+            samples.extend(local)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for w in workers:
+        w.start()
+    start.wait()
+    began = time.perf_counter()
+    for w in workers:
+        w.join()
+    return summarize(samples, elapsed=time.perf_counter() - began)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="인증 및 비밀번호 해시 벤치마크")
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt 라운드 수")
+    parser.add_argument("--iterations", type=int, default=20, help="시나리오별 반복 횟수")
+    parser.add_argument("--fast-iterations", type=int, default=10_000, help="해시 검증이 없는 거부 경로 반복 횟수")
+    parser.add_argument("--max-threads", type=int, default=4, help="동시 검증 최대 스레드 수")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본값: 표준 출력)")
+    args = parser.parse_args()
+
+    hasher = BcryptPasswordHasher(rounds=args.rounds)
+    hashed = hasher.hash(PASSWORD)
+    active = make_user(hashed)
+    inactive = make_user(hashed, status=UserStatus.INACTIVE)
+    google = make_user(hashed, auth_provider=AuthProvider.GOOGLE)
+
+    scenarios = {
+        "hash": (lambda: hasher.hash(PASSWORD), args.iterations),
+        "verify_success": (lambda: hasher.verify(PASSWORD, hashed), args.iterations),
+        "verify_failure": (lambda: hasher.verify("wrong-password", hashed), args.iterations),
+        "authenticate_success": (lambda: authenticate_user(active, PASSWORD, hasher), args.iterations),
+        "reject_inactive_user": (lambda: authenticate_inactive(inactive, hasher), args.fast_iterations),
+        "reject_non_email_provider": (lambda: authenticate_user(google, PASSWORD, hasher), args.fast_iterations),
+        "reject_empty_password": (lambda: authenticate_user(active, "", hasher), args.fast_iterations),
+    }
+
+    results = {name: summarize(time_calls(fn, iterations)) for name, (fn, iterations) in scenarios.items()}
+    results["concurrent_verify"] = {
+        str(threads): concurrent_verify(hasher, hashed, threads, args.iterations)
+        for threads in range(1, args.max_threads + 1)
+    }
+
+    emit(
+        {
+            "benchmark": "authentication",
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "rounds": args.rounds,
+            "results": results,
+        },
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
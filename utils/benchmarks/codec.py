@@ -0,0 +1,115 @@
+"""메시지 직렬화 벤치마크
+
+같은 이벤트를 바이너리 코덱, dataclasses.asdict + JSON, pickle 로 인코딩/디코딩할 때의
+초당 처리량과 페이로드 크기를 JSON 으로 출력한다. JSON 경로는 UUID/datetime/Enum 을
+문자열로 바꾸며, 디코딩 결과는 원래 타입이 아닌 딕셔너리다.
+"""
+
+import argparse
+import dataclasses
+import json
+import pickle
+import platform
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Callable
+from uuid import UUID, uuid4
+
+from resque_api.application.message.event.base.event import Event
+from resque_api.infrastructure.serialization.binary_codec import MessageCodec
+from utils.benchmarks.common import emit
+
+
+class BenchPriority(Enum):
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+
+
+@dataclass(frozen=True, kw_only=True)
+class BenchRequirementUpdated(Event):
+    project_id: UUID
+    editor_id: UUID
+    title: str
+    priority: BenchPriority
+    tags: tuple[str, ...] = ()
+    due_at: datetime | None = None
+    estimate: int = 0
+    watchers: tuple[UUID, ...] = field(default_factory=tuple)
+
+
+def make_event() -> BenchRequirementUpdated:
+    return BenchRequirementUpdated(
+        occured_at=datetime.now(timezone.utc),
+        aggregate_id=uuid4(),
+        project_id=uuid4(),
+        editor_id=uuid4(),
+        title="로그인 실패 시 잠금 정책 추가",
+        priority=BenchPriority.HIGH,
+        tags=("auth", "security"),
+        due_at=datetime.now(timezone.utc),
+        estimate=5,
+        watchers=(uuid4(), uuid4()),
+    )
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (UUID, datetime)):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(value)
+
+
+def throughput(fn: Callable[[], Any], iterations: int) -> float:
+    """fn 을 iterations 번 실행했을 때의 초당 처리량"""
+    fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="메시지 직렬화 벤치마크")
+    parser.add_argument("--iterations", type=int, default=50_000, help="방식별 반복 횟수")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본값: 표준 출력)")
+    args = parser.parse_args()
+
+    event = make_event()
+    codec = MessageCodec(BenchRequirementUpdated)
+
+    formats = {
+        "binary_codec": (lambda: codec.encode(event), codec.decode),
+        "json_asdict": (
+            lambda: json.dumps(dataclasses.asdict(event), default=_json_default).encode(),
+            json.loads,
+        ),
+        "pickle": (lambda: pickle.dumps(event, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+    }
+
+    results = {}
+    for name, (encode, decode) in formats.items():
+        payload = encode()
+        results[name] = {
+            "payload_bytes": len(payload),
+            "encode_per_s": throughput(encode, args.iterations),
+            "decode_per_s": throughput(lambda: decode(payload), args.iterations),
+        }
+
+    emit(
+        {
+            "benchmark": "message_codec",
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "iterations": args.iterations,
+            "results": results,
+        },
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import json
+import math
+import time
+from typing import Any, Callable, Sequence
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """정렬된 표본에서 선형 보간 백분위수 계산"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100
+    lower, upper = math.floor(rank), math.ceil(rank)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def time_calls(fn: Callable[[], Any], iterations: int, warmup: int = 1) -> list[float]:
+    """fn 을 반복 실행하며 호출별 소요 시간(초) 측정"""
+    for _ in range(warmup):
+        fn()
+
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def summarize(samples: Sequence[float], elapsed: float | None = None) -> dict[str, float]:
+    """지연 시간 표본 요약 (밀리초 단위 백분위수, 초당 처리량)"""
+    total = elapsed if elapsed is not None else sum(samples)
+    return {
+        "count": len(samples),
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "max_ms": max(samples, default=0.0) * 1000,
+        "throughput_per_s": len(samples) / total if total else 0.0,
+    }
+
+
+def emit(report: dict[str, Any], output: str | None) -> None:
+    """결과를 JSON 으로 출력 (output 이 있으면 파일에 저장)"""
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
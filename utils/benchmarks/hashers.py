@@ -0,0 +1,93 @@
+"""비밀번호 해시 알고리즘 비교 벤치마크
+
+알고리즘별로 검증 1회의 CPU 시간과 메모리 사용량을 측정하고, 보안 기준
+(검증 1회의 최소 CPU 시간)을 만족하는 알고리즘 중 가장 저렴한 것을 추천한다.
+메모리는 각 알고리즘을 별도 프로세스에서 실행해 최대 RSS 증가량으로 측정한다.
+"""
+
+import argparse
+import platform
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from resque_api.infrastructure.security.password_hasher import (
+    BcryptPasswordHasher,
+    Pbkdf2PasswordHasher,
+    ScryptPasswordHasher,
+)
+from utils.benchmarks.common import emit, summarize
+
+PASSWORD = "benchmark-password-123"
+
+
+def build_hashers(args: argparse.Namespace) -> dict:
+    return {
+        "bcrypt": BcryptPasswordHasher(rounds=args.bcrypt_rounds),
+        "scrypt": ScryptPasswordHasher(log_n=args.scrypt_log_n, r=args.scrypt_r, p=args.scrypt_p),
+        "pbkdf2": Pbkdf2PasswordHasher(iterations=args.pbkdf2_iterations),
+    }
+
+
+def _measure(hasher, iterations: int) -> dict:
+    """자식 프로세스에서 검증 비용 측정"""
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    hashed = hasher.hash(PASSWORD)
+
+    wall, cpu = [], []
+    for _ in range(iterations):
+        wall_started, cpu_started = time.perf_counter(), time.process_time()
+        hasher.verify(PASSWORD, hashed)
+        cpu.append(time.process_time() - cpu_started)
+        wall.append(time.perf_counter() - wall_started)
+
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "scheme": hasher.scheme,
+        "verify_wall": summarize(wall),
+        "verify_cpu_ms_mean": sum(cpu) / len(cpu) * 1000,
+        "peak_rss_delta_kib": max(rss_after - rss_before, 0),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="비밀번호 해시 알고리즘 벤치마크")
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--min-cpu-ms", type=float, default=50.0, help="보안 기준: 검증 1회 최소 CPU 시간")
+    parser.add_argument("--bcrypt-rounds", type=int, default=12)
+    parser.add_argument("--scrypt-log-n", type=int, default=14)
+    parser.add_argument("--scrypt-r", type=int, default=8)
+    parser.add_argument("--scrypt-p", type=int, default=1)
+    parser.add_argument("--pbkdf2-iterations", type=int, default=600_000)
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본값: 표준 출력)")
+    args = parser.parse_args()
+
+    results = {}
+    for name, hasher in build_hashers(args).items():
+        # 알고리즘마다 새 프로세스를 사용해 최대 RSS 가 서로 섞이지 않도록 한다.
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            results[name] = executor.submit(_measure, hasher, args.iterations).result()
+
+    eligible = [n for n, r in results.items() if r["verify_cpu_ms_mean"] >= args.min_cpu_ms]
+    recommended = min(
+        eligible,
+        key=lambda n: (results[n]["verify_cpu_ms_mean"], results[n]["peak_rss_delta_kib"]),
+        default=None,
+    )
+
+    emit(
+        {
+            "benchmark": "password_hashers",
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "iterations": args.iterations,
+            "min_cpu_ms": args.min_cpu_ms,
+            "results": results,
+            "recommended": recommended,
+        },
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()